@@ -0,0 +1,160 @@
+"""
+Benchmark of the installed JSON backends on the game's real data.
+
+Every JSON file under game/data is parsed and written again with each
+backend in game.json_backend, along with the save data of a freshly set up
+game, which is what saves, autosaves and replay snapshots serialize.
+Results are written as JSON, one entry per backend and file; when more than
+one backend is installed each entry also gets its speedup over the
+standard library. Install orjson to compare it with the stdlib backend.
+
+Run from the repository root:
+
+    python benchmarks/json_backends.py                      # print JSON results
+    python benchmarks/json_backends.py --output json.json   # write them to a file
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import json_backend
+from game.game_state import GameState
+from game.systems.save_manager import SaveManager
+from game.systems.setup_manager import SetupConfig, SetupManager
+from game.ui.null_ui import NullUI
+
+DATA_DIR = "game/data"
+
+# Name under which the save data of a new game is reported
+SAVE_GAME = "<save game>"
+
+
+def data_files():
+    """
+    Get the raw contents of the data files.
+
+    Files that are not valid JSON, such as empty placeholders, are skipped.
+
+    Returns:
+        Dict of name -> UTF-8 JSON bytes
+    """
+    files = {}
+    for path in sorted(glob.glob(f"{DATA_DIR}/**/*.json", recursive=True)):
+        with open(path, "rb") as file:
+            raw = file.read()
+        try:
+            json.loads(raw)
+        except ValueError:
+            print(f"Skipping {path}: not valid JSON", file=sys.stderr)
+            continue
+        files[os.path.relpath(path, DATA_DIR)] = raw
+    return files
+
+
+def save_game(players):
+    """Get the save data of a newly set up game, as compact JSON bytes."""
+    state = GameState()
+    config = SetupConfig(
+        num_players=players,
+        ancient_one_id=1,
+        investigator_ids=list(range(1, players + 1)),
+        player_names=[f"Player {i}" for i in range(1, players + 1)],
+    )
+    SetupManager(state, NullUI()).initialize_game(config)
+    return json.dumps(SaveManager(state).to_dict(), separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def time_call(operation, argument, number, samples):
+    """
+    Time calling operation on argument, keeping the fastest sample.
+
+    Returns:
+        Microseconds per call
+    """
+    best = float("inf")
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation(argument)
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def run(files, number, samples):
+    results = []
+    for name in json_backend.available_backends():
+        backend = json_backend.BACKENDS[name]
+        for file_name, raw in files.items():
+            data = backend.loads(raw)
+            results.append(
+                {
+                    "backend": name,
+                    "file": file_name,
+                    "bytes": len(raw),
+                    "loads_us": round(time_call(backend.loads, raw, number, samples), 2),
+                    "dumps_us": round(time_call(backend.dumps, data, number, samples), 2),
+                }
+            )
+
+    baseline = {
+        result["file"]: result for result in results if result["backend"] == "json"
+    }
+    if len(json_backend.BACKENDS) > 1:
+        for result in results:
+            stdlib = baseline[result["file"]]
+            for field in ("loads", "dumps"):
+                result[f"{field}_speedup"] = round(
+                    stdlib[f"{field}_us"] / result[f"{field}_us"], 2
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200, help="calls per sample")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument(
+        "--players", type=int, default=2, help="players in the benchmarked save game"
+    )
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args()
+
+    # Content loading warnings would mix with the results
+    logging.disable(logging.WARNING)
+    files = data_files()
+    files[SAVE_GAME] = save_game(args.players)
+
+    report = {
+        "python": platform.python_version(),
+        "backends": json_backend.available_backends(),
+        "number": args.number,
+        "samples": args.samples,
+        "results": run(files, args.number, args.samples),
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        for result in report["results"]:
+            print(
+                f"{result['backend']} {result['file']}: "
+                f"loads {result['loads_us']:.1f} us, dumps {result['dumps_us']:.1f} us"
+            )
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Microbenchmarks for decks, the component factory and components.
+
+Deck operations are timed on decks of 10, 100 and 1000 cards, made by
+copying the loaded cards under new ids, so the scaling of each deck data
+structure shows up as the change in time per operation across sizes.
+create_component and each component's process() do not depend on deck
+size and are timed once. Results are written as JSON, one entry per
+benchmark and size.
+
+Run from the repository root:
+
+    python benchmarks/micro.py                          # print JSON results
+    python benchmarks/micro.py --output micro.json      # write them to a file
+    python benchmarks/micro.py --sizes 10 100 --filter ConditionDeck
+"""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.entities.base.deck import Deck
+from game.entities.cards.asset_deck import AssetDeck
+from game.entities.cards.condition_deck import ConditionDeck
+from game.entities.cards.encounter_deck import EncounterDeck
+from game.entities.components.component_factory import create_component
+from game.entities.location import LocationType
+from game.game_state import GameState
+from game.systems.content_catalog import ContentCatalog
+from game.ui.null_ui import NullUI
+
+DECK_SIZES = (10, 100, 1000)
+
+# Component data as it appears in the encounter files, one per component type
+COMPONENT_DATA = {
+    "asset_gain": {
+        "type": "asset_gain",
+        "asset_type": "item",
+        "count": 1,
+        "source": "reserve",
+    },
+    "change_health": {"type": "change_health", "amount": -1},
+    "condition_gain": {"type": "condition_gain", "condition": "random", "trait": "madness"},
+    "discard": {"type": "discard", "count": 1, "asset_type": "item", "optional": True},
+    "narrative": {"type": "narrative", "text": "The streets are quiet tonight."},
+    "skill_test": {
+        "type": "skill_test",
+        "skill": "observation",
+        "modifier": 0,
+        "success_components": [{"type": "change_health", "amount": 1}],
+        "failure_components": [
+            {"type": "narrative", "text": "You find nothing."},
+            {"type": "change_health", "amount": -1},
+        ],
+    },
+    "spawn_clue": {"type": "spawn_clue", "count": 1},
+}
+
+
+def answer_first(request):
+    """Policy taking the first reserve asset and accepting every yes/no."""
+    return True if request.method == "ask_yes_no" else "1"
+
+
+def make_pool(cards, size, seed):
+    """
+    Make size cards by copying cards under new ids, in a shuffled order.
+
+    Returns:
+        List of cards
+    """
+    pool = []
+    for index in range(size):
+        card = copy.copy(cards[index % len(cards)])
+        card.id = f"{card.id}#{index}"
+        pool.append(card)
+    random.Random(seed).shuffle(pool)
+    return pool
+
+
+def time_batch(make, operation, number, samples):
+    """
+    Time an operation on fresh arguments.
+
+    Every sample makes number arguments first, untimed, then times calling
+    operation on each of them. The fastest sample is kept.
+
+    Returns:
+        Nanoseconds per operation
+    """
+    best = float("inf")
+    for _ in range(samples):
+        arguments = [make() for _ in range(number)]
+        start = time.perf_counter()
+        for argument in arguments:
+            operation(argument)
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e9
+
+
+def time_each(reset, operation, number, samples):
+    """
+    Time an operation that changes shared state, resetting it between calls.
+
+    Each call is timed on its own so the reset stays out of the timing. The
+    timer itself adds a few tens of nanoseconds per call, which is small
+    next to the operations measured this way.
+
+    Returns:
+        Nanoseconds per operation
+    """
+    best = float("inf")
+    for _ in range(samples):
+        elapsed = 0.0
+        for _ in range(number):
+            reset()
+            start = time.perf_counter()
+            operation()
+            elapsed += time.perf_counter() - start
+        best = min(best, elapsed)
+    return best / number * 1e9
+
+
+def deck_benchmarks(catalog, size, seed):
+    """
+    Get the deck benchmarks for one deck size.
+
+    Lookups target the card searched last, so they show the worst case.
+
+    Returns:
+        List of (name, make, operation)
+    """
+    assets = make_pool(list(catalog.asset_factory.assets.values()), size, seed)
+    conditions = make_pool(list(catalog.condition_factory.conditions.values()), size, seed)
+    encounters = make_pool(
+        catalog.encounter_factory.get_all_encounters_by_type("general"), size, seed
+    )
+    rng = random.Random(seed)
+    card = assets[0]
+
+    def asset_deck_with_reserve():
+        deck = AssetDeck(list(assets), rng=rng)
+        deck.setup_reserve(4)
+        return deck
+
+    # Conditions are searched from the bottom up, assets from the top down
+    first_condition = conditions[0].id
+    last_asset = assets[-1].id
+    trait = conditions[0].traits[0]
+
+    return [
+        ("Deck.draw", lambda: Deck(list(assets), rng=rng), lambda deck: deck.draw()),
+        ("Deck.shuffle", lambda: Deck(list(assets), rng=rng), lambda deck: deck.shuffle()),
+        (
+            "Deck.discard",
+            lambda: Deck(list(assets), rng=rng),
+            lambda deck: deck.discard(card),
+        ),
+        (
+            "ConditionDeck.draw_by_trait",
+            lambda: ConditionDeck(list(conditions), rng=rng),
+            lambda deck: deck.draw_by_trait(trait),
+        ),
+        (
+            "ConditionDeck.draw_by_id",
+            lambda: ConditionDeck(list(conditions), rng=rng),
+            lambda deck: deck.draw_by_id(first_condition),
+        ),
+        (
+            "EncounterDeck.draw_by_location_type",
+            lambda: EncounterDeck(list(encounters), rng=rng),
+            lambda deck: deck.draw_by_location_type(LocationType.SEA),
+        ),
+        (
+            "AssetDeck.draw_specific",
+            lambda: AssetDeck(list(assets), rng=rng),
+            lambda deck: deck.draw_specific(last_asset),
+        ),
+        (
+            "AssetDeck.take_from_reserve",
+            asset_deck_with_reserve,
+            lambda deck: deck.take_from_reserve(0),
+        ),
+    ]
+
+
+def component_benchmarks(catalog, seed):
+    """
+    Get the component process() benchmarks.
+
+    Every call runs on a fresh investigator with full asset and condition
+    decks and no clues on the board.
+
+    Returns:
+        List of (name, reset, operation)
+    """
+    state = GameState(catalog)
+    state.rng.seed(seed)
+    state.reset_game()
+    ui = NullUI(answer_first)
+    assets = list(catalog.asset_factory.assets.values())
+    conditions = list(catalog.condition_factory.conditions.values())
+    target = {}
+
+    def reset():
+        state.asset_deck = AssetDeck(list(assets), rng=state.rng)
+        state.asset_deck.setup_reserve(4)
+        state.condition_deck = ConditionDeck(list(conditions), rng=state.rng)
+        for location in state.locations.values():
+            location.has_clue = False
+        target["investigator"] = catalog.investigator_factory.create_investigator(1)
+
+    benchmarks = []
+    for component_type, data in COMPONENT_DATA.items():
+        component = create_component(data)
+
+        def operation(component=component):
+            component.process(state, target["investigator"], ui)
+
+        benchmarks.append((f"{component_type}.process", reset, operation))
+    return benchmarks
+
+
+def run(catalog, sizes, number, samples, name_filter, seed):
+    results = []
+
+    def keep(name):
+        return name_filter is None or name_filter in name
+
+    for size in sizes:
+        for name, make, operation in deck_benchmarks(catalog, size, seed):
+            if keep(name):
+                ns = time_batch(make, operation, number, samples)
+                results.append({"name": name, "size": size, "ns_per_op": round(ns, 1)})
+
+    for component_type, data in COMPONENT_DATA.items():
+        name = f"create_component.{component_type}"
+        if keep(name):
+            ns = time_batch(lambda: data, create_component, number, samples)
+            results.append({"name": name, "size": None, "ns_per_op": round(ns, 1)})
+
+    for name, reset, operation in component_benchmarks(catalog, seed):
+        if keep(name):
+            ns = time_each(reset, operation, number, samples)
+            results.append({"name": name, "size": None, "ns_per_op": round(ns, 1)})
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DECK_SIZES))
+    parser.add_argument("--number", type=int, default=1000, help="calls per sample")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args()
+
+    # Content loading warnings would mix with the results
+    logging.disable(logging.WARNING)
+    catalog = ContentCatalog()
+
+    report = {
+        "python": platform.python_version(),
+        "number": args.number,
+        "samples": args.samples,
+        "results": run(
+            catalog, args.sizes, args.number, args.samples, args.filter, args.seed
+        ),
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        for result in report["results"]:
+            size = "" if result["size"] is None else f" [{result['size']}]"
+            print(f"{result['name']}{size}: {result['ns_per_op']:.0f} ns")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
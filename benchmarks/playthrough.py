@@ -0,0 +1,285 @@
+"""
+Benchmark complete games played from recorded input scripts.
+
+Each script holds a random seed and every answer given to the UI during
+one game, from the main menu to quitting. The benchmark replays it with a
+ScriptedUI, so the engine runs with no rendering and no input, and reports
+games per second, rounds per second and the share of time spent in each
+phase. Scripts cover 1, 4 and 8 player games.
+
+Run from the repository root:
+
+    python benchmarks/playthrough.py record          # re-record the scripts
+    python benchmarks/playthrough.py run --save      # save a new baseline
+    python benchmarks/playthrough.py compare         # check for regressions
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.engine import GameEngine
+from game.enums import GamePhase
+from game.systems.content_catalog import ContentCatalog
+from game.systems.phase_machine import SessionState
+from game.systems.profiler import Profiler
+from game.ui.null_ui import NullUI, ScriptExhausted, ScriptedUI
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_DIR = os.path.join(BENCHMARK_DIR, "scripts")
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, "baselines", "playthrough.json")
+PLAYER_COUNTS = (1, 4, 8)
+
+# Action menu answers used when recording
+RECORDED_ACTIONS = ["1", "1", "2", "3", "4", "5", "6"]
+
+
+def script_path(player_count):
+    return os.path.join(SCRIPT_DIR, f"playthrough_{player_count}p.json")
+
+
+def pick_destination(state, destinations, rng):
+    """
+    Pick a travel menu answer among the destinations on the board.
+
+    Some routes lead to locations missing from the board data, which the
+    bot never picks.
+
+    Returns:
+        The answer: a destination number, or "0" to cancel
+    """
+    present = [
+        str(number)
+        for number, name in enumerate(destinations, 1)
+        if name in state.locations
+    ]
+    return rng.choice(present) if present else "0"
+
+
+def bot_policy(player_count, rng):
+    """Policy that sets up one game, plays it with random choices and quits."""
+    menus = iter(["1", "3"])
+    # Only a few investigators exist, so larger games repeat them
+    picks = iter(range(player_count))
+
+    def policy(request):
+        method, args = request.method, request.args
+        if method == "show_main_menu":
+            return next(menus)
+        if method == "show_player_count_selection":
+            return player_count
+        if method == "show_player_name_entry":
+            return f"Player {args[0]}"
+        if method == "show_investigator_selection":
+            available = sorted(args[0])
+            return available[next(picks) % len(available)]
+        if method == "show_ancient_one_selection":
+            return min(args[0])
+        if method in ("show_investigator_details", "show_ancient_one_details"):
+            return True
+        if method == "show_action_phase":
+            return rng.choice(RECORDED_ACTIONS)
+        if method == "show_travel_menu":
+            state = args[0]
+            location = state.get_current_investigator().current_location
+            return pick_destination(state, state.locations[location].connections, rng)
+        if method == "show_ticket_travel_menu":
+            state, _, destinations = args
+            return pick_destination(state, destinations, rng)
+        if method == "show_choose_encounter":
+            return rng.choice(args[0])[0]
+        if method == "show_ticket_choice":
+            return rng.choice(["train", "ship"])
+        if method == "ask_yes_no":
+            return rng.random() < 0.5
+        return None
+
+    return policy
+
+
+def record(catalog, player_count, seed):
+    """
+    Play a game with a random bot and record its answers.
+
+    Returns:
+        The script: {"players", "seed", "answers"}
+    """
+    answers = []
+    policy = bot_policy(player_count, random.Random(seed))
+
+    def recording_policy(request):
+        answer = policy(request)
+        answers.append(answer)
+        return answer
+
+    engine = GameEngine(NullUI(recording_policy), catalog=catalog)
+    engine.state.rng.seed(seed)
+    engine.run()
+    return {"players": player_count, "seed": seed, "answers": answers}
+
+
+def play(catalog, script, profiler=None):
+    """
+    Play one game from a script.
+
+    Returns:
+        The engine after the game
+    """
+    ui = ScriptedUI(script["answers"])
+    engine = GameEngine(ui, profiler=profiler, catalog=catalog)
+    engine.state.rng.seed(script["seed"])
+    try:
+        engine.run()
+    except ScriptExhausted:
+        raise SystemExit(
+            f"The {script['players']} player script no longer matches the engine, "
+            "re-record it with: python benchmarks/playthrough.py record"
+        )
+    if engine.session != SessionState.QUIT or next(ui.answers, None) is not None:
+        raise SystemExit(f"The {script['players']} player script did not finish")
+    return engine
+
+
+def measure(catalog, script, repeat, samples):
+    """
+    Benchmark one script.
+
+    Games are played once with a profiler for the phase split, then in
+    samples batches of repeat games without one; the fastest batch gives
+    the throughput, which keeps scheduling noise out of the comparison.
+    Content is loaded once into the catalog beforehand, so only the engine
+    is measured.
+
+    Returns:
+        Dict of results
+    """
+    profiler = Profiler()
+    rounds_per_game = play(catalog, script, profiler).state.round_number
+    phase_times = {
+        phase.value: profiler.stats[phase.value].total_time
+        for phase in GamePhase
+        if phase.value in profiler.stats
+    }
+    total_phase_time = sum(phase_times.values()) or 1.0
+
+    elapsed = float("inf")
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            play(catalog, script)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    return {
+        "players": script["players"],
+        "games": repeat,
+        "seconds": round(elapsed, 6),
+        "games_per_second": round(repeat / elapsed, 3),
+        "rounds_per_second": round(repeat * rounds_per_game / elapsed, 3),
+        "phase_share": {
+            phase: round(seconds / total_phase_time, 4)
+            for phase, seconds in phase_times.items()
+        },
+    }
+
+
+def run(catalog, repeat, samples):
+    results = {}
+    for player_count in PLAYER_COUNTS:
+        with open(script_path(player_count), "r", encoding="utf-8") as file:
+            script = json.load(file)
+        result = measure(catalog, script, repeat, samples)
+        results[f"{player_count}p"] = result
+        share = ", ".join(
+            f"{phase} {value:.0%}" for phase, value in result["phase_share"].items()
+        )
+        print(
+            f"{player_count} players: {result['games_per_second']:.1f} games/s, "
+            f"{result['rounds_per_second']:.1f} rounds/s ({share})"
+        )
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results with a baseline.
+
+    Returns:
+        List of regression descriptions, empty if there are none
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        for metric in ("games_per_second", "rounds_per_second"):
+            ratio = result[metric] / expected[metric]
+            print(f"{name} {metric}: {ratio:.2f}x baseline")
+            if ratio < 1 - tolerance:
+                regressions.append(
+                    f"{name} {metric} {result[metric]} < baseline {expected[metric]}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="record the input scripts")
+    record_parser.add_argument("--seed", type=int, default=1)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmark")
+    run_parser.add_argument("--save", action="store_true", help="save as baseline")
+
+    compare_parser = subparsers.add_parser("compare", help="compare with baseline")
+    compare_parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)"
+    )
+    for timed_parser in (run_parser, compare_parser):
+        timed_parser.add_argument("--repeat", type=int, default=10)
+        timed_parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    # Content loading warnings and the investigator selector's errors for
+    # repeated investigators in large games would drown out the results
+    logging.disable(logging.ERROR)
+    catalog = ContentCatalog()
+
+    if args.command == "record":
+        for player_count in PLAYER_COUNTS:
+            script = record(catalog, player_count, args.seed)
+            with open(script_path(player_count), "w", encoding="utf-8") as file:
+                json.dump(script, file)
+            answers = len(script["answers"])
+            print(f"Recorded {answers} answers for {player_count} players")
+        return
+
+    results = run(catalog, args.repeat, args.samples)
+
+    if args.command == "run":
+        if args.save:
+            with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+                json.dump(results, file, indent=2)
+            print(f"\nBaseline saved to {BASELINE_FILE}")
+        return
+
+    with open(BASELINE_FILE, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nPerformance regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
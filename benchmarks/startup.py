@@ -0,0 +1,246 @@
+"""
+Measure startup time against budgets and fail when one is exceeded.
+
+Every measurement runs in a fresh interpreter, so it includes the cold
+imports a player or a short-lived worker process pays:
+
+    import:<module>   cumulative import time of the module, from -X importtime
+    first_menu        start of the entry script until the main menu is asked for
+    game_state        GameState() construction, after its imports
+
+Budgets are in milliseconds, read from benchmarks/baselines/startup_budgets.json
+and overridden with --budget. Measurements that cannot run, such as imports
+of a UI library that is not installed, are reported and not checked.
+
+Run from the repository root:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --budget first_menu=500 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(ROOT, "benchmarks", "baselines", "startup_budgets.json")
+IMPORT_MODULES = ("main", "game.engine", "game.game_state", "game.ui.ui_manager")
+
+# Runs the game until the main menu is asked for. Uses the real UI when its
+# libraries are installed, and NullUI otherwise.
+FIRST_MENU_SCRIPT = """
+import time
+start = time.perf_counter()
+
+class FirstMenu(Exception):
+    pass
+
+def first_menu(*args, **kwargs):
+    raise FirstMenu
+
+try:
+    from game.ui.ui_manager import UIManager
+    ui = UIManager()
+except ImportError:
+    from game.ui.null_ui import NullUI
+    ui = NullUI()
+ui.show_main_menu = first_menu
+
+from game.engine import GameEngine
+engine = GameEngine(ui)
+try:
+    engine.run()
+except FirstMenu:
+    pass
+print(time.perf_counter() - start)
+"""
+
+GAME_STATE_SCRIPT = """
+import logging
+import time
+from game.game_state import GameState
+logging.disable(logging.WARNING)
+start = time.perf_counter()
+GameState()
+print(time.perf_counter() - start)
+"""
+
+
+class MeasurementError(Exception):
+    """Raised when a measurement's interpreter fails."""
+
+
+def run_python(args):
+    """
+    Run a fresh interpreter in the project root.
+
+    Returns:
+        The finished process
+    """
+    result = subprocess.run(
+        [sys.executable] + args, cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise MeasurementError(lines[-1] if lines else f"exit code {result.returncode}")
+    return result
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output.
+
+    Returns:
+        Dict of module name -> (self ms, cumulative ms)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # the header line
+        modules[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return modules
+
+
+def measure_import(module, samples, top):
+    """
+    Measure the cold import of a module.
+
+    Returns:
+        Dict with the cumulative time in ms of the fastest sample and its
+        heaviest modules by cumulative time
+    """
+    best = None
+    for _ in range(samples):
+        result = run_python(["-X", "importtime", "-c", f"import {module}"])
+        modules = parse_importtime(result.stderr)
+        if best is None or modules[module][1] < best[module][1]:
+            best = modules
+    heaviest = sorted(best.items(), key=lambda item: item[1][1], reverse=True)
+    return {
+        "ms": round(best[module][1], 2),
+        "modules": {
+            name: {"self_ms": round(own, 2), "cumulative_ms": round(cumulative, 2)}
+            for name, (own, cumulative) in heaviest[:top]
+        },
+    }
+
+
+def measure_script(script, samples):
+    """
+    Run a script that prints elapsed seconds.
+
+    Returns:
+        Dict with the time in ms of the fastest sample
+    """
+    elapsed = min(
+        float(run_python(["-c", script]).stdout.split()[-1]) for _ in range(samples)
+    )
+    return {"ms": round(elapsed * 1000, 2)}
+
+
+def measure(samples, top, modules):
+    """
+    Take every startup measurement.
+
+    Returns:
+        Dict of metric name -> measurement, where a measurement that could
+        not be taken holds an "error" instead of "ms"
+    """
+    measurements = {}
+    jobs = [
+        (f"import:{module}", lambda module=module: measure_import(module, samples, top))
+        for module in modules
+    ]
+    jobs.append(("first_menu", lambda: measure_script(FIRST_MENU_SCRIPT, samples)))
+    jobs.append(("game_state", lambda: measure_script(GAME_STATE_SCRIPT, samples)))
+
+    for name, job in jobs:
+        try:
+            measurements[name] = job()
+        except MeasurementError as e:
+            measurements[name] = {"error": str(e)}
+    return measurements
+
+
+def check_budgets(measurements, budgets):
+    """
+    Compare measurements with budgets.
+
+    Returns:
+        List of descriptions of exceeded budgets, empty if there are none
+    """
+    exceeded = []
+    for name, budget in budgets.items():
+        measurement = measurements.get(name)
+        if measurement and "ms" in measurement and measurement["ms"] > budget:
+            exceeded.append(f"{name} {measurement['ms']:.1f} ms > budget {budget} ms")
+    return exceeded
+
+
+def parse_budget(text):
+    name, separator, value = text.rpartition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"expected NAME=MS, got {text!r}")
+    return name, float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--budget",
+        type=parse_budget,
+        action="append",
+        default=[],
+        metavar="NAME=MS",
+        help="override a budget, e.g. import:game.engine=200",
+    )
+    parser.add_argument("--budgets", default=BUDGET_FILE, help="budget file")
+    parser.add_argument(
+        "--module", action="append", help="module to import (default: entry modules)"
+    )
+    parser.add_argument("--samples", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="modules listed per import")
+    parser.add_argument("--json", help="write the measurements to this file")
+    args = parser.parse_args()
+
+    budgets = {}
+    if os.path.exists(args.budgets):
+        with open(args.budgets, "r", encoding="utf-8") as file:
+            budgets = json.load(file)
+    budgets.update(args.budget)
+
+    measurements = measure(args.samples, args.top, args.module or IMPORT_MODULES)
+
+    for name, measurement in measurements.items():
+        budget = budgets.get(name)
+        budget_text = f" (budget {budget:g} ms)" if budget is not None else ""
+        if "error" in measurement:
+            print(f"{name}: not measured, {measurement['error']}")
+            continue
+        print(f"{name}: {measurement['ms']:.1f} ms{budget_text}")
+        for module, times in measurement.get("modules", {}).items():
+            print(
+                f"    {module}: {times['cumulative_ms']:.1f} ms "
+                f"({times['self_ms']:.1f} ms self)"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"budgets": budgets, "measurements": measurements}, file, indent=2)
+
+    exceeded = check_budgets(measurements, budgets)
+    if exceeded:
+        print("\nStartup budgets exceeded:")
+        for description in exceeded:
+            print(f"  {description}")
+        sys.exit(1)
+    print("\nAll startup budgets met")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,13 @@ from game.phases.action_phase import ActionPhase
 from game.phases.encounter_phase import EncounterPhase
 from game.phases.mythos_phase import MythosPhase
 from game.systems.setup_manager import SetupManager, SetupConfig
+from game.systems.phase_machine import PhaseMachine, SessionState
+from game.systems.decisions import YES_NO, DecisionRequest, drive, report_answers
+from game.systems.idle_tasks import IdleTasks
+
+# Answers to the main menu and the player count selection
+MENU_OPTIONS = ["1", "2", "3"]
+PLAYER_COUNT_OPTIONS = list(range(1, 9))
 
 
 class GameEngine:
@@ -17,30 +24,81 @@ class GameEngine:
     Core game engine, handles the main game loop and game flow
     """
 
-    def __init__(self, ui):
+    def __init__(self, ui, profiler=None, catalog=None):
         self.ui = ui
-        self.state = GameState()
+        # Optional game.systems.content_catalog.ContentCatalog shared by games
+        self.state = GameState(catalog)
         self.setup_manager = SetupManager(self.state, self.ui)
 
+        # Optional game.systems.profiler.Profiler, None disables profiling
+        self.profiler = profiler
+
+        # Callbacks run with the game state at the start of every round
+        self.round_listeners = []
+
+        # Callbacks run with every DecisionRequest and the answer sent back
+        # for it, whether a UI or a scheduler answered
+        self.decision_listeners = []
+
+        # Work done while the UI waits on the player. UIs without idle
+        # support get a registry that never runs
+        idle = getattr(ui, "idle", None)
+        self.idle = idle if isinstance(idle, IdleTasks) else IdleTasks()
+
+        self.phase_machine = PhaseMachine(self.state)
+        self.session = SessionState.MAIN_MENU
+        self.phases = {}
+        self._round_number = None
+
     def run(self):
-        self.main_menu()
+        """Run the session until the player quits."""
+        drive(self.play(), self.ui)
+
+    def play(self):
+        """
+        Run the session as a generator that yields a DecisionRequest for
+        every decision, so a scheduler can drive many sessions on one thread.
+        """
+        while self.session != SessionState.QUIT:
+            yield from self.next_step()
+
+    def step(self) -> bool:
+        """
+        Advance the session by one step: a main menu choice (including game
+        setup when a new game is chosen) or one player's turn in the current
+        phase. Steps never recurse, so a session can run indefinitely.
+
+        Returns:
+            False once the player has quit, True otherwise
+        """
+        drive(self.next_step(), self.ui)
+        return self.session != SessionState.QUIT
+
+    def next_step(self):
+        """Generator form of step()."""
+        return report_answers(self._next_step(), self.decision_listeners)
+
+    def _next_step(self):
+        if self.session == SessionState.MAIN_MENU:
+            yield from self.main_menu()
+        elif self.session == SessionState.PLAYING:
+            yield from self.play_turn()
 
     def main_menu(self):
-        choice = self.ui.show_main_menu()
+        choice = yield DecisionRequest("show_main_menu", options=MENU_OPTIONS)
         if choice == "1":
-            self.start_game()
+            yield from self.start_game()
         elif choice == "2":
             self.ui.show_instructions()
-            self.main_menu()
         elif choice == "3":
             self.quit_game()
-        else:
-            self.run()
 
     def start_game(self):
         """Initialize and start a new game."""
         # Get player count
-        player_count = self.ui.show_player_count_selection()
+        player_count = yield DecisionRequest(
+            "show_player_count_selection", options=PLAYER_COUNT_OPTIONS
+        )
 
         # Set up players and investigators
         player_names = []
@@ -49,7 +107,7 @@ class GameEngine:
         # Get player names and investigators
         for i in range(1, player_count + 1):
             # Get player name
-            player_name = self.ui.show_player_name_entry(i)
+            player_name = yield DecisionRequest("show_player_name_entry", (i,))
             player_names.append(player_name)
 
             # Get available investigators
@@ -57,8 +115,10 @@ class GameEngine:
 
             # Let player select an investigator
             while True:
-                investigator_id = self.ui.show_investigator_selection(
-                    available_investigators, player_name
+                investigator_id = yield DecisionRequest(
+                    "show_investigator_selection",
+                    (available_investigators, player_name),
+                    list(available_investigators),
                 )
 
                 # Show investigator details and confirm selection
@@ -67,9 +127,12 @@ class GameEngine:
                         investigator_id
                     )
                 )
-                if investigator_data and self.ui.show_investigator_details(
-                    investigator_data
-                ):
+                if not investigator_data:
+                    continue
+                confirmed = yield DecisionRequest(
+                    "show_investigator_details", (investigator_data,), YES_NO
+                )
+                if confirmed:
                     investigator_ids.append(investigator_id)
                     break
 
@@ -78,11 +141,20 @@ class GameEngine:
         available_ancient_ones = self.setup_manager.get_available_ancient_ones()
 
         while True:
-            ancient_one_id = self.ui.show_ancient_one_selection(available_ancient_ones)
+            ancient_one_id = yield DecisionRequest(
+                "show_ancient_one_selection",
+                (available_ancient_ones,),
+                list(available_ancient_ones),
+            )
 
             # Show ancient one details and confirm selection
             ancient_one_data = available_ancient_ones.get(ancient_one_id)
-            if ancient_one_data and self.ui.show_ancient_one_details(ancient_one_data):
+            if not ancient_one_data:
+                continue
+            confirmed = yield DecisionRequest(
+                "show_ancient_one_details", (ancient_one_data,), YES_NO
+            )
+            if confirmed:
                 break
 
         # Create setup config with selected investigators and ancient one
@@ -96,29 +168,71 @@ class GameEngine:
         # Initialize game with config
         self.setup_manager.initialize_game(config)
 
-        # Start the game loop
-        self.game_loop()
+        # The next steps play the game
+        self.begin_game()
 
-    def game_loop(self):
-        """Main game loop."""
-
-        phases = {
+    def begin_game(self):
+        """Start playing the game in the current state."""
+        self.phases = {
             GamePhase.ACTION: ActionPhase(self, self.state, self.ui),
             GamePhase.ENCOUNTER: EncounterPhase(self, self.state, self.ui),
             GamePhase.MYTHOS: MythosPhase(self, self.state, self.ui),
         }
 
-        while True:
-            # Execute current phase
-            phases[self.state.current_phase].execute()
+        if self.profiler:
+            self.profiler.instrument_state(self.state)
 
-            # Check for game over conditions
-            if self.check_game_over():
-                break
+        self.idle.add(self.warm_encounter_options)
+
+        self._round_number = None
+        self.session = SessionState.PLAYING
+
+    def game_loop(self):
+        """Play the game in the current state until it ends."""
+        drive(self.play_game(), self.ui)
 
-            # state.phase handled in phase classes
+    def play_game(self):
+        """Generator form of game_loop()."""
+        return report_answers(self._play_game(), self.decision_listeners)
 
-        self.main_menu()
+    def _play_game(self):
+        self.begin_game()
+        while self.session == SessionState.PLAYING:
+            yield from self.play_turn()
+
+    def play_turn(self):
+        """Play the current player's turn in the current phase."""
+        if self.round_listeners and self.state.round_number != self._round_number:
+            self._round_number = self.state.round_number
+            for listener in self.round_listeners:
+                listener(self.state)
+
+        # Play the current phase
+        phase = self.state.current_phase
+        profiler = self.profiler
+        if profiler is None:
+            yield from self.phases[phase].turn()
+        else:
+            yield from profiler.timed(phase.value, self.phases[phase].turn())
+
+        # Check for game over conditions
+        if self.check_game_over():
+            self.session = SessionState.MAIN_MENU
+            return
+
+        message = self.phase_machine.advance()
+        if message:
+            self.ui.show_message(message)
+
+    def warm_encounter_options(self) -> bool:
+        """Idle task: build the encounter options the next encounters will offer."""
+        if self.session != SessionState.PLAYING:
+            return False
+        return self.state.encounter_availability.warm(
+            player.investigator.current_location
+            for player in self.state.players
+            if player.investigator
+        )
 
     def check_game_over(self):
         """Check for game over conditions."""
@@ -152,4 +266,4 @@ class GameEngine:
 
     def quit_game(self):
         self.ui.clear_screen()
-        exit()
+        self.session = SessionState.QUIT
@@ -2,7 +2,6 @@ from dataclasses import dataclass, field
 from typing import List
 from game.enums import AncientOneDifficulty, Expansion
 from game.entities.cards.monster import Monster
-import random
 
 
 @dataclass
@@ -32,6 +31,9 @@ class AncientOne:
     defeated: bool = False
     ui = None  # UI reference for the ancient one methods. Temporary hack.
 
+    # Mutable attributes written to save files
+    save_fields = ("awakened", "defeated")
+
     def set_ui(self, ui):
         """Set the UI reference for Ancient One."""
         self.ui = ui
@@ -110,21 +112,21 @@ class AncientOne:
 
         if stage.green > 0:
             green_cards = game_state.mythos_factory.get_cards(
-                "green", stage.green, difficulty
+                "green", stage.green, difficulty, game_state.rng
             )
             stage_cards.extend(green_cards)
         if stage.yellow > 0:
             yellow_cards = game_state.mythos_factory.get_cards(
-                "yellow", stage.yellow, difficulty
+                "yellow", stage.yellow, difficulty, game_state.rng
             )
             stage_cards.extend(yellow_cards)
         if stage.blue > 0:
             blue_cards = game_state.mythos_factory.get_cards(
-                "blue", stage.blue, difficulty
+                "blue", stage.blue, difficulty, game_state.rng
             )
             stage_cards.extend(blue_cards)
 
-        random.shuffle(stage_cards)
+        game_state.rng.shuffle(stage_cards)
 
         return stage_cards
 
@@ -7,6 +7,11 @@ from game.entities.cards.monster import Monster
 
 class YogSothoth(AncientOne):
 
+    save_fields = AncientOne.save_fields + (
+        "gates_on_ancient_one",
+        "eldritch_tokens_on_final_mystery",
+    )
+
     def __init__(self):
         super().__init__(
             name="Yog-Sothoth",
@@ -18,6 +18,21 @@ class EncounterComponent(ABC):
         """
         pass
 
+    def resolve(self, state, investigator):
+        """
+        Process this component as a generator that yields a DecisionRequest
+        for every player decision and returns the result of processing.
+
+        Components that need decisions override this and implement process()
+        by driving it with the UI. The default makes no decisions.
+
+        Args:
+            state: The current game state
+            investigator: The investigator this component affects
+        """
+        yield from ()
+        return self.process(state, investigator)
+
     @classmethod
     @abstractmethod
     def from_data(cls, data: Dict[str, Any]) -> "EncounterComponent":
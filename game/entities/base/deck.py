@@ -1,14 +1,21 @@
 import random
 
-class Deck:
-    def __init__(self, cards=None, name="Unnamed Deck"):
+from game.entities.base.observable import Observable, mutator
+
+
+class Deck(Observable):
+    def __init__(self, cards=None, name="Unnamed Deck", rng=None):
         self.cards = cards or []
         self.discard_pile = []
         self.name = name
+        # Random source used for shuffling, defaults to the random module
+        self.rng = rng or random
         
+    @mutator()
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
         
+    @mutator()
     def draw(self, n=1):
         if not self.cards and self.discard_pile:
             self.cards = self.discard_pile
@@ -20,11 +27,14 @@ class Deck:
         
         return self.cards.pop(0)
     
+    @mutator()
     def discard(self, card):
         self.discard_pile.append(card)
         
+    @mutator()
     def add_to_top(self, card):
         self.cards.insert(0, card)
         
+    @mutator()
     def add_to_bottom(self, card):
         self.cards.append(card)
\ No newline at end of file
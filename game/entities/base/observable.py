@@ -0,0 +1,58 @@
+import functools
+from typing import Callable, Optional
+
+# observer(obj, name): name is the changed attribute, or None when a mutator
+# changed the object without naming a field
+Observer = Callable[[object, Optional[str]], None]
+
+class Observable:
+    """
+    Mixin that reports changes to observers.
+
+    Observers are called after an attribute is assigned and after a method
+    decorated with @mutator returns. Objects nobody observes share the
+    empty class-level observer tuple, so their assignments return after a
+    single attribute check.
+    """
+
+    _observers = ()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if self._observers:
+            for observer in self._observers:
+                observer(self, name)
+
+    def add_observer(self, observer: Observer) -> None:
+        object.__setattr__(self, "_observers", self._observers + (observer,))
+
+    def remove_observer(self, observer: Observer) -> None:
+        observers = tuple(o for o in self._observers if o != observer)
+        object.__setattr__(self, "_observers", observers)
+
+    def notify_change(self, name: Optional[str] = None) -> None:
+        for observer in self._observers:
+            observer(self, name)
+
+
+def mutator(field: Optional[str] = None):
+    """
+    Decorate a method that changes its object in place.
+
+    Args:
+        field: Name of the attribute the method changes, or None
+
+    Returns:
+        A decorator that notifies observers after the method returns
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self.notify_change(field)
+            return result
+
+        return wrapper
+
+    return decorator
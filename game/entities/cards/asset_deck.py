@@ -1,5 +1,6 @@
 from typing import List, Optional
 from game.entities.base.deck import Deck
+from game.entities.base.observable import mutator
 from game.entities.cards.asset import Asset
 
 
@@ -9,8 +10,10 @@ class AssetDeck(Deck):
     Extends the base Deck class with asset-specific functionality.
     """
 
-    def __init__(self, assets: List[Asset] = None, name: str = "Asset Deck"):
-        super().__init__(assets, name)
+    def __init__(
+        self, assets: List[Asset] = None, name: str = "Asset Deck", rng=None
+    ):
+        super().__init__(assets, name, rng)
         self.reserve: List[Asset] = []
         self.reserve_size = 4  # Default reserve size
 
@@ -24,6 +27,7 @@ class AssetDeck(Deck):
         self.reserve_size = size
         self.refill_reserve()
 
+    @mutator()
     def refill_reserve(self) -> None:
         """Refill the reserve to its full size."""
         while len(self.reserve) < self.reserve_size and (self.cards or self.discard_pile):
@@ -31,6 +35,7 @@ class AssetDeck(Deck):
             if drawn:
                 self.reserve.append(drawn)
 
+    @mutator()
     def draw_specific(self, asset_id: str) -> Optional[Asset]:
         """
         Draw a specific asset from the deck by ID.
@@ -54,6 +59,7 @@ class AssetDeck(Deck):
                 
         return None
 
+    @mutator()
     def take_from_reserve(self, index: int) -> Optional[Asset]:
         """
         Take an asset from the reserve.
@@ -1,5 +1,6 @@
 from typing import List, Optional, Tuple
 from game.entities.base.deck import Deck
+from game.entities.base.observable import mutator
 from game.entities.cards.condition import Condition
 
 
@@ -12,8 +13,13 @@ class ConditionDeck(Deck):
     conditions with specific traits, we search from the bottom up.
     """
 
-    def __init__(self, conditions: List[Condition] = None, name: str = "Condition Deck"):
-        super().__init__(conditions, name)
+    def __init__(
+        self,
+        conditions: List[Condition] = None,
+        name: str = "Condition Deck",
+        rng=None,
+    ):
+        super().__init__(conditions, name, rng)
         self.conditions_by_trait = {}
 
         # Index conditions by trait for faster lookup
@@ -33,6 +39,7 @@ class ConditionDeck(Deck):
                     self.conditions_by_trait[trait] = []
                 self.conditions_by_trait[trait].append(condition)
 
+    @mutator()
     def draw(self, n=1):
         """
         Draw a condition from the bottom of the deck.
@@ -91,6 +98,7 @@ class ConditionDeck(Deck):
 
         return None, -1
 
+    @mutator()
     def draw_by_id(self, condition_id: str) -> Optional[Condition]:
         """
         Draw a specific condition by ID.
@@ -116,6 +124,7 @@ class ConditionDeck(Deck):
 
         return None
 
+    @mutator()
     def draw_by_trait(self, trait: str) -> Optional[Condition]:
         """
         Draw a condition with the specified trait, starting from the bottom of the deck.
@@ -141,6 +150,7 @@ class ConditionDeck(Deck):
 
         return None
 
+    @mutator()
     def recycle_discarded_conditions_by_id(self, condition_id: str) -> bool:
         """
         Move conditions with the specified ID from the discard pile back to the main deck.
@@ -176,6 +186,7 @@ class ConditionDeck(Deck):
 
         return True
 
+    @mutator()
     def recycle_discarded_conditions_by_trait(self, trait: str) -> bool:
         """
         Move conditions with the specified trait from the discard pile back to the main deck.
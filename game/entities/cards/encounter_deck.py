@@ -1,5 +1,6 @@
 from typing import List, Optional, Dict, Tuple
 from game.entities.base.deck import Deck
+from game.entities.base.observable import mutator
 from game.entities.cards.encounter import Encounter
 from game.entities.location import LocationType
 
@@ -11,9 +12,12 @@ class EncounterDeck(Deck):
     """
 
     def __init__(
-        self, encounters: List[Encounter] = None, name: str = "Encounter Deck"
+        self,
+        encounters: List[Encounter] = None,
+        name: str = "Encounter Deck",
+        rng=None,
     ):
-        super().__init__(encounters, name)
+        super().__init__(encounters, name, rng)
         self.encounters_by_subtype = {}
 
         # Index encounters by subtype for faster lookup
@@ -33,6 +37,7 @@ class EncounterDeck(Deck):
                 self.encounters_by_subtype[subtype] = []
             self.encounters_by_subtype[subtype].append(encounter)
 
+    @mutator()
     def draw_by_location_type(self, location_type: LocationType) -> Optional[Encounter]:
         """
         Draw an encounter for a specific location type.
@@ -1,6 +1,15 @@
 from typing import Any, Dict, List, Optional, Union
 from game.entities.base.component import EncounterComponent
 from game.enums import AssetTrait
+from game.systems.decisions import DecisionRequest, drive
+
+
+def _reserve_index(choice) -> Optional[int]:
+    """Index of a reserve answer: a number, or a menu option like "2. Lantern"."""
+    if not choice:
+        return None
+    number = str(choice).split(".", 1)[0].strip()
+    return int(number) - 1 if number.isdigit() else None
 
 
 class AssetGainComponent(EncounterComponent):
@@ -31,6 +40,9 @@ class AssetGainComponent(EncounterComponent):
     def process(
         self, state, investigator, ui=None
     ):  # investigator will be used by phase controller
+        return drive(self.resolve(state, investigator), ui)
+
+    def resolve(self, state, investigator):
         result = {
             "type": "asset_gain",
             "asset_type": (
@@ -54,24 +66,20 @@ class AssetGainComponent(EncounterComponent):
             return result
 
         # If we're choosing from options
-        if self.source == "choice" and self.options and ui:
-            choice = ui.show_choice(
-                f"Choose {self.count} {self.asset_type}(s):", self.options
+        if self.source == "choice" and self.options:
+            choice = yield DecisionRequest(
+                "show_choice",
+                (f"Choose {self.count} {self.asset_type}(s):", self.options),
+                self.options,
             )
             result["choice"] = choice
 
             if choice == "reserve":
                 # Choose from reserve
-                if ui and state.asset_deck and state.asset_deck.reserve:
-                    reserve_options = [
-                        f"{i+1}. {asset.name}"
-                        for i, asset in enumerate(state.asset_deck.reserve)
-                    ]
-                    reserve_choice = ui.show_choice(
-                        "Choose an asset from the reserve:", reserve_options
-                    )
-                    if reserve_choice and reserve_choice.isdigit():
-                        index = int(reserve_choice) - 1
+                if state.asset_deck and state.asset_deck.reserve:
+                    reserve_choice = yield self._reserve_request(state)
+                    index = _reserve_index(reserve_choice)
+                    if index is not None:
                         asset = state.asset_deck.take_from_reserve(index)
                         if asset:
                             result["gained_assets"].append(asset.id)
@@ -90,16 +98,10 @@ class AssetGainComponent(EncounterComponent):
                 result["choice_type"] = "random"
         elif self.source == "reserve":
             # Choose from reserve
-            if ui and state.asset_deck and state.asset_deck.reserve:
-                reserve_options = [
-                    f"{i+1}. {asset.name}"
-                    for i, asset in enumerate(state.asset_deck.reserve)
-                ]
-                reserve_choice = ui.show_choice(
-                    "Choose an asset from the reserve:", reserve_options
-                )
-                if reserve_choice and reserve_choice.isdigit():
-                    index = int(reserve_choice) - 1
+            if state.asset_deck and state.asset_deck.reserve:
+                reserve_choice = yield self._reserve_request(state)
+                index = _reserve_index(reserve_choice)
+                if index is not None:
                     asset = state.asset_deck.take_from_reserve(index)
                     if asset:
                         result["gained_assets"].append(asset.id)
@@ -118,3 +120,14 @@ class AssetGainComponent(EncounterComponent):
             result["source_type"] = "random"
 
         return result
+
+    def _reserve_request(self, state) -> DecisionRequest:
+        """Ask for an asset from the reserve."""
+        reserve_options = [
+            f"{i+1}. {asset.name}" for i, asset in enumerate(state.asset_deck.reserve)
+        ]
+        return DecisionRequest(
+            "show_choice",
+            ("Choose an asset from the reserve:", reserve_options),
+            reserve_options,
+        )
@@ -1,5 +1,6 @@
 from typing import Any, Dict, Optional
 from game.entities.base.component import EncounterComponent
+from game.systems.decisions import YES_NO, DecisionRequest, drive
 
 
 class DiscardComponent(EncounterComponent):
@@ -25,6 +26,9 @@ class DiscardComponent(EncounterComponent):
         return cls(count, asset_type, condition_type, optional)
 
     def process(self, state, investigator, ui=None):
+        return drive(self.resolve(state, investigator), ui)
+
+    def resolve(self, state, investigator):
         result = {
             "type": "discard",
             "count": self.count,
@@ -35,9 +39,11 @@ class DiscardComponent(EncounterComponent):
         }
 
         # For optional discards, we need UI interaction
-        if self.optional and ui:
-            should_discard = ui.ask_yes_no(
-                f"Would you like to discard {self.count} {self.asset_type}?"
+        if self.optional:
+            should_discard = yield DecisionRequest(
+                "ask_yes_no",
+                (f"Would you like to discard {self.count} {self.asset_type}?",),
+                YES_NO,
             )
             result["player_choice"] = should_discard
 
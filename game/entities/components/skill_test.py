@@ -3,6 +3,7 @@ from game.entities.base.component import EncounterComponent
 from game.entities.investigator import Investigator
 import importlib
 from game.entities.components.component_factory import create_component
+from game.systems.decisions import drive
 
 
 class SkillTestComponent(EncounterComponent):
@@ -19,11 +20,16 @@ class SkillTestComponent(EncounterComponent):
         self.failure_components = failure_components
 
     def process(self, state, investigator: Investigator, ui=None) -> Dict[str, Any]:
+        return drive(self.resolve(state, investigator), ui)
+
+    def resolve(self, state, investigator: Investigator):
         messages = []
         messages.append(f"Test {self.skill} ({self.modifier})")
 
         # Perform the skill test
-        success, rolls = investigator.perform_skill_test(self.skill, self.modifier)
+        success, rolls = investigator.perform_skill_test(
+            self.skill, self.modifier, rng=getattr(state, "rng", None)
+        )
 
         messages.append(f"Rolls: {rolls}")
         messages.append("Success!" if success else "Failure!")
@@ -42,12 +48,12 @@ class SkillTestComponent(EncounterComponent):
         component_results = []
         if success:
             for component in self.success_components:
-                component_result = component.process(state, investigator, ui)
+                component_result = yield from component.resolve(state, investigator)
                 component_results.append(component_result)
             result["component_results"] = component_results
         else:
             for component in self.failure_components:
-                component_result = component.process(state, investigator, ui)
+                component_result = yield from component.resolve(state, investigator)
                 component_results.append(component_result)
             result["component_results"] = component_results
 
@@ -2,12 +2,13 @@ import random
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional
 
+from game.entities.base.observable import Observable, mutator
 from game.entities.cards.asset import Asset
 from game.enums import TicketType
 
 
 @dataclass
-class Investigator:
+class Investigator(Observable):
     """Represents a player character in the game."""
 
     # Required parameters
@@ -29,6 +30,9 @@ class Investigator:
     conditions: List[str] = field(default_factory=list)
     assets: List[Asset] = field(default_factory=list)
 
+    # Content id of the investigator card, used by save files
+    investigator_id: Optional[int] = None
+
     def heal(self, amount: int = 1) -> int:
         """Heal the investigator's health.
 
@@ -140,30 +144,33 @@ class Investigator:
         return False
 
     def perform_skill_test(
-        self, skill: str, modifier: int = 0
+        self, skill: str, modifier: int = 0, rng=None
     ) -> tuple[bool, list[int]]:
         """Perform a skill test using the investigator's skill value.
 
         Args:
             skill: The skill to test (lore, influence, observation, etc.)
             modifier: Modifier to apply to the skill value
+            rng: Random source for the dice, defaults to the random module
 
         Returns:
             Tuple of (success, dice_rolls) where success is True if at least one die succeeded
         """
+        rng = rng or random
         skill_value = self.skills.get(skill, 0)
         skill_value += modifier
         successes = 0
         rolls = []
 
         for _ in range(skill_value):
-            roll = random.randint(1, 6)
+            roll = rng.randint(1, 6)
             rolls.append(roll)
             if roll >= 5:  # 5-6 is a success
                 successes += 1
 
         return successes >= 1, rolls
 
+    @mutator("conditions")
     def add_condition(self, condition: str, variant_index: Optional[int] = None) -> List[str]:
         """Add a condition to the investigator.
 
@@ -204,6 +211,7 @@ class Investigator:
         """
         return condition_id in self.conditions
 
+    @mutator("conditions")
     def remove_condition(self, condition_id: str) -> bool:
         """Remove a condition from the investigator.
 
@@ -217,3 +225,31 @@ class Investigator:
             self.conditions.remove(condition_id)
             return True
         return False
+
+    @mutator("assets")
+    def add_asset(self, asset: Asset) -> List[Asset]:
+        """Add an asset to the investigator.
+
+        Args:
+            asset: The asset to add
+
+        Returns:
+            The updated list of assets
+        """
+        self.assets.append(asset)
+        return self.assets
+
+    @mutator("assets")
+    def remove_asset(self, asset: Asset) -> bool:
+        """Remove an asset from the investigator.
+
+        Args:
+            asset: The asset to remove
+
+        Returns:
+            True if the asset was removed, False if it wasn't found
+        """
+        if asset in self.assets:
+            self.assets.remove(asset)
+            return True
+        return False
@@ -1,9 +1,16 @@
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import List, Optional, Set, Dict
+from game.entities.base.observable import Observable, mutator
 from game.entities.cards.monster import Monster
 
 
+# Fields that change which encounters are available at a location
+TOKEN_FIELDS = frozenset(
+    {"has_gate", "has_clue", "has_expedition", "has_rumor", "rumor_name"}
+)
+
+
 class LocationType(Enum):
     CITY = "city"
     WILDERNESS = "wilderness"
@@ -12,7 +19,7 @@ class LocationType(Enum):
 
 
 @dataclass
-class Location:
+class Location(Observable):
     # Required parameters
     name: str
     description: str
@@ -31,6 +38,14 @@ class Location:
     has_rumor: bool = False
     rumor_name: Optional[str] = None
 
+    # Bumped whenever a token field changes so caches can detect stale data
+    token_revision: int = field(default=0, compare=False, repr=False)
+
+    def __setattr__(self, name, value):
+        if name in TOKEN_FIELDS:
+            object.__setattr__(self, "token_revision", self.token_revision + 1)
+        super().__setattr__(name, value)
+
     def has_train_connection(self):
         return len(self.train_paths) > 0
 
@@ -55,6 +70,17 @@ class Location:
             return True
         return False
 
+    @mutator("monsters")
+    def add_monster(self, monster: Monster) -> None:
+        self.monsters.append(monster)
+
+    @mutator("monsters")
+    def remove_monster(self, monster: Monster) -> bool:
+        if monster in self.monsters:
+            self.monsters.remove(monster)
+            return True
+        return False
+
     def has_continent_encounter_deck(self) -> Optional[str]:
         """Returns the continent encounter deck name if this location uses one, otherwise None"""
         # Major cities that use continent-specific encounter decks
@@ -1,10 +1,17 @@
 import json
 import os
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Executor
+from typing import Dict, Iterable, List, Optional, Any
 
+from game import json_backend
 from game.entities.cards.asset import Asset
 from game.enums import AssetTrait, AssetSecondaryTrait
+from game.factories.content_files import (
+    ContentFile,
+    read_content_file,
+    read_content_files,
+)
 
 
 class AssetFactory:
@@ -21,18 +28,36 @@ class AssetFactory:
         self.assets_by_trait: Dict[AssetTrait, List[Asset]] = {}  # Dict of trait -> list of assets
         self.logger = logging.getLogger(__name__)
 
-    def load_all_assets(self) -> None:
-        """Load all assets from the data directory."""
+    def load_all_assets(self, executor: Optional[Executor] = None) -> None:
+        """
+        Load all assets from the data directory.
+
+        Args:
+            executor: Executor reading the files at once, None to read them in turn
+        """
+        self.load_asset_files(read_content_files(self.asset_files(), executor))
+
+    def asset_files(self) -> List[str]:
+        """
+        Get the asset files in the data directory.
+
+        Returns:
+            Paths of the trait files, then of the combined file if it exists
+        """
         assets_dir = "game/data/assets"
+        paths = []
 
-        # Load assets from each trait file
         for trait in AssetTrait:
-            self.load_assets_by_trait_file(trait.value)
+            file_path = f"{assets_dir}/{trait.value}_assets.json"
+            if os.path.exists(file_path):
+                paths.append(file_path)
+            else:
+                self.logger.info(f"Asset file not found (this is normal for new traits): {file_path}")
 
-        # Also load the combined assets file if it exists
         combined_file = os.path.join(assets_dir, "all_assets.json")
         if os.path.exists(combined_file):
-            self.load_assets_from_file(combined_file)
+            paths.append(combined_file)
+        return paths
 
     def load_assets_by_trait_file(self, trait_name: str) -> None:
         """
@@ -54,9 +79,21 @@ class AssetFactory:
         Args:
             file_path: Path to the JSON file containing assets
         """
-        try:
-            with open(file_path, "r") as file:
-                assets_data = json.load(file)
+        self.load_asset_files([read_content_file(file_path)])
+
+    def load_asset_files(self, files: Iterable[ContentFile]) -> None:
+        """
+        Create the assets of parsed asset files.
+
+        Args:
+            files: The parsed files, in load order
+        """
+        for content in files:
+            file_path = content.path
+            try:
+                if content.error:
+                    raise content.error
+                assets_data = content.data
 
                 # Handle both array and dictionary formats
                 if isinstance(assets_data, list):
@@ -72,10 +109,10 @@ class AssetFactory:
                         self._process_asset_data(asset_data)
 
                 self.logger.info(f"Loaded assets from: {file_path}")
-        except json.JSONDecodeError:
-            self.logger.error(f"Error parsing JSON in {file_path}")
-        except Exception as e:
-            self.logger.error(f"Error loading assets from {file_path}: {str(e)}")
+            except json.JSONDecodeError:
+                self.logger.error(f"Error parsing JSON in {file_path}")
+            except Exception as e:
+                self.logger.error(f"Error loading assets from {file_path}: {str(e)}")
 
     def _process_asset_data(self, asset_data: Dict[str, Any]) -> None:
         """
@@ -124,7 +161,7 @@ class AssetFactory:
 
         try:
             with open(file_path, "r") as file:
-                asset_data = json.load(file)
+                asset_data = json_backend.load(file)
                 asset = self._create_asset(asset_data)
 
                 if asset:
@@ -2,8 +2,9 @@ import json
 import os
 import logging
 import random
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from game.enums import Expansion
+from game.factories.content_files import ContentFile, read_content_file
 
 from game.entities.cards.condition import Condition
 from game.entities.base.component import CardComponent
@@ -27,12 +28,22 @@ class ConditionFactory:
 
     def load_all_conditions(self) -> None:
         """Load all conditions from the data directory."""
+        for file_path in self.condition_files():
+            self.load_conditions_from_file(file_path)
+
+    def condition_files(self) -> List[str]:
+        """
+        Get the condition files in the data directory.
+
+        Returns:
+            Paths of the files that exist
+        """
         conditions_file = "game/data/conditions.json"
 
         if os.path.exists(conditions_file):
-            self.load_conditions_from_file(conditions_file)
-        else:
-            self.logger.warning(f"Conditions file not found: {conditions_file}")
+            return [conditions_file]
+        self.logger.warning(f"Conditions file not found: {conditions_file}")
+        return []
 
     def load_conditions_from_file(self, file_path: str) -> None:
         """
@@ -41,19 +52,30 @@ class ConditionFactory:
         Args:
             file_path: Path to the JSON file containing conditions
         """
-        try:
-            with open(file_path, "r") as file:
-                conditions_data = json.load(file)
+        self.load_condition_files([read_content_file(file_path)])
+
+    def load_condition_files(self, files: Iterable[ContentFile]) -> None:
+        """
+        Create the conditions of parsed condition files.
+
+        Args:
+            files: The parsed files, in load order
+        """
+        for content in files:
+            file_path = content.path
+            try:
+                if content.error:
+                    raise content.error
 
                 # Process each condition
-                for condition_data in conditions_data:
+                for condition_data in content.data:
                     self._process_condition_data(condition_data)
 
                 self.logger.info(f"Loaded conditions from: {file_path}")
-        except json.JSONDecodeError:
-            self.logger.error(f"Error parsing JSON in {file_path}")
-        except Exception as e:
-            self.logger.error(f"Error loading conditions from {file_path}: {str(e)}")
+            except json.JSONDecodeError:
+                self.logger.error(f"Error parsing JSON in {file_path}")
+            except Exception as e:
+                self.logger.error(f"Error loading conditions from {file_path}: {str(e)}")
 
     def _process_condition_data(self, condition_data: Dict[str, Any]) -> None:
         """
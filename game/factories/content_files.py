@@ -0,0 +1,54 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Optional
+
+from game import json_backend
+
+
+@dataclass
+class ContentFile:
+    """A data file read and parsed, or the error that stopped it."""
+
+    path: str
+    data: Any = None
+    error: Optional[Exception] = None
+
+
+def read_content_file(path: str) -> ContentFile:
+    """
+    Read and parse a JSON data file. Errors are returned, not raised.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        The parsed file
+    """
+    try:
+        with open(path, "rb") as file:
+            return ContentFile(path, json_backend.load(file))
+    except Exception as e:
+        return ContentFile(path, error=e)
+
+
+def read_content_files(
+    paths: Iterable[str], executor: Optional[Executor] = None
+) -> Iterator[ContentFile]:
+    """
+    Read and parse JSON data files, on an executor if one is given.
+
+    Every file is submitted to the executor before this returns, so files
+    of several factories can be read at once: submit them all first, then
+    build each factory's cards from its results.
+
+    Args:
+        paths: Paths to the files
+        executor: Executor reading the files, None to read them in turn
+
+    Returns:
+        Iterator over the parsed files in the order of paths
+    """
+    if executor is None:
+        return (read_content_file(path) for path in paths)
+    futures = [executor.submit(read_content_file, path) for path in paths]
+    return (future.result() for future in futures)
@@ -2,12 +2,18 @@ import json
 import os
 import random
 import logging
+from concurrent.futures import Executor
 from typing import Dict, List, Optional, Any
 
 from game.entities.cards.encounter import Encounter
 from game.entities.location import LocationType
 from game.enums import EncounterType, EncounterSubType
 from game.entities.components.component_factory import create_component
+from game.factories.content_files import (
+    ContentFile,
+    read_content_file,
+    read_content_files,
+)
 
 
 class EncounterFactory:
@@ -27,42 +33,55 @@ class EncounterFactory:
         self.loaded_types = set()  # Track which encounter types have been loaded
         self.logger = logging.getLogger(__name__)
 
-    def _load_encounters(self, encounter_type: str):
-        """Load encounters of the specified type from JSON files"""
+    def _encounter_file(self, encounter_type: str) -> Optional[str]:
+        """Path of the file of an encounter type, None if there is none"""
         file_path = f"game/data/encounters/{encounter_type}.json"
 
         if not os.path.exists(file_path):
             self.logger.warning("Encounter file not found: %s", file_path)
-            return
+            # Don't look for the file again on every lookup
+            self.loaded_types.add(encounter_type)
+            return None
+        return file_path
+
+    def _load_encounters(self, encounter_type: str):
+        """Load encounters of the specified type from JSON files"""
+        file_path = self._encounter_file(encounter_type)
+        if file_path:
+            self._load_encounter_file(read_content_file(file_path), encounter_type)
 
+    def _load_encounter_file(self, content: ContentFile, encounter_type: str):
+        """Create the encounters of a parsed encounter file"""
+        file_path = content.path
         try:
-            with open(file_path, "r") as file:
-                encounters_data = json.load(file)
-
-                # Initialize encounter lists if needed
-                if encounter_type not in self.encounters:
-                    self.encounters[encounter_type] = []
-
-                # Process each encounter
-                for encounter_data in encounters_data:
-                    encounter = self._create_encounter(encounter_data)
-                    if encounter:
-                        self.encounters[encounter_type].append(encounter)
-
-                        # Index by subtype if present
-                        subtype = encounter_data.get("subtype")
-                        if subtype:
-                            key = (encounter_type, subtype)
-                            if key not in self.encounters_by_subtype:
-                                self.encounters_by_subtype[key] = []
-                            self.encounters_by_subtype[key].append(encounter)
-
-                # Mark this type as loaded
-                self.loaded_types.add(encounter_type)
-
-                self.logger.info(
-                    "Loaded %d %s encounters", len(encounters_data), encounter_type
-                )
+            if content.error:
+                raise content.error
+            encounters_data = content.data
+
+            # Initialize encounter lists if needed
+            if encounter_type not in self.encounters:
+                self.encounters[encounter_type] = []
+
+            # Process each encounter
+            for encounter_data in encounters_data:
+                encounter = self._create_encounter(encounter_data)
+                if encounter:
+                    self.encounters[encounter_type].append(encounter)
+
+                    # Index by subtype if present
+                    subtype = encounter_data.get("subtype")
+                    if subtype:
+                        key = (encounter_type, subtype)
+                        if key not in self.encounters_by_subtype:
+                            self.encounters_by_subtype[key] = []
+                        self.encounters_by_subtype[key].append(encounter)
+
+            # Mark this type as loaded
+            self.loaded_types.add(encounter_type)
+
+            self.logger.info(
+                "Loaded %d %s encounters", len(encounters_data), encounter_type
+            )
         except json.JSONDecodeError:
             self.logger.error("Error parsing JSON in %s", file_path)
         except Exception as e:
@@ -157,8 +176,13 @@ class EncounterFactory:
 
         return self.encounters.get(encounter_type, [])
 
-    def load_all_encounter_types(self):
-        """Load all encounter types"""
+    def load_all_encounter_types(self, executor: Optional[Executor] = None):
+        """
+        Load all encounter types that are not loaded yet
+
+        Args:
+            executor: Executor reading the files at once, None to read them in turn
+        """
         encounter_types = [
             EncounterType.GENERAL.value,  # City, wilderness, sea encounters
             EncounterType.AMERICA.value,  # America continent encounters
@@ -170,5 +194,14 @@ class EncounterFactory:
             EncounterType.SPECIAL.value,  # Special encounters (subtypes by Ancient One)
         ]
 
+        files = {}
         for encounter_type in encounter_types:
-            self._load_encounters(encounter_type)
+            if encounter_type not in self.loaded_types:
+                file_path = self._encounter_file(encounter_type)
+                if file_path:
+                    files[encounter_type] = file_path
+
+        # Read every file first, then build the encounters on this thread
+        contents = read_content_files(files.values(), executor)
+        for encounter_type, content in zip(files, contents):
+            self._load_encounter_file(content, encounter_type)
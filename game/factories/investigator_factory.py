@@ -2,9 +2,15 @@ import json
 import os
 import logging
 import glob
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Executor
+from typing import Dict, Iterable, List, Optional, Any
 
 from game.entities.investigator import Investigator
+from game.factories.content_files import (
+    ContentFile,
+    read_content_file,
+    read_content_files,
+)
 
 
 class InvestigatorFactory:
@@ -22,19 +28,31 @@ class InvestigatorFactory:
         )  # Dict of investigator_id -> investigator data
         self.logger = logging.getLogger(__name__)
 
-    def load_all_investigators(self) -> None:
-        """Load all investigators from the data directory."""
+    def load_all_investigators(self, executor: Optional[Executor] = None) -> None:
+        """
+        Load all investigators from the data directory.
+
+        Args:
+            executor: Executor reading the files at once, None to read them in turn
+        """
+        self.load_investigator_files(
+            read_content_files(self.investigator_files(), executor)
+        )
+
+    def investigator_files(self) -> List[str]:
+        """
+        Get the investigator files in the data directory.
+
+        Returns:
+            Paths of the files, without the template
+        """
         investigators_dir = "game/data/investigators"
 
         # Get all JSON files in the investigators directory
         json_files = glob.glob(f"{investigators_dir}/*.json")
 
-        for file_path in json_files:
-            # Skip the template file
-            if "template.json" in file_path:
-                continue
-
-            self.load_investigators_from_file(file_path)
+        # Skip the template file
+        return [path for path in json_files if "template.json" not in path]
 
     def load_investigators_from_file(self, file_path: str) -> None:
         """
@@ -43,19 +61,30 @@ class InvestigatorFactory:
         Args:
             file_path: Path to the JSON file containing investigators
         """
-        try:
-            with open(file_path, "r") as file:
-                investigators_data = json.load(file)
+        self.load_investigator_files([read_content_file(file_path)])
+
+    def load_investigator_files(self, files: Iterable[ContentFile]) -> None:
+        """
+        Add the investigators of parsed investigator files.
+
+        Args:
+            files: The parsed files, in load order
+        """
+        for content in files:
+            file_path = content.path
+            try:
+                if content.error:
+                    raise content.error
 
                 # Process each investigator
-                for investigator_data in investigators_data:
+                for investigator_data in content.data:
                     self._process_investigator_data(investigator_data)
 
                 self.logger.info(f"Loaded investigators from: {file_path}")
-        except json.JSONDecodeError:
-            self.logger.error(f"Error parsing JSON in {file_path}")
-        except Exception as e:
-            self.logger.error(f"Error loading investigators from {file_path}: {str(e)}")
+            except json.JSONDecodeError:
+                self.logger.error(f"Error parsing JSON in {file_path}")
+            except Exception as e:
+                self.logger.error(f"Error loading investigators from {file_path}: {str(e)}")
 
     def _process_investigator_data(self, investigator_data: Dict[str, Any]) -> None:
         """
@@ -127,9 +156,10 @@ class InvestigatorFactory:
                 max_health=investigator_data["max_health"],
                 sanity=investigator_data["max_sanity"],
                 max_sanity=investigator_data["max_sanity"],
-                skills=investigator_data["skills"],
+                skills=dict(investigator_data["skills"]),
                 clue_tokens=investigator_data.get("starting_clues", 0),
                 current_location=investigator_data.get("starting_location", "London"),
+                investigator_id=investigator_id,
             )
         except Exception as e:
             self.logger.error(
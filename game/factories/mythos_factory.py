@@ -2,10 +2,23 @@ import json
 import logging
 import random
 
+from concurrent.futures import Executor
 from typing import Optional
 
 from game.entities.cards.mythos import MythosCard
 from game.entities.components.component_factory import create_component
+from game.factories.content_files import (
+    ContentFile,
+    read_content_file,
+    read_content_files,
+)
+
+# Mythos card files by card color
+MYTHOS_FILES = {
+    "blue": "game/data/mythos/blue.json",
+    "yellow": "game/data/mythos/yellow.json",
+    "green": "game/data/mythos/green.json",
+}
 
 
 class MythosFactory:
@@ -15,7 +28,7 @@ class MythosFactory:
         self.yellow_cards = []
         self.green_cards = []
 
-    def get_cards(self, color, count, difficulty):
+    def get_cards(self, color, count, difficulty, rng=None):
         """
         Get the specified number of cards of the specified color and difficulty.
 
@@ -23,6 +36,7 @@ class MythosFactory:
             color: The color of cards to get ("blue", "yellow", or "green")
             count: The number of cards to get
             difficulty: The difficulty level to filter by
+            rng: Random source for the sample, defaults to the random module
 
         Returns:
             A list of MythosCard objects
@@ -56,34 +70,40 @@ class MythosFactory:
         if filtered_pool:
             # Don't try to get more cards than are available
             count = min(count, len(filtered_pool))
-            cards = random.sample(filtered_pool, count)
+            cards = (rng or random).sample(filtered_pool, count)
 
         return cards
 
-    def load_all_mythos_cards(self):
-        # Load all mythos cards frmo JSON files
-        self._load_mythos_cards_from_file("game/data/mythos/blue.json", "blue")
-        self._load_mythos_cards_from_file("game/data/mythos/yellow.json", "yellow")
-        self._load_mythos_cards_from_file("game/data/mythos/green.json", "green")
+    def load_all_mythos_cards(self, executor: Optional[Executor] = None):
+        # Load all mythos cards from JSON files, reading the colors at once
+        # on the executor if one is given
+        files = read_content_files(MYTHOS_FILES.values(), executor)
+        for color, content in zip(MYTHOS_FILES, files):
+            self._load_mythos_cards(content, color)
 
     def _load_mythos_cards_from_file(self, file_path, color):
         # Load mythos cards from a single JSON file
+        self._load_mythos_cards(read_content_file(file_path), color)
+
+    def _load_mythos_cards(self, content: ContentFile, color):
+        # Create the mythos cards of a parsed file
+        file_path = content.path
         try:
-            with open(file_path, "r") as file:
-                cards_data = json.load(file)
-
-                # Process each card
-                for card_data in cards_data:
-                    card = self._process_card_data(card_data)
-                    if card:
-                        if color == "blue":
-                            self.blue_cards.append(card)
-                        elif color == "yellow":
-                            self.yellow_cards.append(card)
-                        elif color == "green":
-                            self.green_cards.append(card)
-
-                self.logger.info("Loaded mythos cards from: %s", file_path)
+            if content.error:
+                raise content.error
+
+            # Process each card
+            for card_data in content.data:
+                card = self._process_card_data(card_data)
+                if card:
+                    if color == "blue":
+                        self.blue_cards.append(card)
+                    elif color == "yellow":
+                        self.yellow_cards.append(card)
+                    elif color == "green":
+                        self.green_cards.append(card)
+
+            self.logger.info("Loaded mythos cards from: %s", file_path)
         except json.JSONDecodeError:
             self.logger.error("Error parsing JSON in %s", file_path)
         except Exception as e:
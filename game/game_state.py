@@ -1,17 +1,16 @@
-import json
 from typing import List, Optional, Dict, Any
+from game.entities.base.observable import Observable
 from game.entities.location import Location, LocationType
 from game.entities.player import Player
-from game.factories.encounter_factory import EncounterFactory
-from game.factories.asset_factory import AssetFactory
-from game.factories.condition_factory import ConditionFactory
-from game.factories.investigator_factory import InvestigatorFactory
-from game.factories.mythos_factory import MythosFactory
+from game.systems.content_catalog import ContentCatalog
 from game.entities.cards.asset_deck import AssetDeck
 from game.entities.cards.condition_deck import ConditionDeck
 from game.entities.cards.encounter_deck import EncounterDeck
 from game.systems.player_manager import PlayerManager
 from game.systems.investigator_selector import InvestigatorSelector
+from game.systems.encounter_registry import EncounterDeckRegistry
+from game.systems.encounter_availability import EncounterAvailability
+from game.systems.game_random import GameRandom
 from game.enums import (
     Expansion,
     GamePhase,
@@ -25,32 +24,30 @@ from game.enums import (
 )
 
 
-class GameState:
+class GameState(Observable):
     """
     Core game state manager, tracks all game variables
     """
 
-    def __init__(self):
+    def __init__(self, catalog: Optional[ContentCatalog] = None):
         self.doom_track = 0
         self.max_doom = 15
         self.mysteries_solved = 0
         self.current_phase = GamePhase.ACTION
+        self.round_number = 1
         self.defeated_investigators = []
         self.ancient_one = None
-        self.mythos_deck = None
-
-        # Initialize factories
-        self.encounter_factory = EncounterFactory()
-        self.encounter_factory.load_all_encounter_types()
 
-        self.asset_factory = AssetFactory()
-        self.asset_factory.load_all_assets()
-
-        self.condition_factory = ConditionFactory()
-        self.condition_factory.load_all_conditions()
+        # Source of all randomness in this game, see GameRandom
+        self.rng = GameRandom()
+        self.mythos_deck = None
 
-        self.investigator_factory = InvestigatorFactory()
-        self.investigator_factory.load_all_investigators()
+        # Initialize factories, from a catalog shared with other games if given
+        self.catalog = catalog or ContentCatalog()
+        self.encounter_factory = self.catalog.encounter_factory
+        self.asset_factory = self.catalog.asset_factory
+        self.condition_factory = self.catalog.condition_factory
+        self.investigator_factory = self.catalog.investigator_factory
 
         self._mythos_factory = None
 
@@ -62,6 +59,8 @@ class GameState:
         self.asset_deck = None
         self.condition_deck = None
         self.encounter_decks = {}  # Dict of encounter_type -> EncounterDeck
+        self.encounter_registry = EncounterDeckRegistry.create_default()
+        self.encounter_availability = EncounterAvailability(self)
 
         self.locations = {}
         self.players = []  # List of Player objects
@@ -76,9 +75,8 @@ class GameState:
         This property getter is called whenever code accesses self.mythos_factory
         """
         if self._mythos_factory is None:
-            # Create and initialize the factory only on first access
-            self._mythos_factory = MythosFactory()
-            self._mythos_factory.load_all_mythos_cards()
+            # The catalog loads the factory on first access
+            self._mythos_factory = self.catalog.mythos_factory
         return self._mythos_factory
 
     def reset_game(self, player_count: int = 1):
@@ -91,6 +89,7 @@ class GameState:
         self.doom_track = 0
         self.mysteries_solved = 0
         self.current_phase = GamePhase.ACTION
+        self.round_number = 1
         self.defeated_investigators = []
 
         # Initialize all decks
@@ -110,7 +109,7 @@ class GameState:
         all_assets = list(self.asset_factory.assets.values())
 
         # Create the asset deck
-        self.asset_deck = AssetDeck(all_assets)
+        self.asset_deck = AssetDeck(all_assets, rng=self.rng)
 
         # Shuffle the deck
         self.asset_deck.shuffle()
@@ -119,24 +118,42 @@ class GameState:
         self.asset_deck.setup_reserve(4)
 
     def load_locations(self):
-        """Load location data from JSON file."""
-        with open("game/data/locations.json", "r") as file:
-            location_data = json.load(file)
-
+        """Create the locations from the catalog's location data."""
         self.locations = {}
-        for name, data in location_data.items():
+        for name, data in self.catalog.location_data.items():
             location_type = LocationType[data.get("location_type", "CITY")]
+            # Copy the route lists so games never share them
             self.locations[name] = Location(
                 name=name,
                 description=data["description"],
-                connections=data["connections"],
+                connections=list(data["connections"]),
                 location_type=location_type,
-                train_paths=data.get("train_paths"),
-                ship_paths=data.get("ship_paths"),
+                train_paths=list(data.get("train_paths") or []),
+                ship_paths=list(data.get("ship_paths") or []),
                 real_world_location=data.get("real_world_location"),
                 continent=data.get("continent"),
             )
 
+        self.encounter_availability.reset()
+
+    def spawn_clue(self) -> Optional[str]:
+        """
+        Place a clue on a random location that doesn't already have one.
+
+        Returns:
+            Name of the location the clue was placed on, or None if every
+            location already has a clue
+        """
+        candidates = [
+            name for name, location in self.locations.items() if not location.has_clue
+        ]
+        if not candidates:
+            return None
+
+        location_name = self.rng.choice(candidates)
+        self.locations[location_name].add_clue()
+        return location_name
+
     def reset_action_phase(self):
         """Reset to the action phase and restore actions."""
         self.current_phase = GamePhase.ACTION
@@ -146,6 +163,40 @@ class GameState:
         if current_player and current_player.investigator:
             current_player.investigator.actions = 2
 
+    def get_current_investigator(self):
+        """
+        Get the investigator controlled by the current player.
+
+        Returns:
+            The current investigator, or None if there is no current player
+        """
+        current_player = self.player_manager.get_current_player()
+        if not current_player:
+            return None
+        return current_player.investigator
+
+    def move_investigator(self, investigator, destination: str) -> None:
+        """
+        Move an investigator to a new location.
+
+        Args:
+            investigator: The investigator to move
+            destination: Name of the destination location
+        """
+        origin = investigator.current_location
+        investigator.current_location = destination
+        self.encounter_availability.investigator_moved(investigator, origin)
+
+    def defeat_investigator(self, investigator) -> None:
+        """
+        Mark an investigator as defeated, leaving them on their current space.
+
+        Args:
+            investigator: The defeated investigator
+        """
+        self.defeated_investigators.append(investigator)
+        self.encounter_availability.add_defeated_investigator(investigator)
+
     def advance_to_next_player(self):
         """
         Advance to the next player's turn.
@@ -161,33 +212,40 @@ class GameState:
         all_conditions = list(self.condition_factory.conditions.values())
 
         # Create the condition deck
-        self.condition_deck = ConditionDeck(all_conditions)
+        self.condition_deck = ConditionDeck(all_conditions, rng=self.rng)
 
         # Shuffle the deck
         self.condition_deck.shuffle()
 
     def _setup_encounter_decks(self):
         """Set up encounter decks for each encounter type."""
-        # Clear existing decks
-        self.encounter_decks = {}
+        # Build the decks before replacing the old ones, so observers of
+        # encounter_decks see the complete set
+        encounter_decks = {}
 
         # Create a deck for each encounter type
         for encounter_type in EncounterType:
             encounter_type_str = encounter_type.value
 
-            # Get all encounters of this type from the factory
-            encounters = []
-            if encounter_type_str in self.encounter_factory.encounters:
-                encounters = self.encounter_factory.encounters[encounter_type_str]
+            # Get all encounters of this type from the factory, loading them
+            # on first use. Copy the list so drawing doesn't remove cards
+            # from the factory
+            encounters = list(
+                self.encounter_factory.get_all_encounters_by_type(encounter_type_str)
+            )
 
             # Create and shuffle the deck
             deck = EncounterDeck(
-                encounters, f"{encounter_type_str.capitalize()} Encounters"
+                encounters,
+                f"{encounter_type_str.capitalize()} Encounters",
+                rng=self.rng,
             )
             deck.shuffle()
 
             # Store in the dictionary
-            self.encounter_decks[encounter_type_str] = deck
+            encounter_decks[encounter_type_str] = deck
+
+        self.encounter_decks = encounter_decks
 
     def draw_encounter(self, encounter_type: str, subtype: Optional[str] = None):
         """
@@ -0,0 +1,113 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, IO, List, Union
+
+try:
+    import orjson
+except ImportError:
+    # Without orjson, the standard library parses and writes JSON
+    orjson = None
+
+# Raised by loads() for malformed JSON, whichever backend is active.
+# orjson's decode error is a subclass of it
+JSONDecodeError = json.JSONDecodeError
+
+
+@dataclass(frozen=True)
+class JsonBackend:
+    """A JSON library: compact str output and parsing of str or bytes."""
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any], str]
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+BACKENDS: Dict[str, JsonBackend] = {
+    "json": JsonBackend("json", json.loads, _stdlib_dumps),
+}
+
+if orjson is not None:
+
+    def _orjson_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    BACKENDS["orjson"] = JsonBackend("orjson", orjson.loads, _orjson_dumps)
+
+# The fastest available backend is used unless set_backend() picks another
+_backend = BACKENDS.get("orjson", BACKENDS["json"])
+
+
+def available_backends() -> List[str]:
+    """Names of the installed backends, the standard library's first."""
+    return list(BACKENDS)
+
+
+def get_backend() -> JsonBackend:
+    """The backend loads() and dumps() use."""
+    return _backend
+
+
+def set_backend(name: str) -> JsonBackend:
+    """
+    Choose the backend loads() and dumps() use.
+
+    Args:
+        name: Name of an installed backend, e.g. "json" or "orjson"
+
+    Returns:
+        The previously active backend
+
+    Raises:
+        ValueError: If the backend is not installed
+    """
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(
+            f"JSON backend {name!r} is not installed, choose from "
+            f"{', '.join(BACKENDS)}"
+        )
+    previous, _backend = _backend, BACKENDS[name]
+    return previous
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text.
+
+    Args:
+        data: The text, as str or UTF-8 bytes
+
+    Returns:
+        The parsed value
+
+    Raises:
+        JSONDecodeError: If the text is not valid JSON
+    """
+    return _backend.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Write a value as compact JSON text.
+
+    Args:
+        obj: JSON-compatible value
+
+    Returns:
+        The JSON text, without whitespace between tokens
+    """
+    return _backend.dumps(obj)
+
+
+def load(file: IO) -> Any:
+    """Parse the JSON text of an open text or binary file."""
+    return loads(file.read())
+
+
+def dump(obj: Any, file: IO[str]) -> None:
+    """Write a value as compact JSON text to an open text file."""
+    file.write(dumps(obj))
@@ -0,0 +1,47 @@
+import importlib
+from typing import Any, Optional
+
+
+class LazyImport:
+    """
+    Stand-in for a module, or a name in a module, imported on first use.
+
+    Attribute access and calls are passed on to the imported object, so
+
+        Panel = LazyImport("rich.panel", "Panel")
+
+    can be used like `from rich.panel import Panel`, but rich is only
+    imported when Panel is first used. A missing module raises its
+    ImportError at that point instead of when the importing module loads.
+    """
+
+    def __init__(self, module: str, name: Optional[str] = None):
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def resolve(self) -> Any:
+        """Import the module if needed and get the object it stands for."""
+        if self._target is None:
+            target = importlib.import_module(self._module)
+            if self._name is not None:
+                target = getattr(target, self._name)
+            self._target = target
+        return self._target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        target = f"{self._module}.{self._name}" if self._name else self._module
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyImport {target} ({state})>"
@@ -1,15 +1,37 @@
 """Action phase implementation"""
 
 from game.phases.base_phase import GamePhase
-from game.enums import GamePhase as GamePhaseEnum, TicketType
+from game.enums import TicketType
+from game.systems.decisions import YES_NO, DecisionRequest
 from game.systems.player_manager import PlayerManager
 from game.entities.player import Player
 
 
+# Answers to the action menu
+ACTION_OPTIONS = ["1", "2", "3", "4", "5", "6", "7", "9"]
+
+
+def _destination_options(destinations):
+    """Answers to a travel menu: "0" to cancel or a destination number."""
+    return ["0"] + [str(i + 1) for i in range(len(destinations))]
+
+
+def _destination_labels(destinations):
+    """What the answers to a travel menu stand for, None for cancel."""
+    return [None] + list(destinations)
+
+
+def _ticket_destination(destinations, answer):
+    """The destination a ticket travel menu answer picks, None for cancel."""
+    if answer and answer != "0":
+        return destinations[int(answer) - 1]
+    return None
+
+
 class ActionPhase(GamePhase):
     """Handles the Action phase of the game."""
 
-    def execute(self):
+    def turn(self):
         self.state.reset_action_phase()
 
         # Get player manager directly
@@ -28,16 +50,18 @@ class ActionPhase(GamePhase):
 
         # Process player actions
         while current_player.investigator.actions > 0:
-            choice = self.ui.show_action_phase(self.state)
+            choice = yield DecisionRequest(
+                "show_action_phase", (self.state,), ACTION_OPTIONS
+            )
 
             if choice == "1":
-                self.travel_action(current_player)
+                yield from self.travel_action(current_player)
             elif choice == "2":
                 self.rest_action(current_player)
             elif choice == "3":
                 self.trade_action(current_player)
             elif choice == "4":
-                self.prepare_for_travel_action(current_player)
+                yield from self.prepare_for_travel_action(current_player)
             elif choice == "5":
                 self.acquire_assets_action(current_player)
             elif choice == "6":
@@ -50,24 +74,6 @@ class ActionPhase(GamePhase):
         # Show final location view before advancing to the next phase
         self.ui.show_action_phase(self.state)
 
-        # If we have multiple players, advance to the next player
-        if len(self.state.players) > 1:
-            # If this is the last player, advance to Encounter phase
-            next_player = self.state.advance_to_next_player()
-            if next_player == player_manager.get_lead_investigator():
-                self.state.current_phase = GamePhaseEnum.ENCOUNTER
-                self.ui.show_message("Advancing to Encounter Phase...")
-            else:
-                # Stay in Action phase for the next player
-                self.ui.show_message(f"Next player's turn: {next_player.name}")
-                # Reset actions for the next player
-                if next_player.investigator:
-                    next_player.investigator.actions = 2
-        else:
-            # Single player, advance to Encounter phase
-            self.state.current_phase = GamePhaseEnum.ENCOUNTER
-            self.ui.show_message("Advancing to Encounter Phase...")
-
     def travel_action(self, player: Player, ticket_used=False):
         """Travel between locations."""
         if not player or not player.investigator:
@@ -75,7 +81,13 @@ class ActionPhase(GamePhase):
             return
 
         investigator = player.investigator
-        choice = self.ui.show_travel_menu(self.state)
+        connections = self.state.locations[investigator.current_location].connections
+        choice = yield DecisionRequest(
+            "show_travel_menu",
+            (self.state,),
+            _destination_options(connections),
+            _destination_labels(connections),
+        )
         if choice == "0":
             return
 
@@ -86,22 +98,26 @@ class ActionPhase(GamePhase):
 
             if 0 <= choice_idx < len(connections):
                 destination = connections[choice_idx]
+                if destination not in self.state.locations:
+                    # Some routes lead to locations missing from the board data
+                    self.ui.show_message(f"{destination} is not on the board.")
+                    return
 
                 # If using a ticket, don't consume an action
                 if ticket_used:
-                    investigator.current_location = destination
+                    self.state.move_investigator(investigator, destination)
                     self.ui.show_message(f"Traveling to {destination}...")
                 # Otherwise, use an action
                 elif investigator.actions > 0:
                     investigator.actions -= 1
-                    investigator.current_location = destination
+                    self.state.move_investigator(investigator, destination)
                     self.ui.show_message(f"Traveling to {destination}...")
                 else:
                     self.ui.show_message("No actions remaining.")
                     return
 
                 # Check for additional travel options with tickets
-                self.offer_ticket_travel(player)
+                yield from self.offer_ticket_travel(player)
             else:
                 self.ui.show_message("Invalid location choice.")
         except ValueError:
@@ -120,48 +136,64 @@ class ActionPhase(GamePhase):
         # Check for train connections
         train_paths = location.train_paths
         if train_paths and investigator.train_tickets > 0:
-            use_train = self.ui.ask_yes_no(
-                f"You have {investigator.train_tickets} train tickets. "
-                f"Use one to travel by train?"
+            use_train = yield DecisionRequest(
+                "ask_yes_no",
+                (
+                    f"You have {investigator.train_tickets} train tickets. "
+                    f"Use one to travel by train?",
+                ),
+                YES_NO,
             )
             if use_train:
-                train_destination = self.ui.show_ticket_travel_menu(
-                    self.state, TicketType.TRAIN.value, train_paths
+                train_destination = yield DecisionRequest(
+                    "show_ticket_travel_menu",
+                    (self.state, TicketType.TRAIN.value, train_paths),
+                    _destination_options(train_paths),
+                    _destination_labels(train_paths),
                 )
-                if train_destination and train_destination != "0":
-                    if investigator.use_ticket(TicketType.TRAIN.value, 1):
-                        investigator.current_location = train_paths[
-                            int(train_destination) - 1
-                        ]
-                        self.ui.show_message(
-                            f"Traveling by train to {investigator.current_location}..."
-                        )
-                        # Recursively offer more ticket travel options
-                        self.offer_ticket_travel(player)
-                        return
+                destination = _ticket_destination(train_paths, train_destination)
+                if destination not in self.state.locations:
+                    if destination:
+                        self.ui.show_message(f"{destination} is not on the board.")
+                elif investigator.use_ticket(TicketType.TRAIN.value, 1):
+                    self.state.move_investigator(investigator, destination)
+                    self.ui.show_message(
+                        f"Traveling by train to {investigator.current_location}..."
+                    )
+                    # Recursively offer more ticket travel options
+                    yield from self.offer_ticket_travel(player)
+                    return
 
         # Check for ship connections
         ship_paths = location.ship_paths
         if ship_paths and investigator.ship_tickets > 0:
-            use_ship = self.ui.ask_yes_no(
-                f"You have {investigator.ship_tickets} ship tickets. "
-                f"Use one to travel by ship?"
+            use_ship = yield DecisionRequest(
+                "ask_yes_no",
+                (
+                    f"You have {investigator.ship_tickets} ship tickets. "
+                    f"Use one to travel by ship?",
+                ),
+                YES_NO,
             )
             if use_ship:
-                ship_destination = self.ui.show_ticket_travel_menu(
-                    self.state, TicketType.SHIP.value, ship_paths
+                ship_destination = yield DecisionRequest(
+                    "show_ticket_travel_menu",
+                    (self.state, TicketType.SHIP.value, ship_paths),
+                    _destination_options(ship_paths),
+                    _destination_labels(ship_paths),
                 )
-                if ship_destination and ship_destination != "0":
-                    if investigator.use_ticket(TicketType.SHIP.value, 1):
-                        investigator.current_location = ship_paths[
-                            int(ship_destination) - 1
-                        ]
-                        self.ui.show_message(
-                            f"Traveling by ship to {investigator.current_location}..."
-                        )
-                        # Recursively offer more ticket travel options
-                        self.offer_ticket_travel(player)
-                        return
+                destination = _ticket_destination(ship_paths, ship_destination)
+                if destination not in self.state.locations:
+                    if destination:
+                        self.ui.show_message(f"{destination} is not on the board.")
+                elif investigator.use_ticket(TicketType.SHIP.value, 1):
+                    self.state.move_investigator(investigator, destination)
+                    self.ui.show_message(
+                        f"Traveling by ship to {investigator.current_location}..."
+                    )
+                    # Recursively offer more ticket travel options
+                    yield from self.offer_ticket_travel(player)
+                    return
 
     def rest_action(self, player: Player):
         """Rest to recover health and sanity."""
@@ -209,7 +241,10 @@ class ActionPhase(GamePhase):
         investigator = player.investigator
         if investigator.actions > 0:
             investigator.actions -= 1
-            ticket_type = self.ui.show_ticket_choice()
+            ticket_type = yield DecisionRequest(
+                "show_ticket_choice",
+                options=[TicketType.TRAIN.value, TicketType.SHIP.value],
+            )
             if ticket_type == TicketType.TRAIN.value:
                 investigator.add_ticket(TicketType.TRAIN.value, 1)
                 self.ui.show_message("You prepare for travel and gain a train ticket.")
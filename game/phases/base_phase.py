@@ -1,5 +1,7 @@
 """Base class for game phases"""
 
+from game.systems.decisions import drive
+
 
 class GamePhase:
     def __init__(self, engine, state, ui):
@@ -8,5 +10,13 @@ class GamePhase:
         self.ui = ui
 
     def execute(self):
-        """Execute this phase's logic. Must be implemented by subclasses."""
+        """Execute this phase's logic, answering every decision with the UI."""
+        return drive(self.turn(), self.ui)
+
+    def turn(self):
+        """
+        Play the current player's turn in this phase as a generator that
+        yields a DecisionRequest for every decision. Must be implemented by
+        subclasses.
+        """
         raise NotImplementedError
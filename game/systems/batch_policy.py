@@ -0,0 +1,178 @@
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from game.systems.decisions import DecisionRequest
+
+try:
+    import numpy as np
+except ImportError:
+    # Without NumPy, options are scored one request at a time
+    np = None
+
+# Features of every option of a request, one list of floats per option
+FeatureFunction = Callable[[DecisionRequest], List[List[float]]]
+
+
+@dataclass
+class DecisionKind:
+    """How a bot scores the options of one kind of decision."""
+
+    features: FeatureFunction
+    # One weight per feature; an option's score is its features . weights
+    weights: List[float]
+
+
+def yes_no_features(request: DecisionRequest) -> List[List[float]]:
+    """Features of a yes/no answer: [yes]."""
+    return [[1.0 if option else 0.0] for option in request.options]
+
+
+def destination_features(request: DecisionRequest) -> List[List[float]]:
+    """
+    Features of a travel destination:
+    [cancel, has clue, has gate, has rumor, monsters].
+    """
+    state = request.args[0]
+    labels = request.labels or [None] * len(request.options)
+    rows = []
+    for destination in labels:
+        location = state.locations.get(destination) if destination else None
+        if location is None:
+            rows.append([1.0, 0.0, 0.0, 0.0, 0.0])
+            continue
+        rows.append(
+            [
+                0.0,
+                float(location.has_clue),
+                float(location.has_gate),
+                float(location.has_rumor),
+                float(len(location.monsters)),
+            ]
+        )
+    return rows
+
+
+def encounter_deck_features(request: DecisionRequest) -> List[List[float]]:
+    """
+    Features of an encounter deck label:
+    [general, rumor or investigator, expected score].
+
+    The expected score is the deck's EncounterStatsTable.rank_decks() score
+    for the investigator, which the encounter phase sends with the request,
+    or 0 without encounter statistics.
+    """
+    scores = request.args[2] if len(request.args) > 2 else None
+    scores = scores or [0.0] * len(request.options)
+    return [
+        [1.0 if label == "General" else 0.0, 1.0 if ": " in label else 0.0, score]
+        for label, score in zip(request.options, scores)
+    ]
+
+
+DESTINATION_KIND = DecisionKind(destination_features, [-1.0, 1.0, 0.5, 0.5, -0.5])
+
+# Decisions scored by default, by the UI method that asks them
+DEFAULT_KINDS: Dict[str, DecisionKind] = {
+    "ask_yes_no": DecisionKind(yes_no_features, [0.5]),
+    "show_travel_menu": DESTINATION_KIND,
+    "show_ticket_travel_menu": DESTINATION_KIND,
+    "show_choose_encounter": DecisionKind(
+        encounter_deck_features, [-0.25, 1.0, 1.0]
+    ),
+}
+
+
+def first_options(batch: List[Tuple[int, DecisionRequest]]) -> List[Any]:
+    """Answer every request with its first option, or None if it has none."""
+    return [request.options[0] if request.options else None for _, request in batch]
+
+
+class BatchPolicy:
+    """
+    Bot policy for a GameScheduler that answers decisions in bulk.
+
+    The waiting requests of a batch are grouped by the UI method that asks
+    them. Every group with a DecisionKind is scored in a single NumPy
+    evaluation: the option features of all its requests are stacked into
+    one (requests, options, features) array, multiplied by the weights and
+    reduced with argmax. Other requests go to the fallback policy.
+
+    Small random noise breaks ties, so bots with the same weights still
+    make different choices.
+    """
+
+    def __init__(
+        self,
+        kinds: Optional[Dict[str, DecisionKind]] = None,
+        noise: float = 0.1,
+        seed: Optional[int] = None,
+        fallback: Callable[[List[Tuple[int, DecisionRequest]]], List[Any]] = first_options,
+    ):
+        self.kinds = DEFAULT_KINDS if kinds is None else kinds
+        self.noise = noise
+        self.rng = np.random.default_rng(seed) if np else random.Random(seed)
+        self.fallback = fallback
+
+        # Number of scoring passes, one per decision kind per batch
+        self.evaluations = 0
+
+    def __call__(self, batch: List[Tuple[int, DecisionRequest]]) -> List[Any]:
+        answers: List[Any] = [None] * len(batch)
+        groups: Dict[str, List[int]] = {}
+        others: List[int] = []
+        for position, (_, request) in enumerate(batch):
+            if request.options and request.method in self.kinds:
+                groups.setdefault(request.method, []).append(position)
+            else:
+                others.append(position)
+
+        for method, positions in groups.items():
+            requests = [batch[position][1] for position in positions]
+            choices = self.choose(self.kinds[method], requests)
+            for position, request, choice in zip(positions, requests, choices):
+                answers[position] = request.options[choice]
+
+        if others:
+            fallback_answers = self.fallback([batch[position] for position in others])
+            for position, answer in zip(others, fallback_answers):
+                answers[position] = answer
+
+        return answers
+
+    def choose(self, kind: DecisionKind, requests: List[DecisionRequest]) -> List[int]:
+        """
+        Pick the best option of every request of one kind.
+
+        Args:
+            kind: How to score the requests
+            requests: Requests that all have options
+
+        Returns:
+            Index of the chosen option for each request
+        """
+        self.evaluations += 1
+        features = [kind.features(request) for request in requests]
+        if np is None:
+            return [self._choose_one(kind, rows) for rows in features]
+
+        width = max(len(rows) for rows in features)
+        matrix = np.zeros((len(features), width, len(kind.weights)))
+        valid = np.zeros((len(features), width), dtype=bool)
+        for row, rows in enumerate(features):
+            matrix[row, : len(rows)] = rows
+            valid[row, : len(rows)] = True
+
+        scores = matrix @ np.asarray(kind.weights, dtype=float)
+        if self.noise:
+            scores += self.noise * self.rng.random(scores.shape)
+        scores[~valid] = -np.inf
+        return scores.argmax(axis=1).tolist()
+
+    def _choose_one(self, kind: DecisionKind, rows: List[List[float]]) -> int:
+        scores = [
+            sum(value * weight for value, weight in zip(row, kind.weights))
+            + self.noise * self.rng.random()
+            for row in rows
+        ]
+        return max(range(len(scores)), key=scores.__getitem__)
@@ -0,0 +1,90 @@
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from game.factories.asset_factory import AssetFactory
+from game.factories.condition_factory import ConditionFactory
+from game.factories.content_files import read_content_files
+from game.factories.encounter_factory import EncounterFactory
+from game.factories.investigator_factory import InvestigatorFactory
+from game.factories.mythos_factory import MythosFactory
+from game.systems.encounter_stats import EncounterStatsTable
+
+LOCATIONS_FILE = "game/data/locations.json"
+
+# Threads reading data files, None for the executor's default and 0 to
+# read them in turn on the calling thread
+LOAD_WORKERS = None
+
+
+class ContentCatalog:
+    """
+    Card and board data loaded from the data files.
+
+    Every GameState reads its factories and location data from a catalog.
+    A process hosting many games loads one catalog and passes it to each
+    GameState, so the data files are read and parsed once. Games only read
+    the catalog: decks copy the factory card lists, locations and
+    investigators are built per game, and cards are not changed in play.
+
+    Encounter cards are loaded per encounter type the first time a deck of
+    that type is built, and the mythos cards and encounter statistics on
+    first use, so a process that never starts a game does not parse them.
+
+    The data files are read and parsed on a thread pool: the files of every
+    factory are submitted together, then each factory builds its cards from
+    its results on the calling thread. Loading waits on the slowest file
+    rather than on the sum of all of them.
+    """
+
+    def __init__(self, max_workers: Optional[int] = LOAD_WORKERS):
+        self.max_workers = max_workers
+        self.encounter_factory = EncounterFactory()
+        self.asset_factory = AssetFactory()
+        self.condition_factory = ConditionFactory()
+        self.investigator_factory = InvestigatorFactory()
+
+        with self._read_pool() as executor:
+            assets = read_content_files(self.asset_factory.asset_files(), executor)
+            conditions = read_content_files(
+                self.condition_factory.condition_files(), executor
+            )
+            investigators = read_content_files(
+                self.investigator_factory.investigator_files(), executor
+            )
+            locations = read_content_files([LOCATIONS_FILE], executor)
+
+            self.asset_factory.load_asset_files(assets)
+            self.condition_factory.load_condition_files(conditions)
+            self.investigator_factory.load_investigator_files(investigators)
+            location_file = next(locations)
+            if location_file.error:
+                raise location_file.error
+            self.location_data: Dict[str, Dict[str, Any]] = location_file.data
+
+        self._mythos_factory: Optional[MythosFactory] = None
+        self._encounter_stats: Optional[EncounterStatsTable] = None
+
+    @property
+    def mythos_factory(self) -> MythosFactory:
+        """The mythos factory, loaded on first use."""
+        if self._mythos_factory is None:
+            mythos_factory = MythosFactory()
+            with self._read_pool() as executor:
+                mythos_factory.load_all_mythos_cards(executor)
+            self._mythos_factory = mythos_factory
+        return self._mythos_factory
+
+    @property
+    def encounter_stats(self) -> EncounterStatsTable:
+        """The precomputed encounter statistics, loaded on first use."""
+        if self._encounter_stats is None:
+            self._encounter_stats = EncounterStatsTable.load()
+        return self._encounter_stats
+
+    def _read_pool(self):
+        if self.max_workers == 0:
+            return contextlib.nullcontext()
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="content-loader"
+        )
@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, List, Optional
+
+# Answers for requests that ask a yes/no question
+YES_NO = [True, False]
+
+# UI methods whose return value drives the game
+DECISION_METHODS = frozenset(
+    {
+        "show_main_menu",
+        "show_player_count_selection",
+        "show_player_name_entry",
+        "show_investigator_selection",
+        "show_investigator_details",
+        "show_ancient_one_selection",
+        "show_ancient_one_details",
+        "show_action_phase",
+        "show_travel_menu",
+        "show_ticket_travel_menu",
+        "show_ticket_choice",
+        "show_choose_encounter",
+        "show_choice",
+        "ask_yes_no",
+        "input",
+    }
+)
+
+
+@dataclass
+class DecisionRequest:
+    """
+    A decision a game is waiting on.
+
+    Phases, components and the engine are generators that yield a request
+    for every decision and are resumed with the answer. A request names
+    the UI method that answers it, so a UI resolves it by calling that
+    method with args. Bots and network clients can use options instead:
+    the legal answers, when the game knows them up front, and labels:
+    what each option stands for, e.g. the destination of a travel option.
+    """
+
+    method: str
+    args: tuple = ()
+    options: Optional[List[Any]] = None
+    labels: Optional[List[Any]] = None
+
+    def ask(self, ui) -> Any:
+        """
+        Answer the request with a UI.
+
+        UIs whose class defines answer(request), like NullUI, are handed
+        the whole request. Others are called through the method it names.
+
+        Args:
+            ui: The UI to ask, or None to answer None
+
+        Returns:
+            The answer
+        """
+        if ui is None:
+            return None
+        answer = getattr(type(ui), "answer", None)
+        if answer is not None:
+            return answer(ui, self)
+        return getattr(ui, self.method)(*self.args)
+
+
+# Generator that yields DecisionRequests and returns a result
+Decisions = Generator[DecisionRequest, Any, Any]
+
+
+def drive(decisions: Decisions, ui) -> Any:
+    """
+    Run a decision generator to completion, answering with a UI.
+
+    Args:
+        decisions: The generator to run
+        ui: The UI that answers every request, or None to answer None
+
+    Returns:
+        The generator's return value
+    """
+    try:
+        request = next(decisions)
+        while True:
+            request = decisions.send(request.ask(ui))
+    except StopIteration as stop:
+        return stop.value
+
+
+def report_answers(decisions: Decisions, listeners: List[Callable]) -> Decisions:
+    """
+    Pass a decision generator through, reporting every answer sent back.
+
+    Whoever drives the returned generator, a UI through drive() or a
+    scheduler sending answers in, each answer is reported to the listeners
+    as listener(request, answer) before it resumes the wrapped generator.
+
+    Args:
+        decisions: The generator to wrap
+        listeners: The callbacks to report answers to. Read on every answer,
+            so listeners added later are reported to as well
+
+    Returns:
+        The wrapped generator's return value
+    """
+    try:
+        request = next(decisions)
+        while True:
+            answer = yield request
+            for listener in listeners:
+                listener(request, answer)
+            request = decisions.send(answer)
+    except StopIteration as stop:
+        return stop.value
@@ -0,0 +1,176 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from game.entities.investigator import Investigator
+from game.entities.location import Location
+
+EncounterOption = Tuple[str, str]
+
+
+class EncounterAvailability:
+    """
+    Caches the encounter decks available at each location.
+
+    Options are rebuilt only when the location's tokens change (tracked by
+    Location.token_revision) or when a defeated investigator is placed on,
+    moved to or removed from the location. A location -> defeated
+    investigators index is kept alongside the cache.
+    """
+
+    def __init__(self, state):
+        self.state = state
+        self.defeated_by_location: Dict[str, List[Investigator]] = {}
+        self._options: Dict[str, Tuple[int, Tuple[EncounterOption, ...]]] = {}
+
+    def reset(self) -> None:
+        """
+        Clear the cache and rebuild the defeated investigator index.
+        """
+        self._options.clear()
+        self.defeated_by_location = {}
+        for investigator in self.state.defeated_investigators:
+            self._index(investigator, investigator.current_location)
+
+    def get_options(self, location_name: str) -> List[EncounterOption]:
+        """
+        Get the encounter decks available at a location.
+
+        Args:
+            location_name: Name of the location
+
+        Returns:
+            List of (label, description) tuples
+        """
+        location: Location = self.state.locations[location_name]
+        cached = self._options.get(location_name)
+        if cached is None or cached[0] != location.token_revision:
+            cached = (location.token_revision, self._build_options(location))
+            self._options[location_name] = cached
+        return list(cached[1])
+
+    def warm(self, location_names: Iterable[str]) -> bool:
+        """
+        Build the options of locations whose cached options are stale.
+
+        Args:
+            location_names: Names of the locations
+
+        Returns:
+            True if any options were built
+        """
+        built = False
+        for location_name in location_names:
+            location = self.state.locations.get(location_name)
+            if location is None:
+                continue
+            cached = self._options.get(location_name)
+            if cached is None or cached[0] != location.token_revision:
+                self.get_options(location_name)
+                built = True
+        return built
+
+    def defeated_at(self, location_name: str) -> List[Investigator]:
+        """
+        Get the defeated investigators at a location.
+
+        Args:
+            location_name: Name of the location
+
+        Returns:
+            List of defeated investigators on that space
+        """
+        return list(self.defeated_by_location.get(location_name, ()))
+
+    def invalidate(self, location_name: Optional[str] = None) -> None:
+        """
+        Drop cached options for a location, or for every location.
+
+        Args:
+            location_name: Location to invalidate, or None for all
+        """
+        if location_name is None:
+            self._options.clear()
+        else:
+            self._options.pop(location_name, None)
+
+    def add_defeated_investigator(self, investigator: Investigator) -> None:
+        """
+        Index a newly defeated investigator at their current location.
+
+        Args:
+            investigator: The defeated investigator
+        """
+        self._index(investigator, investigator.current_location)
+        self.invalidate(investigator.current_location)
+
+    def remove_defeated_investigator(self, investigator: Investigator) -> None:
+        """
+        Remove a defeated investigator from the index.
+
+        Args:
+            investigator: The investigator to remove
+        """
+        self._unindex(investigator, investigator.current_location)
+        self.invalidate(investigator.current_location)
+
+    def investigator_moved(self, investigator: Investigator, origin: str) -> None:
+        """
+        Update the index after an investigator changes location.
+
+        Only defeated investigators affect encounter options, so moves by
+        active investigators leave the cache untouched.
+
+        Args:
+            investigator: The investigator that moved
+            origin: The location the investigator moved from
+        """
+        if not self._unindex(investigator, origin):
+            return
+        self._index(investigator, investigator.current_location)
+        self.invalidate(origin)
+        self.invalidate(investigator.current_location)
+
+    def _index(self, investigator: Investigator, location_name: str) -> None:
+        self.defeated_by_location.setdefault(location_name, []).append(investigator)
+
+    def _unindex(self, investigator: Investigator, location_name: str) -> bool:
+        defeated = self.defeated_by_location.get(location_name)
+        if not defeated:
+            return False
+        for i, inv in enumerate(defeated):
+            if inv is investigator:
+                defeated.pop(i)
+                if not defeated:
+                    del self.defeated_by_location[location_name]
+                return True
+        return False
+
+    def _build_options(self, location: Location) -> Tuple[EncounterOption, ...]:
+        """Build the encounter options for a location from scratch."""
+        registry = self.state.encounter_registry
+
+        # General deck is always available
+        options = [registry.option("General")]
+
+        # Continent-specific deck based on location
+        continent_deck = location.has_continent_encounter_deck()
+        if continent_deck:
+            options.append(registry.option(continent_deck))
+
+        # Special encounter types based on location properties
+        if location.has_clue:
+            options.append(registry.option("Research"))
+
+        if location.has_gate:
+            options.append(registry.option("Other World"))
+
+        if location.has_expedition:
+            options.append(registry.option("Expedition"))
+
+        if location.has_rumor:
+            options.append(registry.option("Rumor", location.rumor_name))
+
+        # Defeated investigators at this location
+        for inv in self.defeated_by_location.get(location.name, ()):
+            options.append(registry.option("Investigator", inv.name))
+
+        return tuple(options)
@@ -0,0 +1,192 @@
+"""
+Encounter deck registry.
+
+Maps the deck keys offered in the encounter phase ("General", "Europe",
+"Rumor: ...") to the deck they draw from and the strategies used to draw
+and discard cards, so new decks can be added without touching the phase.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from game.entities.cards.encounter import Encounter
+from game.enums import EncounterType
+
+# draw(state, deck, investigator) -> encounter or None
+DrawStrategy = Callable[[object, object, object], Optional[Encounter]]
+# discard(deck, encounter) -> None
+DiscardStrategy = Callable[[object, Encounter], None]
+
+
+def draw_top(state, deck, investigator) -> Optional[Encounter]:
+    """Draw the top card of the deck."""
+    return deck.draw() or None
+
+
+def draw_by_location_type(state, deck, investigator) -> Optional[Encounter]:
+    """Draw the first card matching the type of the investigator's location."""
+    location = state.locations[investigator.current_location]
+    return deck.draw_by_location_type(location.location_type)
+
+
+def discard_to_deck(deck, encounter: Encounter) -> None:
+    """Place the resolved encounter on its deck's discard pile."""
+    deck.discard(encounter)
+
+
+@dataclass(frozen=True)
+class EncounterDeckEntry:
+    """A selectable encounter deck and how to resolve it."""
+
+    key: str
+    description: str
+    encounter_type: Optional[str] = None
+    draw: Optional[DrawStrategy] = draw_top
+    discard: Optional[DiscardStrategy] = discard_to_deck
+    takes_argument: bool = False
+    draw_message: str = "Drawing from the {name} encounter deck..."
+    resolved_message: str = "{name} encounter resolved."
+
+    def label(self, argument: Optional[str] = None) -> str:
+        """Get the label shown to the player for this deck."""
+        if self.takes_argument and argument:
+            return f"{self.key}: {argument}"
+        return self.key
+
+
+class EncounterDeckRegistry:
+    """
+    Lookup table of encounter decks keyed by the label shown to the player.
+    """
+
+    def __init__(self, fallback_key: str = "General"):
+        self.entries: Dict[str, EncounterDeckEntry] = {}
+        self.fallback_key = fallback_key
+
+    def register(self, entry: EncounterDeckEntry) -> None:
+        """
+        Register an encounter deck, replacing any entry with the same key.
+
+        Args:
+            entry: The deck entry to register
+        """
+        self.entries[entry.key] = entry
+
+    def get(self, key: str) -> Optional[EncounterDeckEntry]:
+        """
+        Get the entry registered under a key.
+
+        Args:
+            key: Deck key (e.g. "General", "Rumor")
+
+        Returns:
+            The registered entry, or None if not found
+        """
+        return self.entries.get(key)
+
+    def lookup(self, selection: str) -> Tuple[EncounterDeckEntry, Optional[str]]:
+        """
+        Resolve a selected deck label to its entry.
+
+        Labels of entries that take an argument have the form "Key: argument".
+        Unknown labels resolve to the fallback deck.
+
+        Args:
+            selection: The label chosen by the player
+
+        Returns:
+            A tuple of (entry, argument)
+        """
+        entry = self.entries.get(selection)
+        if entry:
+            return entry, None
+
+        key, _, argument = selection.partition(":")
+        entry = self.entries.get(key)
+        if entry and entry.takes_argument:
+            return entry, argument.strip()
+
+        return self.entries[self.fallback_key], None
+
+    def option(self, key: str, argument: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Build the (label, description) pair offered to the player.
+
+        Args:
+            key: Deck key
+            argument: Argument for entries like "Rumor" or "Investigator"
+
+        Returns:
+            A tuple of (label, description)
+        """
+        entry = self.entries[key]
+        return entry.label(argument), entry.description.format(name=argument)
+
+    @classmethod
+    def create_default(cls) -> "EncounterDeckRegistry":
+        """Create a registry with the core game's encounter decks."""
+        registry = cls()
+        registry.register(
+            EncounterDeckEntry(
+                "General",
+                "General encounters that can occur anywhere",
+                EncounterType.GENERAL.value,
+                draw=draw_by_location_type,
+            )
+        )
+        for key, encounter_type in (
+            ("America", EncounterType.AMERICA),
+            ("Europe", EncounterType.EUROPE),
+            ("Asia/Australia", EncounterType.ASIA),
+        ):
+            registry.register(
+                EncounterDeckEntry(
+                    key, f"Encounters specific to {key}", encounter_type.value
+                )
+            )
+        registry.register(
+            EncounterDeckEntry(
+                "Research",
+                "Academic and investigative encounters",
+                EncounterType.RESEARCH.value,
+            )
+        )
+        registry.register(
+            EncounterDeckEntry(
+                "Other World",
+                "Encounters with strange dimensions beyond our own",
+                EncounterType.OTHER_WORLD.value,
+            )
+        )
+        registry.register(
+            EncounterDeckEntry(
+                "Expedition",
+                "Encounters during an active expedition",
+                EncounterType.EXPEDITION.value,
+            )
+        )
+
+        # Placeholders until rumors and defeated investigators are implemented
+        registry.register(
+            EncounterDeckEntry(
+                "Rumor",
+                "Resolve the {name} rumor",
+                draw=None,
+                discard=None,
+                takes_argument=True,
+                draw_message="Resolving the {name} rumor encounter...",
+                resolved_message="Rumor encounter for {name} resolved.",
+            )
+        )
+        registry.register(
+            EncounterDeckEntry(
+                "Investigator",
+                "Help the defeated investigator {name}",
+                draw=None,
+                discard=None,
+                takes_argument=True,
+                draw_message="Resolving encounter with defeated investigator {name}...",
+                resolved_message="Encounter with {name} resolved.",
+            )
+        )
+        return registry
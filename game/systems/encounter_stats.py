@@ -0,0 +1,240 @@
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from game import json_backend
+
+STATS_FILE = "game/data/encounter_stats.json"
+STAT_FIELDS = ("health", "sanity", "clues", "assets", "conditions")
+
+# Relative value of one unit of each stat when ranking encounter decks
+DEFAULT_WEIGHTS = {
+    "health": 1.0,
+    "sanity": 1.0,
+    "clues": 1.5,
+    "assets": 1.5,
+    "conditions": -2.0,
+}
+
+
+class EncounterStatsTable:
+    """
+    Precomputed expected outcomes of each encounter card.
+
+    The table is generated offline by tools/encounter_stats.py, which resolves
+    every encounter card many times per investigator skill profile and
+    records the average change to the investigator's health, sanity, clues,
+    assets and conditions. Bots use it to compare encounter decks without
+    running live rollouts.
+    """
+
+    def __init__(self, data: Optional[Dict] = None):
+        data = data or {}
+        self.trials: int = data.get("trials", 0)
+        self.profiles: Dict[str, Dict[str, int]] = data.get("profiles", {})
+        self.encounters: Dict[str, Dict[str, Dict]] = data.get("encounters", {})
+        # (encounter type, profile, subtype) -> deck outcome, computed on use
+        self._deck_outcomes: Dict[Tuple, Optional[Dict[str, float]]] = {}
+        # (labels, skills, subtype) -> option scores with the default weights
+        self._option_scores: Dict[Tuple, Optional[List[float]]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def load(cls, file_path: str = STATS_FILE) -> "EncounterStatsTable":
+        """
+        Load the stats table from disk.
+
+        Args:
+            file_path: Path to the generated stats file
+
+        Returns:
+            The loaded table, or an empty table if the file is missing
+        """
+        if not os.path.exists(file_path):
+            logging.getLogger(__name__).warning(
+                "Encounter stats file not found: %s", file_path
+            )
+            return cls()
+
+        with open(file_path, "r") as file:
+            return cls(json_backend.load(file))
+
+    def get(
+        self, encounter_type: str, encounter_id, profile: str
+    ) -> Optional[Dict[str, float]]:
+        """
+        Get the expected outcome of a single encounter card.
+
+        Args:
+            encounter_type: Type of encounter (general, research, etc.)
+            encounter_id: ID of the encounter card
+            profile: Name of the investigator skill profile
+
+        Returns:
+            Dict of stat -> expected change, or None if the card is unknown
+        """
+        card = self.encounters.get(encounter_type, {}).get(str(encounter_id))
+        if not card:
+            return None
+        return card["profiles"].get(profile)
+
+    def deck_outcome(
+        self, encounter_type: str, profile: str, subtype: Optional[str] = None
+    ) -> Optional[Dict[str, float]]:
+        """
+        Get the expected outcome of drawing from an encounter deck.
+
+        Every card is assumed equally likely to be drawn.
+
+        Args:
+            encounter_type: Type of encounter (general, research, etc.)
+            profile: Name of the investigator skill profile
+            subtype: Optional subtype to filter cards by (city, wilderness, sea)
+
+        Returns:
+            Dict of stat -> expected change, or None if no cards are known
+        """
+        key = (encounter_type, profile, subtype)
+        if key not in self._deck_outcomes:
+            self._deck_outcomes[key] = self._deck_outcome(*key)
+        return self._deck_outcomes[key]
+
+    def _deck_outcome(
+        self, encounter_type: str, profile: str, subtype: Optional[str]
+    ) -> Optional[Dict[str, float]]:
+        outcomes = [
+            card["profiles"][profile]
+            for card in self.encounters.get(encounter_type, {}).values()
+            if profile in card["profiles"]
+            and (subtype is None or card.get("subtype") == subtype)
+        ]
+        if not outcomes:
+            return None
+
+        return {
+            stat: sum(outcome[stat] for outcome in outcomes) / len(outcomes)
+            for stat in STAT_FIELDS
+        }
+
+    def closest_profile(self, skills: Dict[str, int]) -> Optional[str]:
+        """
+        Find the profile whose skills best match an investigator's.
+
+        Args:
+            skills: Dict of skill -> value
+
+        Returns:
+            Name of the closest profile, or None if the table is empty
+        """
+        if not self.profiles:
+            return None
+
+        def distance(profile_skills: Dict[str, int]) -> int:
+            return sum(
+                abs(profile_skills.get(skill, 0) - value)
+                for skill, value in skills.items()
+            )
+
+        return min(self.profiles, key=lambda name: distance(self.profiles[name]))
+
+    @staticmethod
+    def score(
+        outcome: Dict[str, float], weights: Optional[Dict[str, float]] = None
+    ) -> float:
+        """
+        Collapse an expected outcome into a single value.
+
+        Args:
+            outcome: Dict of stat -> expected change
+            weights: Optional weights overriding DEFAULT_WEIGHTS
+
+        Returns:
+            Weighted sum of the outcome, higher is better
+        """
+        weights = weights or DEFAULT_WEIGHTS
+        return sum(outcome.get(stat, 0.0) * weights.get(stat, 0.0) for stat in STAT_FIELDS)
+
+    def rank_decks(
+        self,
+        decks: Iterable[Tuple[str, Optional[str]]],
+        profile: str,
+        subtype: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank encounter decks by expected outcome.
+
+        Decks without statistics are ranked last with a score of 0.
+
+        Args:
+            decks: Iterable of (label, encounter_type) pairs
+            profile: Name of the investigator skill profile
+            subtype: Location subtype used to filter general encounters
+            weights: Optional weights overriding DEFAULT_WEIGHTS
+
+        Returns:
+            List of (label, score) tuples, best first
+        """
+        ranked = []
+        for label, encounter_type in decks:
+            outcome = None
+            if encounter_type:
+                outcome = self.deck_outcome(encounter_type, profile, subtype)
+                if outcome is None and subtype:
+                    outcome = self.deck_outcome(encounter_type, profile)
+            ranked.append(
+                (label, self.score(outcome, weights) if outcome else 0.0, outcome is not None)
+            )
+
+        ranked.sort(key=lambda item: (item[2], item[1]), reverse=True)
+        return [(label, score) for label, score, _ in ranked]
+
+    def option_scores(
+        self,
+        labels: List[str],
+        registry,
+        skills: Dict[str, int],
+        subtype: Optional[str] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> Optional[List[float]]:
+        """
+        Score the encounter decks offered to an investigator.
+
+        Args:
+            labels: Labels of the offered decks, as the encounter phase lists them
+            registry: EncounterDeckRegistry resolving labels to encounter types
+            skills: The investigator's skills, matched to the closest profile
+            subtype: Location subtype used to filter general encounters
+            weights: Optional weights overriding DEFAULT_WEIGHTS
+
+        Returns:
+            The score of each deck as ranked by rank_decks(), in the order of
+            labels, or None if the table is empty
+        """
+        if weights is not None:
+            return self._score_options(labels, registry, skills, subtype, weights)
+
+        # The same decks are offered to the same investigators all game
+        key = (tuple(labels), tuple(skills.items()), subtype)
+        if key not in self._option_scores:
+            self._option_scores[key] = self._score_options(
+                labels, registry, skills, subtype, None
+            )
+        scores = self._option_scores[key]
+        return list(scores) if scores is not None else None
+
+    def _score_options(
+        self,
+        labels: List[str],
+        registry,
+        skills: Dict[str, int],
+        subtype: Optional[str],
+        weights: Optional[Dict[str, float]],
+    ) -> Optional[List[float]]:
+        profile = self.closest_profile(skills)
+        if profile is None:
+            return None
+
+        decks = [(label, registry.lookup(label)[0].encounter_type) for label in labels]
+        scores = dict(self.rank_decks(decks, profile, subtype, weights))
+        return [scores[label] for label in labels]
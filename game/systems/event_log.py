@@ -0,0 +1,521 @@
+"""
+Deterministic binary event log with replay.
+
+An EventRecorder attached to a GameEngine writes the seed of the game's
+GameRandom, every random draw and the answer to every decision the engine
+yields, whether a UI or a scheduler answered it, to a compact binary file. A Replayer sends the recorded answers back into the
+engine's decision generator, with a ReplayUI that renders nothing, and checks that every random draw
+matches the log, so any recorded game can be reconstructed exactly or
+stopped at the start of a given round.
+
+File layout (little endian):
+    header      magic "EPLOG", format version (u8), seed (u64)
+    records     tag (u8) followed by a tag-specific payload
+    snapshots   optional SaveManager snapshot after a round record, so a
+                replay can fast-forward without replaying earlier rounds
+    index       seek points, one per round, written when the log is closed
+    footer      offset of the index (u64), magic "EPIX"
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from game.engine import GameEngine
+from game.systems.decisions import DecisionRequest, Decisions
+from game.systems.save_manager import SaveManager
+
+FORMAT_VERSION = 1
+MAGIC = b"EPLOG"
+INDEX_MAGIC = b"EPIX"
+
+# Record tags
+TAG_BITS = 0x01  # getrandbits(k) with k <= 32
+TAG_BIG_BITS = 0x02  # getrandbits(k) with k > 32
+TAG_FLOAT = 0x03  # random()
+TAG_NAME = 0x10  # assigns an id to a UI method name
+TAG_DECISION = 0x11  # answer to a decision of a UI method
+TAG_ROUND = 0x20  # start of a round
+TAG_SNAPSHOT = 0x30  # saved game state at the start of a round
+TAG_INDEX = 0x7F  # seek index
+
+# Decision value types
+VALUE_NONE = 0
+VALUE_TRUE = 1
+VALUE_FALSE = 2
+VALUE_INT = 3
+VALUE_STR = 4
+
+_HEADER = struct.Struct("<5sBQ")
+_BITS = struct.Struct("<BBI")
+_BIG_BITS = struct.Struct("<BHH")
+_FLOAT = struct.Struct("<Bd")
+_NAME = struct.Struct("<BBB")
+_DECISION = struct.Struct("<BBB")
+_INT = struct.Struct("<q")
+_STR_LENGTH = struct.Struct("<H")
+_ROUND = struct.Struct("<BI")
+_INDEX = struct.Struct("<BI")
+_SNAPSHOT = struct.Struct("<BI")
+_SEEK_POINT = struct.Struct("<IQQQq")
+_FOOTER = struct.Struct("<Q4s")
+
+
+class ReplayDivergenceError(Exception):
+    """Raised when a replayed game stops matching its log."""
+
+
+class ReplayFinished(Exception):
+    """Raised when a replay reaches the end of its log."""
+
+
+class _StopReplay(Exception):
+    """Raised internally to stop a replay at the requested round."""
+
+
+@dataclass
+class SeekPoint:
+    """Position of the start of a round in an event log."""
+
+    round_number: int
+    offset: int  # Byte offset of the round record
+    record: int  # Index of the round record in the record stream
+    decisions: int  # Decisions made before the round started
+    snapshot: Optional[int] = None  # Index of the snapshot record, if any
+
+
+def _ignore(*args, **kwargs):
+    return None
+
+
+class EventRecorder:
+    """
+    Writes the event log of a single game.
+    """
+
+    def __init__(
+        self, file_path: str, seed: Optional[int] = None, snapshot_interval: int = 0
+    ):
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.seed = seed
+        # Write a state snapshot every this many rounds, 0 disables snapshots
+        self.snapshot_interval = snapshot_interval
+        self.file = open(file_path, "wb")
+        self.offset = 0
+        self.records = 0
+        self.decisions = 0
+        self.method_ids: Dict[str, int] = {}
+        self.index: List[SeekPoint] = []
+
+        self._write(_HEADER.pack(MAGIC, FORMAT_VERSION, seed), counted=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def attach(self, engine: GameEngine) -> None:
+        """
+        Start recording a game engine.
+
+        Seeds the game's random source with the log seed, so this must be
+        called before the game starts.
+
+        Args:
+            engine: The engine to record
+        """
+        engine.state.rng.seed(self.seed)
+        engine.state.rng.listeners.append(self.record_draw)
+        engine.decision_listeners.append(self.record_answer)
+        engine.round_listeners.append(self.record_round)
+
+    def _write(self, data: bytes, counted: bool = True) -> None:
+        self.file.write(data)
+        self.offset += len(data)
+        if counted:
+            self.records += 1
+
+    def record_draw(self, bits: Optional[int], value) -> None:
+        """Record a random draw reported by GameRandom."""
+        if bits is None:
+            self._write(_FLOAT.pack(TAG_FLOAT, value))
+        elif bits <= 32:
+            self._write(_BITS.pack(TAG_BITS, bits, value))
+        else:
+            data = value.to_bytes((bits + 7) // 8, "little")
+            self._write(_BIG_BITS.pack(TAG_BIG_BITS, bits, len(data)) + data)
+
+    def record_answer(self, request: DecisionRequest, answer: Any) -> None:
+        """Record the answer the engine got for a DecisionRequest."""
+        self.record_decision(request.method, answer)
+
+    def record_decision(self, method: str, value: Any) -> None:
+        """Record the answer to a decision, by the UI method that asks it."""
+        method_id = self.method_ids.get(method)
+        if method_id is None:
+            method_id = self.method_ids[method] = len(self.method_ids)
+            name = method.encode("utf-8")
+            self._write(_NAME.pack(TAG_NAME, method_id, len(name)) + name, False)
+
+        if value is None:
+            payload = _DECISION.pack(TAG_DECISION, method_id, VALUE_NONE)
+        elif value is True or value is False:
+            value_type = VALUE_TRUE if value else VALUE_FALSE
+            payload = _DECISION.pack(TAG_DECISION, method_id, value_type)
+        elif isinstance(value, int):
+            payload = _DECISION.pack(TAG_DECISION, method_id, VALUE_INT)
+            payload += _INT.pack(value)
+        else:
+            data = str(value).encode("utf-8")
+            payload = _DECISION.pack(TAG_DECISION, method_id, VALUE_STR)
+            payload += _STR_LENGTH.pack(len(data)) + data
+
+        self._write(payload)
+        self.decisions += 1
+
+    def record_round(self, state) -> None:
+        """Record the start of a round and add it to the seek index."""
+        point = SeekPoint(state.round_number, self.offset, self.records, self.decisions)
+        self.index.append(point)
+        self._write(_ROUND.pack(TAG_ROUND, state.round_number))
+
+        if self.snapshot_interval and state.round_number % self.snapshot_interval == 0:
+            data = SaveManager(state).dumps().encode("utf-8")
+            point.snapshot = self.records
+            self._write(_SNAPSHOT.pack(TAG_SNAPSHOT, len(data)) + data)
+
+    def close(self) -> None:
+        """Write the seek index and close the log."""
+        if self.file.closed:
+            return
+        index_offset = self.offset
+        self._write(_INDEX.pack(TAG_INDEX, len(self.index)), counted=False)
+        for point in self.index:
+            self._write(
+                _SEEK_POINT.pack(
+                    point.round_number,
+                    point.offset,
+                    point.record,
+                    point.decisions,
+                    -1 if point.snapshot is None else point.snapshot,
+                ),
+                counted=False,
+            )
+        self._write(_FOOTER.pack(index_offset, INDEX_MAGIC), counted=False)
+        self.file.close()
+
+
+class EventLogReader:
+    """
+    Parses an event log into a list of records.
+
+    The seek index of a closed log is read from the index block the footer
+    points to. Logs that were not closed (for example because the process
+    crashed) are read up to the last complete record and their seek index
+    is rebuilt from the round records.
+    """
+
+    def __init__(self, file_path: str):
+        with open(file_path, "rb") as file:
+            data = file.read()
+
+        magic, version, seed = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not an event log: {file_path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported event log version: {version}")
+
+        self.seed: int = seed
+        self.records: List[Tuple[int, Any]] = []
+        self.index: List[SeekPoint] = []
+        self.complete = False
+
+        end = len(data)
+        index = None
+        if end >= _HEADER.size + _FOOTER.size:
+            footer = end - _FOOTER.size
+            index_offset, index_magic = _FOOTER.unpack_from(data, footer)
+            if index_magic == INDEX_MAGIC:
+                end = index_offset
+                self.complete = True
+                index = self._read_index(data, index_offset, footer)
+
+        self._parse(data, _HEADER.size, end, rebuild_index=index is None)
+        if index is not None:
+            self.index = index
+
+    @staticmethod
+    def _read_index(data: bytes, offset: int, end: int) -> Optional[List[SeekPoint]]:
+        """Read an index block, None if it is not a valid one."""
+        if offset < _HEADER.size or offset + _INDEX.size > end:
+            return None
+        tag, count = _INDEX.unpack_from(data, offset)
+        offset += _INDEX.size
+        if tag != TAG_INDEX or offset + count * _SEEK_POINT.size != end:
+            return None
+
+        index = []
+        for round_number, point_offset, record, decisions, snapshot in (
+            _SEEK_POINT.iter_unpack(data[offset:end])
+        ):
+            index.append(
+                SeekPoint(
+                    round_number,
+                    point_offset,
+                    record,
+                    decisions,
+                    None if snapshot < 0 else snapshot,
+                )
+            )
+        return index
+
+    def _parse(
+        self, data: bytes, offset: int, end: int, rebuild_index: bool = True
+    ) -> None:
+        names: Dict[int, str] = {}
+        decisions = 0
+        try:
+            while offset < end:
+                start = offset
+                tag = data[offset]
+                if tag == TAG_BITS:
+                    _, bits, value = _BITS.unpack_from(data, offset)
+                    offset += _BITS.size
+                    record = (TAG_BITS, (bits, value))
+                elif tag == TAG_BIG_BITS:
+                    _, bits, length = _BIG_BITS.unpack_from(data, offset)
+                    offset += _BIG_BITS.size
+                    if offset + length > end:
+                        break
+                    value = int.from_bytes(data[offset : offset + length], "little")
+                    offset += length
+                    record = (TAG_BITS, (bits, value))
+                elif tag == TAG_FLOAT:
+                    _, value = _FLOAT.unpack_from(data, offset)
+                    offset += _FLOAT.size
+                    record = (TAG_FLOAT, (None, value))
+                elif tag == TAG_NAME:
+                    _, method_id, length = _NAME.unpack_from(data, offset)
+                    offset += _NAME.size
+                    if offset + length > end:
+                        break
+                    names[method_id] = data[offset : offset + length].decode("utf-8")
+                    offset += length
+                    continue
+                elif tag == TAG_DECISION:
+                    _, method_id, value_type = _DECISION.unpack_from(data, offset)
+                    offset += _DECISION.size
+                    value, offset = self._parse_value(data, offset, value_type)
+                    if offset > end:
+                        break
+                    record = (TAG_DECISION, (names[method_id], value))
+                    decisions += 1
+                elif tag == TAG_ROUND:
+                    _, round_number = _ROUND.unpack_from(data, offset)
+                    offset += _ROUND.size
+                    if rebuild_index:
+                        self.index.append(
+                            SeekPoint(
+                                round_number,
+                                start,
+                                len(self.records),
+                                decisions,
+                            )
+                        )
+                    record = (TAG_ROUND, round_number)
+                elif tag == TAG_SNAPSHOT:
+                    _, length = _SNAPSHOT.unpack_from(data, offset)
+                    offset += _SNAPSHOT.size
+                    if offset + length > end:
+                        break
+                    record = (TAG_SNAPSHOT, data[offset : offset + length])
+                    offset += length
+                    if rebuild_index and self.index:
+                        self.index[-1].snapshot = len(self.records)
+                else:
+                    raise ValueError(f"Unknown event log record tag: {tag}")
+                self.records.append(record)
+        except struct.error:
+            # Truncated final record
+            pass
+
+    @staticmethod
+    def _parse_value(data: bytes, offset: int, value_type: int) -> Tuple[Any, int]:
+        if value_type == VALUE_NONE:
+            return None, offset
+        if value_type == VALUE_TRUE:
+            return True, offset
+        if value_type == VALUE_FALSE:
+            return False, offset
+        if value_type == VALUE_INT:
+            return _INT.unpack_from(data, offset)[0], offset + _INT.size
+        if value_type == VALUE_STR:
+            (length,) = _STR_LENGTH.unpack_from(data, offset)
+            offset += _STR_LENGTH.size
+            return data[offset : offset + length].decode("utf-8"), offset + length
+        raise ValueError(f"Unknown decision value type: {value_type}")
+
+    def seek_point(self, round_number: int) -> Optional[SeekPoint]:
+        """
+        Get the latest seek point at or before a round.
+
+        Args:
+            round_number: The round to seek to
+
+        Returns:
+            The seek point, or None if the log has no rounds before it
+        """
+        best = None
+        for point in self.index:
+            if point.round_number > round_number:
+                break
+            best = point
+        return best
+
+    def snapshot_point(self, round_number: int) -> Optional[SeekPoint]:
+        """
+        Get the latest seek point with a snapshot at or before a round.
+
+        Args:
+            round_number: The round to seek to
+
+        Returns:
+            The seek point, or None if there is no usable snapshot
+        """
+        best = None
+        for point in self.index:
+            if point.round_number > round_number:
+                break
+            if point.snapshot is not None:
+                best = point
+        return best
+
+
+class ReplayCursor:
+    """Walks the records of an event log during a replay."""
+
+    def __init__(self, reader: EventLogReader, position: int = 0):
+        self.reader = reader
+        self.position = position
+
+    def _next(self) -> Tuple[int, Any]:
+        records = self.reader.records
+        while self.position < len(records):
+            record = records[self.position]
+            self.position += 1
+            if record[0] not in (TAG_ROUND, TAG_SNAPSHOT):
+                return record
+        raise ReplayFinished("End of event log reached")
+
+    def draw(self, bits: Optional[int], value) -> None:
+        """Check a random draw made during the replay against the log."""
+        tag, logged = self._next()
+        if tag not in (TAG_BITS, TAG_FLOAT) or logged != (bits, value):
+            raise ReplayDivergenceError(
+                f"Random draw {(bits, value)} does not match log record "
+                f"{self.position - 1}: {logged}"
+            )
+
+    def decision(self, method: str) -> Any:
+        """Get the logged value of the next decision."""
+        tag, logged = self._next()
+        if tag != TAG_DECISION or logged[0] != method:
+            raise ReplayDivergenceError(
+                f"Expected decision {method} but log record "
+                f"{self.position - 1} is {logged}"
+            )
+        return logged[1]
+
+
+    def answer(self, decisions: Decisions) -> Any:
+        """
+        Run a decision generator, answering every request from the log.
+
+        Args:
+            decisions: The generator to run
+
+        Returns:
+            The generator's return value
+        """
+        try:
+            request = next(decisions)
+            while True:
+                request = decisions.send(self.decision(request.method))
+        except StopIteration as stop:
+            return stop.value
+
+
+class ReplayUI:
+    """
+    UI stand-in for replays.
+
+    Decisions are answered by the ReplayCursor, so every UI call is ignored
+    and nothing is rendered during a replay.
+    """
+
+    def __getattr__(self, name):
+        return _ignore
+
+
+class Replayer:
+    """
+    Reconstructs a recorded game from its event log.
+    """
+
+    def __init__(self, file_path: str):
+        self.reader = EventLogReader(file_path)
+
+    def replay(
+        self, to_round: Optional[int] = None, use_snapshots: bool = True
+    ) -> GameEngine:
+        """
+        Replay the logged game without rendering anything.
+
+        When the log has a snapshot at or before to_round, the replay starts
+        from that snapshot instead of from the beginning of the game.
+
+        Args:
+            to_round: Stop at the start of this round, or None to replay
+                      the whole log
+            use_snapshots: Whether to fast-forward using snapshots
+
+        Returns:
+            The engine holding the reconstructed game state
+        """
+        cursor = ReplayCursor(self.reader)
+        engine = GameEngine(ReplayUI())
+
+        point = None
+        if use_snapshots and to_round is not None:
+            point = self.reader.snapshot_point(to_round)
+        if point is not None:
+            snapshot = self.reader.records[point.snapshot][1].decode("utf-8")
+            if not SaveManager(engine.state, engine.ui).loads(snapshot):
+                raise ReplayDivergenceError(
+                    f"Could not restore the snapshot of round {point.round_number}"
+                )
+            cursor.position = point.snapshot + 1
+        else:
+            engine.state.rng.seed(self.reader.seed)
+        engine.state.rng.listeners.append(cursor.draw)
+
+        if to_round is not None:
+
+            def stop_at_round(state):
+                if state.round_number >= to_round:
+                    raise _StopReplay()
+
+            engine.round_listeners.append(stop_at_round)
+
+        try:
+            if point is not None:
+                cursor.answer(engine.play_game())
+            else:
+                cursor.answer(engine.play())
+        except (_StopReplay, ReplayFinished):
+            pass
+
+        return engine
@@ -0,0 +1,33 @@
+import random
+from typing import Callable, List, Optional
+
+# listener(bits, value): bits is the number of random bits drawn, or None
+# for a float drawn by random()
+DrawListener = Callable[[Optional[int], object], None]
+
+
+class GameRandom(random.Random):
+    """
+    Random number generator owned by a single game.
+
+    Every draw made by the standard helpers (randint, choice, shuffle, sample)
+    goes through random() or getrandbits(), so listeners attached here see
+    all of the game's randomness. Without listeners it behaves exactly like
+    random.Random.
+    """
+
+    def __init__(self, seed=None):
+        self.listeners: List[DrawListener] = []
+        super().__init__(seed)
+
+    def random(self) -> float:
+        value = super().random()
+        for listener in self.listeners:
+            listener(None, value)
+        return value
+
+    def getrandbits(self, k: int) -> int:
+        value = super().getrandbits(k)
+        for listener in self.listeners:
+            listener(k, value)
+        return value
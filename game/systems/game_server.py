@@ -0,0 +1,451 @@
+import asyncio
+import itertools
+import logging
+import random
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, List, Optional
+
+from game import json_backend
+from game.engine import GameEngine
+from game.systems.content_catalog import ContentCatalog
+from game.systems.decisions import DecisionRequest
+from game.systems.save_manager import SaveManager
+from game.systems.session_store import SessionStore
+from game.systems.state_broadcaster import StateBroadcaster
+
+# Protocol: one JSON object per line in each direction.
+#
+# Server to client:
+#   {"type": "session", "id": 3}                      first line, the session id
+#   {"type": "message", "text": "..."}                UIManager.show_message
+#   {"type": "display", "method": "show_map", "args": [...]}
+#                                                     any other display call
+#   {"type": "decision", "id": 7, "method": "show_travel_menu",
+#    "args": [...], "options": [...], "labels": [...]}
+#                                                     the game waits for an answer
+#   {"type": "keyframe", "seq": 1, ...}               the whole board, see
+#   {"type": "diff", "seq": 2, ...}                   StateBroadcaster
+#   {"type": "error", "message": "..."}               bad message from the client
+#   {"type": "end"}                                   the session is over
+#
+# Client to server:
+#   {"type": "answer", "id": 7, "value": "2"}         answer to decision 7
+
+# Arguments that are not plain data, such as the game state, are sent as null
+PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def to_plain(value: Any) -> Any:
+    """
+    Convert a value to plain JSON data.
+
+    Args:
+        value: The value to convert
+
+    Returns:
+        The value with lists, tuples and dicts converted recursively and
+        anything else that is not plain data replaced by None
+    """
+    if isinstance(value, PLAIN_TYPES):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): to_plain(item) for key, item in value.items()}
+    return None
+
+
+class RemoteUI:
+    """
+    UI for a game played by a remote client.
+
+    Decisions reach the client as decision messages, so every UI call the
+    game makes is a display. Displays are queued as protocol messages and
+    sent when the game stops at its next decision.
+    """
+
+    def __init__(self):
+        self.outbox: List[Dict[str, Any]] = []
+
+    def show_message(self, message, wait_for_input=True):
+        self.outbox.append({"type": "message", "text": message})
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def display(*args, **kwargs):
+            self.outbox.append({"type": "display", "method": name, "args": to_plain(args)})
+
+        return display
+
+    def take_outbox(self) -> List[Dict[str, Any]]:
+        """Remove and return the queued messages."""
+        messages, self.outbox = self.outbox, []
+        return messages
+
+
+class ServerSession:
+    """
+    One client's game: an engine suspended at its current decision.
+
+    A session can be stored as a small record and rebuilt from it. The
+    record holds a checkpoint, the saved game at the start of the current
+    round (or just the random seed before the first round), and the
+    answers given since. Rebuilding restores the checkpoint and replays
+    the answers, which brings the game back to the same decision.
+    """
+
+    def __init__(
+        self, session_id: int, catalog: ContentCatalog, seed: Optional[int] = None
+    ):
+        self.session_id = session_id
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.ui = RemoteUI()
+        self.engine = GameEngine(self.ui, catalog=catalog)
+        self.engine.state.rng.seed(self.seed)
+        self.engine.round_listeners.append(self._checkpoint)
+        self.game = self.engine.play()
+
+        # Board changes are sent to the client before each decision; other
+        # spectators can subscribe to the broadcaster
+        self.broadcaster = StateBroadcaster()
+        self.broadcaster.attach(self.engine.state)
+        self.request: Optional[DecisionRequest] = None
+        self.decision_id = 0
+        self.finished = False
+
+        # Saved game at the start of the round, None before the first round
+        self.checkpoint: Optional[Dict[str, Any]] = None
+        # Answers given since the checkpoint
+        self.answers: List[Any] = []
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def from_record(
+        cls, record: Dict[str, Any], catalog: ContentCatalog
+    ) -> "ServerSession":
+        """
+        Rebuild a session from a record made by to_record().
+
+        Args:
+            record: The session record
+            catalog: Content for the rebuilt game
+
+        Returns:
+            The session, waiting on the same decision as when it was stored
+        """
+        session = cls(record["session_id"], catalog, record["seed"])
+        if record["checkpoint"] is not None:
+            state = session.engine.state
+            if not SaveManager(state, session.ui).restore(record["checkpoint"]):
+                raise ValueError(f"Bad checkpoint for session {session.session_id}")
+            session.engine.begin_game()
+
+        session.request = next(session.game)
+        for answer in record["answers"]:
+            session.request = session._resume(answer)
+
+        # The client has already seen everything shown during the replay,
+        # but it gets a new keyframe
+        session.ui.take_outbox()
+        session.decision_id = record["decision_id"]
+        session.broadcaster.seq = record["broadcast_seq"]
+        session.broadcaster.stale = True
+        return session
+
+    def to_record(self) -> Dict[str, Any]:
+        """Get the session as plain data for from_record()."""
+        return {
+            "session_id": self.session_id,
+            "seed": self.seed,
+            "decision_id": self.decision_id,
+            "broadcast_seq": self.broadcaster.seq,
+            "checkpoint": self.checkpoint,
+            "answers": list(self.answers),
+        }
+
+    def start(self) -> List[Dict[str, Any]]:
+        """
+        Run the game up to its first decision.
+
+        Returns:
+            Messages to send to the client
+        """
+        return self._advance(lambda: next(self.game))
+
+    def handle(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Handle a message from the client.
+
+        Args:
+            message: The decoded message
+
+        Returns:
+            Messages to send to the client
+        """
+        if message.get("type") != "answer" or message.get("id") != self.decision_id:
+            return [_error(f"Expected an answer to decision {self.decision_id}")]
+
+        value = message.get("value")
+        options = self.request.options
+        if options is not None and value not in options:
+            return [_error(f"Invalid answer: {value!r}"), self.decision_message()]
+
+        return self._advance(lambda: self._resume(value))
+
+    def decision_message(self) -> Dict[str, Any]:
+        request = self.request
+        return {
+            "type": "decision",
+            "id": self.decision_id,
+            "method": request.method,
+            "args": to_plain(request.args),
+            "options": to_plain(request.options),
+            "labels": to_plain(request.labels),
+        }
+
+    def _resume(self, answer: Any) -> DecisionRequest:
+        self.answers.append(answer)
+        return self.game.send(answer)
+
+    def _checkpoint(self, state) -> None:
+        self.checkpoint = SaveManager(state).to_dict()
+        self.answers = []
+
+    def _advance(self, resume: Callable[[], DecisionRequest]) -> List[Dict[str, Any]]:
+        try:
+            self.request = resume()
+        except StopIteration:
+            self.request = None
+        except Exception as e:
+            self.logger.error("Session %d failed: %s", self.session_id, str(e))
+            self.request = None
+            self.ui.outbox.append(_error("The game failed"))
+
+        messages = self.ui.take_outbox()
+        board = self.broadcaster.flush()
+        if board:
+            messages.append(board)
+        if self.request is None:
+            self.finished = True
+            messages.append({"type": "end"})
+        else:
+            self.decision_id += 1
+            messages.append(self.decision_message())
+        return messages
+
+
+def _error(message: str) -> Dict[str, Any]:
+    return {"type": "error", "message": message}
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    return json_backend.dumps(message).encode("utf-8") + b"\n"
+
+
+class GameServer:
+    """
+    Hosts many games in one process over a JSON lines TCP protocol.
+
+    Each connection plays its own game with its own GameState. All games
+    share one ContentCatalog, so the card data is loaded once. Games run on
+    the event loop between messages: a game only runs when its client
+    answers a decision, and it runs until the next decision.
+
+    Sessions live in a SessionStore. Only the max_resident most recently
+    used sessions stay in memory, and sessions idle for idle_seconds are
+    written to session_dir; they are rebuilt on their client's next message.
+    Without a session_dir they go to a temporary directory, which stop()
+    removes. stop() also logs the store's eviction and restore statistics.
+    """
+
+    def __init__(
+        self,
+        catalog: Optional[ContentCatalog] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_sessions: int = 1000,
+        session_dir: Optional[str] = None,
+        max_resident: int = 100,
+        idle_seconds: Optional[float] = None,
+    ):
+        self.catalog = catalog or ContentCatalog()
+        self.host = host
+        self.port = port
+        self.max_sessions = max_sessions
+        # Directory created for the sessions, removed on stop()
+        self._temp_dir = (
+            tempfile.mkdtemp(prefix="sessions-") if session_dir is None else None
+        )
+        self.sessions = SessionStore(
+            session_dir or self._temp_dir,
+            lambda record: ServerSession.from_record(record, self.catalog),
+            max_resident=max_resident,
+            idle_seconds=idle_seconds,
+        )
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._evictor: Optional[asyncio.Task] = None
+        self._session_ids = itertools.count(1)
+        self.logger = logging.getLogger(__name__)
+
+    async def start(self) -> int:
+        """
+        Start listening for connections.
+
+        Returns:
+            The port the server listens on
+        """
+        self.server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        if self.sessions.idle_seconds is not None:
+            self._evictor = asyncio.ensure_future(self._evict_idle_sessions())
+        self.logger.info("Game server listening on %s:%d", self.host, self.port)
+        return self.port
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        if self._evictor is not None:
+            self._evictor.cancel()
+            self._evictor = None
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+            self.log_stats()
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+    def log_stats(self) -> None:
+        """Log the session store's eviction and restore statistics."""
+        stats = self.sessions.stats
+        self.logger.info(
+            "Sessions: %d evictions, %d restores, "
+            "mean restore %.1f ms, max restore %.1f ms",
+            stats.evictions,
+            stats.restores,
+            stats.mean_restore_seconds * 1000,
+            stats.max_restore_seconds * 1000,
+        )
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Play one game with a connected client."""
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(encode(_error("Server full")))
+            await self._close(writer)
+            return
+
+        # Only the session id is held while waiting, so the session can be evicted
+        session_id = next(self._session_ids)
+        messages, finished = self._start_session(session_id)
+        try:
+            await self._send(writer, messages)
+
+            while not finished:
+                line = await reader.readline()
+                if not line:
+                    break
+                messages, finished = self._handle_line(session_id, line)
+                await self._send(writer, messages)
+        except ConnectionError as e:
+            self.logger.info("Session %d disconnected: %s", session_id, str(e))
+        finally:
+            self.sessions.remove(session_id)
+            await self._close(writer)
+
+    def _start_session(self, session_id: int):
+        session = ServerSession(session_id, self.catalog)
+        messages = [{"type": "session", "id": session_id}]
+        messages.extend(session.start())
+        self.sessions.add(session_id, session)
+        return messages, session.finished
+
+    def _handle_line(self, session_id: int, line: bytes):
+        try:
+            message = json_backend.loads(line)
+        except json_backend.JSONDecodeError:
+            return [_error("Malformed message")], False
+
+        session = self.sessions.get(session_id)
+        if session is None:
+            return [_error("The session could not be restored"), {"type": "end"}], True
+        return session.handle(message), session.finished
+
+    async def _evict_idle_sessions(self) -> None:
+        interval = max(self.sessions.idle_seconds / 2, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            self.sessions.evict_idle()
+
+    async def _send(
+        self, writer: asyncio.StreamWriter, messages: List[Dict[str, Any]]
+    ) -> None:
+        writer.write(b"".join(encode(message) for message in messages))
+        await writer.drain()
+
+    async def _close(self, writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class GameClient:
+    """
+    Local stand-in for a game client.
+
+    Plays one game on a GameServer, answering every decision message with a
+    policy: a function of the decision message that returns the answer.
+    """
+
+    def __init__(self, policy: Callable[[Dict[str, Any]], Any]):
+        self.policy = policy
+        self.session_id: Optional[int] = None
+        self.received: List[Dict[str, Any]] = []
+
+    async def play(self, host: str, port: int) -> List[Dict[str, Any]]:
+        """
+        Connect and play until the server ends the session.
+
+        Returns:
+            Every message received from the server
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json_backend.loads(line)
+                self.received.append(message)
+
+                if message["type"] == "session":
+                    self.session_id = message["id"]
+                elif message["type"] == "decision":
+                    answer = {
+                        "type": "answer",
+                        "id": message["id"],
+                        "value": self.policy(message),
+                    }
+                    writer.write(encode(answer))
+                    await writer.drain()
+                elif message["type"] == "end":
+                    break
+        finally:
+            writer.close()
+            await writer.wait_closed()
+        return self.received
@@ -0,0 +1,121 @@
+import logging
+import threading
+from typing import Any, Callable, List
+
+from game.lazy_import import LazyImport
+
+# asyncio is only imported once a read has idle work to do alongside it
+asyncio = LazyImport("asyncio")
+
+# An idle task does one small piece of work per call and returns True if it
+# did any, False once there is nothing left to do for now
+IdleTask = Callable[[], bool]
+
+
+class IdleTasks:
+    """
+    Work done while the game waits on the player.
+
+    read() runs a blocking read, e.g. input(), on a daemon thread and an
+    asyncio event loop on the calling thread. While the read is pending the
+    loop calls the registered tasks in turn, yielding to the loop between
+    calls so the answer is picked up as soon as it arrives. Once a full
+    round of tasks did no work the loop just waits for the answer.
+
+    Tasks run on the game's own thread while the game is paused on the
+    read, so they may use the game state freely. They must not print or
+    read input, and each call should be short, since the answer is only
+    returned once the current call has finished. A task that raises is
+    logged and dropped.
+    """
+
+    def __init__(self):
+        self.tasks: List[IdleTask] = []
+        self.logger = logging.getLogger(__name__)
+        self._loop = None
+
+    def add(self, task: IdleTask) -> None:
+        """
+        Register a task. Does nothing if it is already registered.
+
+        Args:
+            task: Function doing one piece of work per call
+        """
+        if task not in self.tasks:
+            self.tasks.append(task)
+
+    def remove(self, task: IdleTask) -> None:
+        """Unregister a task."""
+        if task in self.tasks:
+            self.tasks.remove(task)
+
+    def run_round(self) -> bool:
+        """
+        Call every task once.
+
+        Returns:
+            True if any task did work
+        """
+        worked = False
+        for task in list(self.tasks):
+            try:
+                worked = bool(task()) or worked
+            except Exception as e:
+                self.logger.error("Idle task %r failed: %s", task, str(e))
+                self.remove(task)
+        return worked
+
+    def read(self, read: Callable[..., Any], *args) -> Any:
+        """
+        Run a blocking read and do idle work until it returns.
+
+        Args:
+            read: Blocking function, e.g. input
+            *args: Arguments for read
+
+        Returns:
+            What read returned. Its exceptions are raised here
+        """
+        if not self.tasks:
+            return read(*args)
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self._read(read, args))
+
+    def close(self) -> None:
+        """Close the event loop."""
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    async def _read(self, read: Callable[..., Any], args: tuple) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(result, error):
+            if not future.done():
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+
+        def reader():
+            try:
+                result, error = read(*args), None
+            except BaseException as e:
+                result, error = None, e
+            try:
+                loop.call_soon_threadsafe(resolve, result, error)
+            except RuntimeError:
+                # The loop was closed after the wait was interrupted
+                pass
+
+        # A daemon thread, so an interrupted read does not keep the
+        # process alive at exit
+        threading.Thread(target=reader, name="input-reader", daemon=True).start()
+
+        while not future.done():
+            if not self.run_round():
+                break
+            await asyncio.sleep(0)
+        return await future
@@ -0,0 +1,334 @@
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from game import json_backend
+from game.enums import GamePhase
+from game.entities.location import TOKEN_FIELDS
+from game.systems.save_manager import (
+    INVESTIGATOR_FIELDS,
+    SaveManager,
+    set_location_field,
+)
+from game.systems.state_observer import (
+    PLAYER_MANAGER_FIELDS,
+    STATE_FIELDS,
+    STRUCTURE_FIELDS,
+    StateObserver,
+)
+
+JOURNAL_SUFFIX = ".journal"
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# Investigator fields written when a mutator changes the investigator in place
+INVESTIGATOR_LIST_FIELDS = ("items", "conditions", "assets")
+
+# Deck attributes that hold cards
+DECK_PILES = ("cards", "discard_pile", "reserve")
+
+
+def _splice(old: list, new: list):
+    """
+    Find the smallest slice of old that has to be replaced to get new.
+
+    Returns:
+        (start, end, replacement) so that old[start:end] = replacement gives
+        new, or None if the lists hold the same cards
+    """
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] is new[start]:
+        start += 1
+
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] is new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    if start == old_end and start == new_end:
+        return None
+    return start, old_end, new[start:new_end]
+
+
+class Journal:
+    """
+    Incremental autosave for a running game.
+
+    Every change to an observed investigator, location, deck, the player
+    turn order or the game state is appended to a journal file as a small
+    JSON line, along with the random draws made since the previous line.
+    Compaction folds the journal into a full SaveManager snapshot. After a
+    crash, recover() loads the last snapshot and replays the journal.
+
+    Files written for base path "autosave":
+        autosave.snapshot   last compacted state (replaced atomically)
+        autosave.journal    header line, then one delta per line
+    """
+
+    def __init__(
+        self, base_path: str, compact_every: int = 1000, flush_each_entry: bool = True
+    ):
+        self.snapshot_path = base_path + SNAPSHOT_SUFFIX
+        self.journal_path = base_path + JOURNAL_SUFFIX
+        # Compact at the start of a round once this many deltas are written
+        self.compact_every = compact_every
+        # Without flushing each entry, entries are flushed while the game
+        # waits on the player, and the step in progress can be lost in a crash
+        self.flush_each_entry = flush_each_entry
+        self.unflushed = False
+
+        self.state = None
+        self.file = None
+        self.generation = 0
+        self.entries = 0
+        self.stale = False
+        self.pending_draws: List[int] = []
+
+        self.observer = StateObserver(
+            self._state_changed,
+            self._player_manager_changed,
+            self._investigator_changed,
+            self._location_changed,
+            self._deck_changed,
+        )
+        self.shadows: Dict[str, Dict[str, list]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def attach(self, engine) -> None:
+        """
+        Start journaling a game engine.
+
+        Journaling starts at the first round, once setup has finished.
+
+        Args:
+            engine: The engine to journal
+        """
+        engine.round_listeners.append(self.on_round)
+        if not self.flush_each_entry:
+            engine.idle.add(self.flush)
+
+    def on_round(self, state) -> None:
+        """Start journaling, or compact a long journal, at the start of a round."""
+        if self.state is None:
+            self.state = state
+            state.rng.listeners.append(self._record_draw)
+            self.compact()
+        elif self.stale or self.entries >= self.compact_every:
+            self.compact()
+
+    def flush(self) -> bool:
+        """
+        Write buffered entries to the journal file.
+
+        Returns:
+            True if there was anything to write
+        """
+        if not self.unflushed or not self.file:
+            return False
+        self.file.flush()
+        self.unflushed = False
+        return True
+
+    def close(self) -> None:
+        """Stop journaling and close the journal file."""
+        if self.state is not None:
+            self._unobserve()
+            if self._record_draw in self.state.rng.listeners:
+                self.state.rng.listeners.remove(self._record_draw)
+            self.state = None
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def compact(self) -> None:
+        """Fold the journal into a new snapshot and start an empty journal."""
+        self._unobserve()
+        self.generation += 1
+
+        data = SaveManager(self.state).to_dict()
+        data["journal_generation"] = self.generation
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json_backend.dump(data, file)
+        os.replace(temp_path, self.snapshot_path)
+
+        if self.file:
+            self.file.close()
+        self.file = open(self.journal_path, "w", encoding="utf-8")
+        self.file.write(json_backend.dumps({"generation": self.generation}) + "\n")
+        self.file.flush()
+
+        self.entries = 0
+        self.stale = False
+        self.pending_draws = []
+        self._observe()
+
+    def recover(self, state, ui=None) -> bool:
+        """
+        Restore a game from the last snapshot and the journal.
+
+        Args:
+            state: The game state to restore into
+            ui: UI reference for the restored ancient one
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as file:
+                data = json_backend.load(file)
+        except (OSError, json_backend.JSONDecodeError) as e:
+            self.logger.error("Error reading autosave snapshot: %s", str(e))
+            return False
+
+        if not SaveManager(state, ui).restore(data):
+            return False
+        self.generation = data.get("journal_generation", 0)
+
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as file:
+                lines = file.readlines()
+        except OSError:
+            lines = []
+
+        # A journal from another generation predates the snapshot
+        if lines and json_backend.loads(lines[0]).get("generation") == self.generation:
+            for line in lines[1:]:
+                try:
+                    entry = json_backend.loads(line)
+                except json_backend.JSONDecodeError:
+                    # Torn final write
+                    break
+                self._apply(state, entry)
+
+        state.encounter_availability.reset()
+        return True
+
+    def resume(self, engine) -> bool:
+        """
+        Recover a crashed game into an engine and continue playing it.
+
+        Args:
+            engine: A new engine to resume the game in
+
+        Returns:
+            False if there was no game to recover, otherwise True once the
+            resumed game has finished
+        """
+        if not self.recover(engine.state, engine.ui):
+            return False
+        self.attach(engine)
+        engine.game_loop()
+        return True
+
+    def _observe(self) -> None:
+        self.observer.attach(self.state)
+        self.shadows = {
+            key: {
+                pile: list(getattr(deck, pile))
+                for pile in DECK_PILES
+                if hasattr(deck, pile)
+            }
+            for key, deck in self.observer.decks.items()
+        }
+
+    def _unobserve(self) -> None:
+        self.observer.detach()
+
+    def _write(self, entry: list) -> None:
+        if self.pending_draws:
+            self.file.write(json_backend.dumps(["r", self.pending_draws]) + "\n")
+            self.pending_draws = []
+        self.file.write(json_backend.dumps(entry) + "\n")
+        if self.flush_each_entry:
+            self.file.flush()
+        else:
+            self.unflushed = True
+        self.entries += 1
+
+    def _record_draw(self, bits: Optional[int], value) -> None:
+        self.pending_draws.append(bits or 0)
+
+    def _state_changed(self, state, name: Optional[str]) -> None:
+        if name in STRUCTURE_FIELDS:
+            # New objects are observed from the next compaction
+            self.stale = True
+        elif name in STATE_FIELDS:
+            value = getattr(state, name)
+            if isinstance(value, GamePhase):
+                value = value.value
+            self._write(["s", name, value])
+
+    def _player_manager_changed(self, player_manager, name: Optional[str]) -> None:
+        if name in PLAYER_MANAGER_FIELDS:
+            self._write(["p", name, getattr(player_manager, name)])
+        elif name == "players":
+            self.stale = True
+
+    def _investigator_changed(self, investigator, name: Optional[str]) -> None:
+        player_id = self.observer.player_id(investigator)
+        if player_id is None:
+            return
+
+        fields = INVESTIGATOR_LIST_FIELDS if name is None else (name,)
+        for field in fields:
+            if field == "assets":
+                value = [asset.id for asset in investigator.assets]
+            elif field in INVESTIGATOR_FIELDS:
+                value = getattr(investigator, field)
+            else:
+                continue
+            self._write(["i", player_id, field, value])
+
+    def _location_changed(self, location, name: Optional[str]) -> None:
+        if name in TOKEN_FIELDS:
+            self._write(["l", location.name, name, getattr(location, name)])
+        elif name == "monsters":
+            self._write(["l", location.name, name, len(location.monsters)])
+
+    def _deck_changed(self, deck, name: Optional[str]) -> None:
+        key = self.observer.deck_key(deck)
+        if key is None:
+            return
+
+        for pile, shadow in self.shadows[key].items():
+            cards = getattr(deck, pile)
+            change = _splice(shadow, cards)
+            if change is None:
+                continue
+            start, end, replacement = change
+            shadow[start:end] = replacement
+            self._write(["d", key, pile, start, end, [card.id for card in replacement]])
+
+    def _apply(self, state, entry: List[Any]) -> None:
+        kind = entry[0]
+        if kind == "r":
+            for bits in entry[1]:
+                if bits:
+                    state.rng.getrandbits(bits)
+                else:
+                    state.rng.random()
+        elif kind == "s":
+            _, field, value = entry
+            if field == "current_phase":
+                value = GamePhase(value)
+            setattr(state, field, value)
+        elif kind == "p":
+            _, field, value = entry
+            setattr(state.player_manager, field, value)
+        elif kind == "i":
+            _, player_id, field, value = entry
+            investigator = state.player_manager.get_player_by_id(player_id).investigator
+            if field == "assets":
+                assets = state.asset_factory.assets
+                value = [assets[asset_id] for asset_id in value]
+            setattr(investigator, field, value)
+        elif kind == "l":
+            _, name, field, value = entry
+            set_location_field(state.locations[name], field, value)
+        elif kind == "d":
+            _, key, pile, start, end, card_ids = entry
+            save_manager = SaveManager(state)
+            cards = save_manager.card_index(key)
+            deck = save_manager.decks()[key]
+            getattr(deck, pile)[start:end] = [cards[card_id] for card_id in card_ids]
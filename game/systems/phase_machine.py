@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional
+
+from game.enums import GamePhase
+
+
+class SessionState(Enum):
+    """What the engine does on its next step."""
+
+    MAIN_MENU = "main_menu"
+    PLAYING = "playing"
+    QUIT = "quit"
+
+
+@dataclass(frozen=True)
+class PhaseTransition:
+    """How the game moves on after a phase has run."""
+
+    next_phase: GamePhase
+    # The phase runs once for each player, in turn order from the lead
+    per_player: bool = True
+    # Entering the next phase starts a new round
+    new_round: bool = False
+    # Messages are formatted with name=<name of the player who is up next>
+    # Shown when the next phase starts
+    enter_message: Optional[str] = None
+    # Whether enter_message is also shown in single player games
+    announce_solo: bool = True
+    # Shown when the phase moves on to the next player
+    next_player_message: Optional[str] = None
+
+
+PHASE_TRANSITIONS: Dict[GamePhase, PhaseTransition] = {
+    GamePhase.ACTION: PhaseTransition(
+        next_phase=GamePhase.ENCOUNTER,
+        enter_message="Advancing to Encounter Phase...",
+        next_player_message="Next player's turn: {name}",
+    ),
+    GamePhase.ENCOUNTER: PhaseTransition(next_phase=GamePhase.MYTHOS),
+    GamePhase.MYTHOS: PhaseTransition(
+        next_phase=GamePhase.ACTION,
+        per_player=False,
+        new_round=True,
+        enter_message="Starting new round with {name} as the lead investigator.",
+        announce_solo=False,
+    ),
+}
+
+
+class PhaseMachine:
+    """
+    Moves the game between phases and player turns.
+
+    Phases only resolve the current player's turn. After each turn the
+    engine calls advance(), which looks up the current phase in the
+    transition table and either hands the phase to the next player or
+    enters the next phase, starting from the lead investigator.
+    """
+
+    def __init__(
+        self, state, transitions: Optional[Dict[GamePhase, PhaseTransition]] = None
+    ):
+        self.state = state
+        self.transitions = transitions or PHASE_TRANSITIONS
+
+    def advance(self) -> Optional[str]:
+        """
+        Move on from the turn that just finished.
+
+        Returns:
+            Message announcing the change, or None if there is nothing to say
+        """
+        state = self.state
+        player_manager = state.player_manager
+        transition = self.transitions[state.current_phase]
+
+        if transition.per_player and len(state.players) > 1:
+            next_player = state.advance_to_next_player()
+            if next_player != player_manager.get_lead_investigator():
+                if transition.next_player_message:
+                    message = transition.next_player_message
+                    return message.format(name=next_player.name)
+                return None
+
+        player_manager.reset_turn_order()
+        state.current_phase = transition.next_phase
+        if transition.new_round:
+            state.round_number += 1
+
+        if not transition.enter_message:
+            return None
+        if not transition.announce_solo and len(state.players) <= 1:
+            return None
+        player = player_manager.get_current_player()
+        return transition.enter_message.format(name=player.name if player else "")
@@ -1,12 +1,13 @@
 from typing import List, Optional, Dict, Any
 import logging
 
+from game.entities.base.observable import Observable
 from game.entities.player import Player
 from game.entities.investigator import Investigator
 from game.factories.investigator_factory import InvestigatorFactory
 
 
-class PlayerManager:
+class PlayerManager(Observable):
     """
     Manages players, turn order, and the lead investigator.
     """
@@ -0,0 +1,259 @@
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from game.systems.decisions import Decisions
+
+# GameState attributes holding decks
+DECK_FIELDS = frozenset({"asset_deck", "condition_deck", "encounter_decks"})
+
+# Deck methods timed by Profiler.instrument_deck when present on the deck
+DECK_OPERATIONS = (
+    "draw",
+    "discard",
+    "shuffle",
+    "add_to_top",
+    "add_to_bottom",
+    "draw_by_location_type",
+    "draw_by_id",
+    "draw_by_trait",
+    "draw_specific",
+    "take_from_reserve",
+)
+
+
+@dataclass
+class SectionStats:
+    """Timing data for one call path."""
+
+    calls: int = 0
+    total_time: float = 0.0  # Seconds, including nested sections
+    self_time: float = 0.0  # Seconds, excluding nested sections
+
+
+class SectionClock:
+    """Wall time of a section, which can be paused while it is suspended."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self._start = perf_counter()
+
+    def pause(self) -> None:
+        """Stop counting time until resume()."""
+        if self._start is not None:
+            self.elapsed += perf_counter() - self._start
+            self._start = None
+
+    def resume(self) -> None:
+        """Count time again after pause()."""
+        if self._start is None:
+            self._start = perf_counter()
+
+    def stop(self) -> float:
+        """Stop counting time and get the seconds counted."""
+        self.pause()
+        return self.elapsed
+
+
+class Profiler:
+    """
+    Opt-in wall time and call count profiler for the game loop.
+
+    Sections nest, and statistics are kept per call path ("Encounter;
+    encounter:General;SkillTestComponent"), so the data can be written
+    as a flamegraph-compatible collapsed-stack file. Code that supports
+    profiling checks for a profiler once and skips all timing when there
+    is none, so a disabled profiler costs nothing.
+
+    One profiler can time many games played in turns, e.g. by a
+    GameScheduler: a section timed with timed() leaves the stack while its
+    generator waits on a decision and is put back when it resumes, so the
+    sections of a game only nest inside that game's own sections.
+    """
+
+    def __init__(self):
+        self.stats: Dict[str, SectionStats] = {}
+        self._stack: List[str] = []
+        self._child_time: List[float] = []
+
+    @contextmanager
+    def section(self, name: str):
+        """
+        Time a block of code as a nested section.
+
+        Args:
+            name: Name of the section, appended to the current call path
+
+        Yields:
+            The section's clock, for blocks that are suspended part of the
+            time, see timed()
+        """
+        self._stack.append(name)
+        self._child_time.append(0.0)
+        path = ";".join(self._stack)
+        clock = SectionClock()
+        try:
+            yield clock
+        finally:
+            elapsed = clock.stop()
+            child_time = self._child_time.pop()
+            self._stack.pop()
+            if self._child_time:
+                self._child_time[-1] += elapsed
+
+            stats = self.stats.get(path)
+            if stats is None:
+                stats = self.stats[path] = SectionStats()
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.self_time += elapsed - child_time
+
+    def timed(self, name: str, decisions: Decisions) -> Decisions:
+        """
+        Time a decision generator as a nested section.
+
+        The clock stops whenever the generator yields a DecisionRequest and
+        starts again when it is resumed with the answer, so the time spent
+        waiting on the player, a bot or a network client is not counted.
+        Use it as "result = yield from profiler.timed(name, decisions)".
+
+        Args:
+            name: Name of the section
+            decisions: The generator to time
+
+        Returns:
+            The generator's return value
+        """
+        with self.section(name) as clock:
+            try:
+                request = next(decisions)
+                while True:
+                    clock.pause()
+                    # Other games may run sections until this one resumes
+                    frame = self._stack.pop(), self._child_time.pop()
+                    try:
+                        answer = yield request
+                    finally:
+                        self._stack.append(frame[0])
+                        self._child_time.append(frame[1])
+                        clock.resume()
+                    request = decisions.send(answer)
+            except StopIteration as stop:
+                return stop.value
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """
+        Wrap a callable so every call is timed as a section.
+
+        Args:
+            name: Name of the section
+            func: The callable to wrap
+
+        Returns:
+            The wrapped callable
+        """
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            with self.section(name):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def instrument_deck(self, deck, label: str) -> None:
+        """
+        Time the deck operations of a single deck instance.
+
+        Args:
+            deck: The deck to instrument
+            label: Name used for the deck in section names
+        """
+        for operation in DECK_OPERATIONS:
+            method = getattr(deck, operation, None)
+            # Skip missing operations and ones this deck already has wrapped
+            if method is None or operation in vars(deck):
+                continue
+            setattr(deck, operation, self.wrap(f"deck:{label}.{operation}", method))
+
+    def instrument_state(self, state) -> None:
+        """
+        Time the operations of every deck in a game state.
+
+        Decks the state replaces later, e.g. when setting up a new game,
+        are instrumented as they are put in place.
+
+        Args:
+            state: The game state whose decks should be instrumented
+        """
+        if self._deck_replaced not in state._observers:
+            state.add_observer(self._deck_replaced)
+        self._instrument_decks(state)
+
+    def _deck_replaced(self, state, name) -> None:
+        if name in DECK_FIELDS:
+            self._instrument_decks(state)
+
+    def _instrument_decks(self, state) -> None:
+        if state.asset_deck:
+            self.instrument_deck(state.asset_deck, "asset")
+        if state.condition_deck:
+            self.instrument_deck(state.condition_deck, "condition")
+        for encounter_type, deck in state.encounter_decks.items():
+            self.instrument_deck(deck, encounter_type)
+
+    def reset(self) -> None:
+        """Discard all recorded statistics."""
+        self.stats.clear()
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the recorded statistics as plain data.
+
+        Returns:
+            Dict of call path -> {"calls", "total_time", "self_time"}
+        """
+        return {
+            path: {
+                "calls": stats.calls,
+                "total_time": stats.total_time,
+                "self_time": stats.self_time,
+            }
+            for path, stats in self.stats.items()
+        }
+
+    def dump_json(self, file_path: str) -> None:
+        """
+        Write the statistics to a JSON file.
+
+        Args:
+            file_path: Path of the file to write
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def to_collapsed(self) -> str:
+        """
+        Format the statistics as collapsed stacks weighted by self time.
+
+        Returns:
+            One "frame;frame;frame microseconds" line per call path
+        """
+        lines = []
+        for path, stats in sorted(self.stats.items()):
+            microseconds = int(round(stats.self_time * 1_000_000))
+            if microseconds > 0:
+                lines.append(f"{path} {microseconds}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def dump_collapsed(self, file_path: str) -> None:
+        """
+        Write the statistics as a flamegraph-compatible collapsed-stack file.
+
+        Args:
+            file_path: Path of the file to write
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(self.to_collapsed())
@@ -0,0 +1,447 @@
+import base64
+import logging
+import struct
+from typing import Any, Dict, List, Optional
+
+from game import json_backend
+from game.enums import GamePhase, GameDifficulty
+from game.entities.cards.monster import Monster
+from game.entities.location import TOKEN_FIELDS
+from game.entities.player import Player
+from game.systems.setup_manager import SetupConfig, SetupManager
+
+SAVE_FORMAT_VERSION = 1
+
+# Investigator attributes that change during play
+INVESTIGATOR_FIELDS = (
+    "health",
+    "sanity",
+    "clue_tokens",
+    "train_tickets",
+    "ship_tickets",
+    "current_location",
+    "actions",
+    "is_delayed",
+    "items",
+    "conditions",
+)
+
+
+def set_location_field(location, field: str, value: Any) -> None:
+    """
+    Restore a saved location field: a token, or "monsters" as a count.
+
+    Monsters carry no data of their own, so a location's monsters are saved
+    as how many there are and restored as that many new Monsters.
+    """
+    if field == "monsters":
+        location.monsters = [Monster() for _ in range(value)]
+    elif field in TOKEN_FIELDS:
+        setattr(location, field, value)
+
+
+class SaveManager:
+    """
+    Saves and restores the mutable part of a game.
+
+    A save holds only what changes during play: deck orderings as lists of
+    card ids, location tokens and monster counts, players and their
+    investigators (None for a player who has not picked one), the ancient
+    one, the doom track, the current phase and the random generator state.
+    Card ids are resolved against the state's content factories on load, so
+    saves stay a few KB and never contain card objects.
+    """
+
+    def __init__(self, state, ui=None):
+        self.state = state
+        self.ui = ui
+        self.logger = logging.getLogger(__name__)
+
+    def save(self, file_path: str) -> bool:
+        """
+        Save the game to a file.
+
+        Args:
+            file_path: Path of the save file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(self.dumps())
+            return True
+        except OSError as e:
+            self.logger.error("Error saving game to %s: %s", file_path, str(e))
+            return False
+
+    def load(self, file_path: str) -> bool:
+        """
+        Load a game from a file into the state.
+
+        Args:
+            file_path: Path of the save file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as file:
+                text = file.read()
+        except OSError as e:
+            self.logger.error("Error loading game from %s: %s", file_path, str(e))
+            return False
+        return self.loads(text)
+
+    def dumps(self) -> str:
+        """Serialize the game to a compact JSON string."""
+        return json_backend.dumps(self.to_dict())
+
+    def loads(self, text: str) -> bool:
+        """
+        Restore the game from a string produced by dumps().
+
+        Args:
+            text: The serialized game
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            data = json_backend.loads(text)
+        except json_backend.JSONDecodeError as e:
+            self.logger.error("Error parsing save data: %s", str(e))
+            return False
+        return self.restore(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the mutable game state as plain data.
+
+        Returns:
+            Dict of JSON-compatible save data
+        """
+        state = self.state
+        player_manager = state.player_manager
+        config: Optional[SetupConfig] = getattr(state, "setup_config", None)
+
+        data = {
+            "format_version": SAVE_FORMAT_VERSION,
+            "round": state.round_number,
+            "phase": state.current_phase.value,
+            "doom": state.doom_track,
+            "max_doom": state.max_doom,
+            "mysteries_solved": state.mysteries_solved,
+            "difficulty": state.difficulty.value,
+            "rng": self._dump_rng(),
+            "setup": None,
+            "ancient_one": None,
+            "mythos_deck": [],
+            "decks": self._dump_decks(),
+            "locations": self._dump_locations(),
+            "players": [
+                self._dump_player(player) for player in player_manager.players
+            ],
+            "current_player": player_manager.current_player_index,
+            "lead_investigator": player_manager.lead_investigator_index,
+            "defeated": [
+                player.player_id
+                for player in player_manager.players
+                if player.investigator in state.defeated_investigators
+            ],
+        }
+
+        if config:
+            data["setup"] = {
+                "num_players": config.num_players,
+                "ancient_one_id": config.ancient_one_id,
+                "investigator_ids": config.investigator_ids,
+                "player_names": config.player_names,
+                "difficulty": config.difficulty.value,
+            }
+
+        if state.ancient_one:
+            data["ancient_one"] = {
+                field: getattr(state.ancient_one, field)
+                for field in state.ancient_one.save_fields
+            }
+        if state.mythos_deck:
+            data["mythos_deck"] = [
+                [card.color, card.name] for card in state.mythos_deck
+            ]
+
+        return data
+
+    def restore(self, data: Dict[str, Any]) -> bool:
+        """
+        Restore the game state from save data.
+
+        Args:
+            data: Save data produced by to_dict()
+
+        Returns:
+            True if successful, False otherwise
+        """
+        version = data.get("format_version")
+        if version != SAVE_FORMAT_VERSION:
+            self.logger.error("Unsupported save format version: %s", version)
+            return False
+
+        try:
+            self._restore(data)
+        except (KeyError, ValueError, TypeError) as e:
+            self.logger.error("Error restoring saved game: %s", str(e))
+            return False
+        return True
+
+    def _restore(self, data: Dict[str, Any]) -> None:
+        state = self.state
+        setup = data["setup"]
+
+        state.reset_game(setup["num_players"] if setup else 1)
+        if setup:
+            state.setup_config = SetupConfig(
+                num_players=setup["num_players"],
+                ancient_one_id=setup["ancient_one_id"],
+                investigator_ids=setup["investigator_ids"],
+                player_names=setup["player_names"],
+                difficulty=GameDifficulty(setup["difficulty"]),
+            )
+
+        state.round_number = data["round"]
+        state.current_phase = GamePhase(data["phase"])
+        state.doom_track = data["doom"]
+        state.max_doom = data["max_doom"]
+        state.mysteries_solved = data["mysteries_solved"]
+        state.difficulty = GameDifficulty(data["difficulty"])
+
+        self._restore_decks(data["decks"])
+        self._restore_locations(data["locations"])
+        self._restore_players(data)
+        self._restore_ancient_one(data)
+
+        # Rebuild caches that depend on locations and defeated investigators
+        state.encounter_availability.reset()
+
+        state.rng.setstate(self._load_rng(data["rng"]))
+
+    def decks(self) -> Dict[str, Any]:
+        """
+        Get every deck in the state.
+
+        Returns:
+            Dict of deck key ("asset", "condition", "encounter:<type>") -> deck
+        """
+        state = self.state
+        decks = {}
+        if state.asset_deck:
+            decks["asset"] = state.asset_deck
+        if state.condition_deck:
+            decks["condition"] = state.condition_deck
+        for encounter_type, deck in state.encounter_decks.items():
+            decks[f"encounter:{encounter_type}"] = deck
+        return decks
+
+    def card_index(self, deck_key: str) -> Dict[Any, Any]:
+        """
+        Get the cards that can appear in a deck, by card id.
+
+        Args:
+            deck_key: Key of the deck, as returned by decks()
+
+        Returns:
+            Dict of card id -> card
+        """
+        state = self.state
+        if deck_key == "asset":
+            return state.asset_factory.assets
+        if deck_key == "condition":
+            return state.condition_factory.conditions
+        encounter_type = deck_key.split(":", 1)[1]
+        return {
+            encounter.id: encounter
+            for encounter in state.encounter_factory.get_all_encounters_by_type(
+                encounter_type
+            )
+        }
+
+    def _dump_rng(self) -> str:
+        version, internal, gauss = self.state.rng.getstate()
+        packed = struct.pack(f"<B{len(internal)}I", version, *internal)
+        return base64.b64encode(packed).decode("ascii")
+
+    @staticmethod
+    def _load_rng(encoded: str):
+        packed = base64.b64decode(encoded)
+        count = (len(packed) - 1) // 4
+        version, *internal = struct.unpack(f"<B{count}I", packed)
+        return version, tuple(internal), None
+
+    def _dump_decks(self) -> Dict[str, Any]:
+        state = self.state
+        decks = {"encounters": {}}
+
+        if state.asset_deck:
+            decks["asset"] = {
+                "cards": [card.id for card in state.asset_deck.cards],
+                "discard": [card.id for card in state.asset_deck.discard_pile],
+                "reserve": [card.id for card in state.asset_deck.reserve],
+            }
+        if state.condition_deck:
+            decks["condition"] = {
+                "cards": [card.id for card in state.condition_deck.cards],
+                "discard": [card.id for card in state.condition_deck.discard_pile],
+            }
+        for encounter_type, deck in state.encounter_decks.items():
+            decks["encounters"][encounter_type] = {
+                "cards": [card.id for card in deck.cards],
+                "discard": [card.id for card in deck.discard_pile],
+            }
+
+        return decks
+
+    def _restore_decks(self, decks: Dict[str, Any]) -> None:
+        state = self.state
+
+        if "asset" in decks:
+            assets = state.asset_factory.assets
+            saved = decks["asset"]
+            state.asset_deck.cards = [assets[card_id] for card_id in saved["cards"]]
+            state.asset_deck.discard_pile = [
+                assets[card_id] for card_id in saved["discard"]
+            ]
+            state.asset_deck.reserve = [
+                assets[card_id] for card_id in saved["reserve"]
+            ]
+
+        if "condition" in decks:
+            conditions = state.condition_factory.conditions
+            saved = decks["condition"]
+            state.condition_deck.cards = [
+                conditions[card_id] for card_id in saved["cards"]
+            ]
+            state.condition_deck.discard_pile = [
+                conditions[card_id] for card_id in saved["discard"]
+            ]
+
+        for encounter_type, saved in decks["encounters"].items():
+            deck = state.encounter_decks[encounter_type]
+            encounters = self.card_index(f"encounter:{encounter_type}")
+            deck.cards = [encounters[card_id] for card_id in saved["cards"]]
+            deck.discard_pile = [encounters[card_id] for card_id in saved["discard"]]
+
+    def _dump_locations(self) -> Dict[str, Dict[str, Any]]:
+        # Only locations with tokens or monsters are saved, the rest is content
+        locations = {}
+        for name, location in self.state.locations.items():
+            tokens = {
+                field: getattr(location, field)
+                for field in TOKEN_FIELDS
+                if getattr(location, field)
+            }
+            if location.monsters:
+                tokens["monsters"] = len(location.monsters)
+            if tokens:
+                locations[name] = tokens
+        return locations
+
+    def _restore_locations(self, locations: Dict[str, Dict[str, Any]]) -> None:
+        for name, tokens in locations.items():
+            location = self.state.locations[name]
+            for field, value in tokens.items():
+                set_location_field(location, field, value)
+
+    def _dump_player(self, player) -> Dict[str, Any]:
+        investigator = player.investigator
+        saved = {
+            "id": player.player_id,
+            "name": player.name,
+            "lead": player.is_lead_investigator,
+            "investigator": None,
+        }
+        if investigator:
+            saved["investigator"] = {
+                field: getattr(investigator, field) for field in INVESTIGATOR_FIELDS
+            }
+            saved["investigator"]["id"] = investigator.investigator_id
+            saved["investigator"]["assets"] = [
+                asset.id for asset in investigator.assets
+            ]
+        return saved
+
+    def _restore_players(self, data: Dict[str, Any]) -> None:
+        state = self.state
+        player_manager = state.player_manager
+        assets = state.asset_factory.assets
+
+        player_manager.players = []
+        state.players = []
+        state.investigator_selector.reset_selections()
+        defeated = set(data["defeated"])
+
+        for saved in data["players"]:
+            saved_investigator = saved["investigator"]
+            if saved_investigator is None:
+                player = Player(saved["id"], saved["name"])
+                player.is_lead_investigator = saved["lead"]
+                player_manager.players.append(player)
+                state.players.append(player)
+                continue
+
+            player = player_manager.add_player(
+                saved["id"], saved["name"], saved_investigator["id"]
+            )
+            if not player:
+                raise ValueError(f"Could not restore player {saved['id']}")
+
+            investigator = player.investigator
+            for field in INVESTIGATOR_FIELDS:
+                setattr(investigator, field, saved_investigator[field])
+            investigator.assets = [
+                assets[asset_id] for asset_id in saved_investigator["assets"]
+            ]
+
+            player.is_lead_investigator = saved["lead"]
+            state.investigator_selector.select_investigator(saved_investigator["id"])
+            state.players.append(player)
+
+            if player.player_id in defeated:
+                state.defeated_investigators.append(investigator)
+
+        player_manager.current_player_index = data["current_player"]
+        player_manager.lead_investigator_index = data["lead_investigator"]
+
+    def _restore_ancient_one(self, data: Dict[str, Any]) -> None:
+        state = self.state
+        saved = data["ancient_one"]
+        config = getattr(state, "setup_config", None)
+        if saved is None or config is None:
+            state.ancient_one = None
+            state.mythos_deck = None
+            return
+
+        ancient_one = SetupManager(state, self.ui).create_ancient_one(
+            config.ancient_one_id
+        )
+        for field in ancient_one.save_fields:
+            setattr(ancient_one, field, saved[field])
+        ancient_one.set_ui(self.ui)
+        state.ancient_one = ancient_one
+
+        state.mythos_deck = self._resolve_mythos_cards(data["mythos_deck"])
+
+    def _resolve_mythos_cards(self, saved: List[List[str]]) -> list:
+        if not saved:
+            return []
+
+        factory = self.state.mythos_factory
+        cards_by_name = {
+            (card.color, card.name): card
+            for pool in (factory.blue_cards, factory.yellow_cards, factory.green_cards)
+            for card in pool
+        }
+        cards = [cards_by_name[(color, name)] for color, name in saved]
+
+        # Free memory by clearing the factory, as AncientOne.on_setup does
+        self.state._mythos_factory = None
+        return cards
@@ -0,0 +1,102 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from game.systems.decisions import DecisionRequest
+
+# Answers a batch of (game id, request) pairs with one answer per pair
+DecisionPolicy = Callable[[List[Tuple[int, DecisionRequest]]], List[Any]]
+
+
+class GameScheduler:
+    """
+    Runs many games on one thread.
+
+    Each game is a decision generator, usually GameEngine.play() or
+    play_game(). The scheduler advances every game to its next decision,
+    then hands all the waiting requests to the policy in one batch and
+    resumes each game with its answer. Games that finish or fail drop out
+    without holding up the others.
+
+    Display calls are still made directly on each engine's UI, so scheduled
+    engines need a UI that does not block, e.g. one that ignores messages.
+    """
+
+    def __init__(self, policy: DecisionPolicy):
+        self.policy = policy
+        self.games: Dict[int, Any] = {}
+        self.pending: Dict[int, DecisionRequest] = {}
+        self.results: Dict[int, Any] = {}
+        self.errors: Dict[int, Exception] = {}
+        self.next_id = 1
+        self.logger = logging.getLogger(__name__)
+
+    def add(self, game) -> int:
+        """
+        Add a game and run it up to its first decision.
+
+        Args:
+            game: Decision generator to run
+
+        Returns:
+            Id of the game
+        """
+        game_id = self.next_id
+        self.next_id += 1
+        self.games[game_id] = game
+        self._advance(game_id, None, first=True)
+        return game_id
+
+    @property
+    def running(self) -> int:
+        """Number of games still waiting on a decision."""
+        return len(self.pending)
+
+    def step(self) -> int:
+        """
+        Answer one batch of decisions, one for every running game.
+
+        Returns:
+            Number of games still running afterwards
+        """
+        if not self.pending:
+            return 0
+
+        batch = list(self.pending.items())
+        answers = self.policy(batch)
+        for (game_id, _), answer in zip(batch, answers):
+            self._advance(game_id, answer)
+        return len(self.pending)
+
+    def run(self, max_batches: Optional[int] = None) -> int:
+        """
+        Answer batches until every game has finished.
+
+        Args:
+            max_batches: Stop after this many batches, None for no limit
+
+        Returns:
+            Number of batches answered
+        """
+        batches = 0
+        while self.pending and (max_batches is None or batches < max_batches):
+            self.step()
+            batches += 1
+        return batches
+
+    def _advance(self, game_id: int, answer: Any, first: bool = False) -> None:
+        game = self.games[game_id]
+        try:
+            request = next(game) if first else game.send(answer)
+        except StopIteration as stop:
+            self._finish(game_id)
+            self.results[game_id] = stop.value
+        except Exception as e:
+            self._finish(game_id)
+            self.errors[game_id] = e
+            self.logger.error("Game %d failed: %s", game_id, str(e))
+        else:
+            self.pending[game_id] = request
+
+    def _finish(self, game_id: int) -> None:
+        self.pending.pop(game_id, None)
+        del self.games[game_id]
@@ -0,0 +1,190 @@
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set
+
+from game import json_backend
+
+SESSION_SUFFIX = ".session"
+
+
+@dataclass
+class SessionStoreStats:
+    """Eviction and restore counters for a SessionStore."""
+
+    evictions: int = 0
+    restores: int = 0
+    restore_seconds: float = 0.0
+    max_restore_seconds: float = 0.0
+
+    @property
+    def mean_restore_seconds(self) -> float:
+        return self.restore_seconds / self.restores if self.restores else 0.0
+
+
+class SessionStore:
+    """
+    Keeps recently used sessions in memory and the rest on disk.
+
+    Sessions are kept in least recently used order. A session is evicted,
+    written to disk as the record from its to_record() and dropped from
+    memory, when more than max_resident sessions are in memory or when it
+    has not been used for idle_seconds. The next get() for an evicted
+    session rebuilds it from its record with the load function.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        load: Callable[[Dict[str, Any]], Any],
+        max_resident: int = 100,
+        idle_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.directory = directory
+        self.load = load
+        self.max_resident = max_resident
+        self.idle_seconds = idle_seconds
+        self.clock = clock
+
+        # Session id -> session, least recently used first
+        self.resident: "OrderedDict[int, Any]" = OrderedDict()
+        self.last_used: Dict[int, float] = {}
+        self.evicted: Set[int] = set()
+        self.stats = SessionStoreStats()
+        self.logger = logging.getLogger(__name__)
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self.resident) + len(self.evicted)
+
+    def __contains__(self, session_id: int) -> bool:
+        return session_id in self.resident or session_id in self.evicted
+
+    def add(self, session_id: int, session) -> None:
+        """
+        Add a session as the most recently used one.
+
+        Args:
+            session_id: Id of the session
+            session: The session
+        """
+        self.resident[session_id] = session
+        self.last_used[session_id] = self.clock()
+        self._enforce_budget()
+
+    def get(self, session_id: int):
+        """
+        Get a session, restoring it from disk if it was evicted.
+
+        Args:
+            session_id: Id of the session
+
+        Returns:
+            The session, or None if it is unknown or could not be restored
+        """
+        session = self.resident.get(session_id)
+        if session is None:
+            if session_id not in self.evicted:
+                return None
+            session = self._restore(session_id)
+            if session is None:
+                return None
+            self.resident[session_id] = session
+        else:
+            self.resident.move_to_end(session_id)
+
+        self.last_used[session_id] = self.clock()
+        self._enforce_budget()
+        return session
+
+    def remove(self, session_id: int) -> None:
+        """Forget a session, in memory and on disk."""
+        self.resident.pop(session_id, None)
+        self.last_used.pop(session_id, None)
+        if session_id in self.evicted:
+            self.evicted.discard(session_id)
+            try:
+                os.remove(self._path(session_id))
+            except OSError:
+                pass
+
+    def evict(self, session_id: int) -> bool:
+        """
+        Write a session to disk and drop it from memory.
+
+        Args:
+            session_id: Id of a session in memory
+
+        Returns:
+            True if successful, False otherwise
+        """
+        session = self.resident.get(session_id)
+        if session is None:
+            return False
+
+        path = self._path(session_id)
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json_backend.dump(session.to_record(), file)
+            os.replace(temp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.error("Error evicting session %d: %s", session_id, str(e))
+            return False
+
+        del self.resident[session_id]
+        self.evicted.add(session_id)
+        self.stats.evictions += 1
+        return True
+
+    def evict_idle(self) -> int:
+        """
+        Evict every session that has been idle for idle_seconds.
+
+        Returns:
+            Number of sessions evicted
+        """
+        if self.idle_seconds is None:
+            return 0
+
+        cutoff = self.clock() - self.idle_seconds
+        idle = [
+            session_id
+            for session_id in self.resident
+            if self.last_used[session_id] <= cutoff
+        ]
+        return sum(1 for session_id in idle if self.evict(session_id))
+
+    def _enforce_budget(self) -> None:
+        # Evict from the least recently used end, never the session just used
+        while len(self.resident) > max(self.max_resident, 1):
+            session_id = next(iter(self.resident))
+            if not self.evict(session_id):
+                break
+
+    def _restore(self, session_id: int):
+        start = time.perf_counter()
+        path = self._path(session_id)
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                record = json_backend.load(file)
+            session = self.load(record)
+        except Exception as e:
+            self.logger.error("Error restoring session %d: %s", session_id, str(e))
+            return None
+
+        self.evicted.discard(session_id)
+        os.remove(path)
+
+        elapsed = time.perf_counter() - start
+        self.stats.restores += 1
+        self.stats.restore_seconds += elapsed
+        self.stats.max_restore_seconds = max(self.stats.max_restore_seconds, elapsed)
+        return session
+
+    def _path(self, session_id: int) -> str:
+        return os.path.join(self.directory, f"{session_id}{SESSION_SUFFIX}")
@@ -112,21 +112,33 @@ class SetupManager:
         Args:
             ancient_one_id: ID of the ancient one to set up
         """
+        self.state.ancient_one = self.create_ancient_one(ancient_one_id)
+
+        # Call the ancient one's setup method
+        self.state.ancient_one.set_ui(self.ui)  # Set the UI reference
+        self.state.ancient_one.on_setup(self.state)
+
+    def create_ancient_one(self, ancient_one_id: int):
+        """
+        Create the ancient one with the given ID.
+
+        Args:
+            ancient_one_id: ID of the ancient one to create
+
+        Returns:
+            A new ancient one instance, not yet set up
+        """
         # Create the appropriate ancient one instance based on ID
         if ancient_one_id == 1:
             from game.entities.ancient_ones.yog_sothoth import YogSothoth
 
-            self.state.ancient_one = YogSothoth()
+            return YogSothoth()
         # Add more ancient ones as they become available
         else:
             # Default to Yog-Sothoth if ID not found
             from game.entities.ancient_ones.yog_sothoth import YogSothoth
 
-            self.state.ancient_one = YogSothoth()
-
-        # Call the ancient one's setup method
-        self.state.ancient_one.set_ui(self.ui)  # Set the UI reference
-        self.state.ancient_one.on_setup(self.state)
+            return YogSothoth()
 
     def _resolve_starting_effects(self) -> None:
         """
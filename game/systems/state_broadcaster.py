@@ -0,0 +1,325 @@
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from game.enums import GamePhase
+from game.systems.save_manager import SaveManager
+from game.systems.state_observer import STRUCTURE_FIELDS, StateObserver
+
+# Investigator fields sent as deltas in diffs; other fields are sent as values
+INVESTIGATOR_STATS = (
+    "health",
+    "sanity",
+    "clue_tokens",
+    "train_tickets",
+    "ship_tickets",
+    "actions",
+)
+
+
+class Subscriber:
+    """
+    A spectator or remote client receiving a game's state.
+
+    Messages wait in a backlog until polled. A subscriber that lets more
+    than max_backlog messages pile up has fallen behind: its backlog is
+    dropped and its next poll starts from a fresh keyframe instead.
+    """
+
+    def __init__(self, broadcaster: "StateBroadcaster", max_backlog: int = 100):
+        self.broadcaster = broadcaster
+        self.max_backlog = max_backlog
+        self.backlog: Deque[Dict[str, Any]] = deque()
+        self.behind = True
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        if self.behind:
+            return
+        if len(self.backlog) >= self.max_backlog:
+            self.backlog.clear()
+            self.behind = True
+            return
+        self.backlog.append(message)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Take the messages sent since the last poll.
+
+        Returns:
+            The waiting diffs, or a single keyframe if the subscriber is new
+            or has fallen behind
+        """
+        if self.behind:
+            self.behind = False
+            return [self.broadcaster.keyframe()]
+        messages = list(self.backlog)
+        self.backlog.clear()
+        return messages
+
+
+class StateBroadcaster:
+    """
+    Publishes a game's public state as keyframes and compact diffs.
+
+    Observers on the game state, player order, investigators, locations and
+    decks mark what changed. flush() compares only the changed objects
+    with the state last sent and publishes a diff holding just the
+    differences, numbered with a sequence number:
+
+        {"type": "diff", "seq": 12,
+         "state": {"doom": 9},
+         "investigators": {"1": {"health": -1, "current_location": "Rome"}},
+         "locations": {"Rome": {"clue": false}},
+         "decks": {"encounter:general": 41}}
+
+    Investigator stats are deltas, everything else is the new value. A
+    keyframe ({"type": "keyframe", "seq": 12, ...}) holds the whole public
+    state and takes the place of every keyframe_interval-th diff, so
+    subscribers that lost a diff resynchronise, and is also published
+    whenever objects were replaced. Every message has a new sequence number.
+    """
+
+    def __init__(self, keyframe_interval: int = 50):
+        self.keyframe_interval = keyframe_interval
+        self.state = None
+        self.seq = 0
+        self.subscribers: List[Subscriber] = []
+
+        self.sent: Dict[str, Any] = {}
+        self.observer = StateObserver(
+            self._state_changed,
+            self._player_manager_changed,
+            self._investigator_changed,
+            self._location_changed,
+            self._deck_changed,
+        )
+        self.stale = False
+        self.state_dirty = False
+        self.dirty_investigators: Set[int] = set()
+        self.dirty_locations: Set[str] = set()
+        self.dirty_decks: Set[str] = set()
+
+    def attach(self, state) -> None:
+        """
+        Start publishing a game state.
+
+        Args:
+            state: The game state
+        """
+        if self.state is not None:
+            self.detach()
+        self.state = state
+        self.observer.attach(state)
+        self.sent = self.view()
+
+    def detach(self) -> None:
+        """Stop observing the game state."""
+        if self.state is not None:
+            self.observer.detach()
+            self.state = None
+
+    def subscribe(self, max_backlog: int = 100) -> Subscriber:
+        """
+        Add a subscriber. Its first poll returns a keyframe.
+
+        Args:
+            max_backlog: Messages the subscriber may leave unpolled
+
+        Returns:
+            The subscriber
+        """
+        subscriber = Subscriber(self, max_backlog)
+        self.subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        if subscriber in self.subscribers:
+            self.subscribers.remove(subscriber)
+
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """
+        Publish the changes made since the last flush.
+
+        Returns:
+            The published diff or keyframe, or None if nothing changed
+        """
+        if self.state is None:
+            return None
+
+        # Players are added in place during setup, without a notification
+        if len(self.state.player_manager.players) != len(self.observer.player_ids):
+            self.stale = True
+
+        if self.stale:
+            self.observer.attach(self.state)
+            message = self._next_keyframe()
+        else:
+            message = self._diff()
+            if message is None:
+                return None
+            if self.seq % self.keyframe_interval == 0:
+                # The diff is already applied to sent, send it as a keyframe
+                message = self.keyframe()
+
+        self._publish(message)
+        return message
+
+    def keyframe(self) -> Dict[str, Any]:
+        """Get the whole public state at the current sequence number."""
+        keyframe = {"type": "keyframe", "seq": self.seq}
+        # Copy the sections, diffs replace their entries as they are sent
+        keyframe.update({section: dict(view) for section, view in self.sent.items()})
+        return keyframe
+
+    def view(self) -> Dict[str, Any]:
+        """Get the whole public state as plain data."""
+        state = self.state
+        return {
+            "state": self._state_view(),
+            "investigators": {
+                str(player.player_id): self._investigator_view(player.investigator)
+                for player in state.player_manager.players
+                if player.investigator
+            },
+            "locations": {
+                name: self._location_view(location)
+                for name, location in state.locations.items()
+            },
+            "decks": {
+                key: len(deck.cards) for key, deck in SaveManager(state).decks().items()
+            },
+        }
+
+    def _next_keyframe(self) -> Dict[str, Any]:
+        self.seq += 1
+        self.sent = self.view()
+        self._clear_dirty()
+        return self.keyframe()
+
+    def _diff(self) -> Optional[Dict[str, Any]]:
+        state = self.state
+        sent = self.sent
+        changes: Dict[str, Any] = {}
+
+        if self.state_dirty:
+            current = self._state_view()
+            changed = _changed(sent["state"], current)
+            if changed:
+                changes["state"] = changed
+            sent["state"] = current
+
+        investigators = {}
+        for player in state.player_manager.players:
+            if player.player_id not in self.dirty_investigators:
+                continue
+            key = str(player.player_id)
+            current = self._investigator_view(player.investigator)
+            previous = sent["investigators"].get(key, {})
+            changed = _changed(previous, current)
+            for stat in INVESTIGATOR_STATS:
+                if stat in changed and stat in previous:
+                    changed[stat] = current[stat] - previous[stat]
+            if changed:
+                investigators[key] = changed
+            sent["investigators"][key] = current
+        if investigators:
+            changes["investigators"] = investigators
+
+        locations = {}
+        for name in self.dirty_locations:
+            current = self._location_view(state.locations[name])
+            changed = _changed(sent["locations"].get(name, {}), current)
+            if changed:
+                locations[name] = changed
+            sent["locations"][name] = current
+        if locations:
+            changes["locations"] = locations
+
+        decks = {}
+        all_decks = SaveManager(state).decks()
+        for key in self.dirty_decks:
+            size = len(all_decks[key].cards)
+            if sent["decks"].get(key) != size:
+                decks[key] = size
+            sent["decks"][key] = size
+        if decks:
+            changes["decks"] = decks
+
+        self._clear_dirty()
+        if not changes:
+            return None
+
+        self.seq += 1
+        diff = {"type": "diff", "seq": self.seq}
+        diff.update(changes)
+        return diff
+
+    def _publish(self, message: Dict[str, Any]) -> None:
+        for subscriber in self.subscribers:
+            subscriber.publish(message)
+
+    def _clear_dirty(self) -> None:
+        self.stale = False
+        self.state_dirty = False
+        self.dirty_investigators.clear()
+        self.dirty_locations.clear()
+        self.dirty_decks.clear()
+
+    def _state_view(self) -> Dict[str, Any]:
+        state = self.state
+        phase = state.current_phase
+        return {
+            "round": state.round_number,
+            "phase": phase.value if isinstance(phase, GamePhase) else phase,
+            "doom": state.doom_track,
+            "mysteries_solved": state.mysteries_solved,
+            "current_player": state.player_manager.current_player_index,
+            "lead_investigator": state.player_manager.lead_investigator_index,
+        }
+
+    @staticmethod
+    def _investigator_view(investigator) -> Dict[str, Any]:
+        view = {stat: getattr(investigator, stat) for stat in INVESTIGATOR_STATS}
+        view["name"] = investigator.name
+        view["current_location"] = investigator.current_location
+        view["conditions"] = len(investigator.conditions)
+        view["assets"] = len(investigator.assets)
+        return view
+
+    @staticmethod
+    def _location_view(location) -> Dict[str, Any]:
+        return {
+            "gate": location.has_gate,
+            "clue": location.has_clue,
+            "rumor": location.rumor_name if location.has_rumor else None,
+            "expedition": location.has_expedition,
+            "monsters": len(location.monsters),
+        }
+
+    def _state_changed(self, state, name: Optional[str]) -> None:
+        if name in STRUCTURE_FIELDS:
+            self.stale = True
+        else:
+            self.state_dirty = True
+
+    def _player_manager_changed(self, player_manager, name: Optional[str]) -> None:
+        if name == "players":
+            self.stale = True
+        else:
+            self.state_dirty = True
+
+    def _investigator_changed(self, investigator, name: Optional[str]) -> None:
+        player_id = self.observer.player_id(investigator)
+        if player_id is not None:
+            self.dirty_investigators.add(player_id)
+
+    def _location_changed(self, location, name: Optional[str]) -> None:
+        self.dirty_locations.add(location.name)
+
+    def _deck_changed(self, deck, name: Optional[str]) -> None:
+        key = self.observer.deck_key(deck)
+        if key is not None:
+            self.dirty_decks.add(key)
+
+
+def _changed(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in current.items() if previous.get(key) != value}
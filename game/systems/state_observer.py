@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from game.entities.base.observable import Observer
+from game.systems.save_manager import SaveManager
+
+# GameState attributes whose changes are recorded as values
+STATE_FIELDS = frozenset(
+    {"doom_track", "max_doom", "mysteries_solved", "current_phase", "round_number"}
+)
+
+# GameState attributes that replace observed objects. Objects put in their
+# place are only observed once StateObserver.attach() runs again
+STRUCTURE_FIELDS = frozenset(
+    {"asset_deck", "condition_deck", "encounter_decks", "locations", "players"}
+)
+
+PLAYER_MANAGER_FIELDS = frozenset({"current_player_index", "lead_investigator_index"})
+
+
+class StateObserver:
+    """
+    Observes every object of a game state that reports its changes.
+
+    attach() adds one observer to the game state, the player manager, each
+    player's investigator, each location and each deck, and remembers the
+    objects it observed so detach() removes the observers from those, even
+    if the state has replaced some of them since. Investigators and decks
+    are also indexed by id(), so their observers can look up the player id
+    and the SaveManager deck key of the object that changed.
+    """
+
+    def __init__(
+        self,
+        state_changed: Observer,
+        player_manager_changed: Observer,
+        investigator_changed: Observer,
+        location_changed: Observer,
+        deck_changed: Observer,
+    ):
+        self.state_changed = state_changed
+        self.player_manager_changed = player_manager_changed
+        self.investigator_changed = investigator_changed
+        self.location_changed = location_changed
+        self.deck_changed = deck_changed
+
+        self.observed: List[Tuple[Any, Observer]] = []
+        # id(investigator) -> player id, id(deck) -> deck key
+        self.player_ids: Dict[int, int] = {}
+        self.deck_keys: Dict[int, str] = {}
+        # Deck key -> deck, for the decks observed
+        self.decks: Dict[str, Any] = {}
+
+    def attach(self, state) -> None:
+        """
+        Observe a game state, detaching from the objects observed before.
+
+        Args:
+            state: The game state
+        """
+        self.detach()
+        self._observe(state, self.state_changed)
+        self._observe(state.player_manager, self.player_manager_changed)
+
+        for player in state.player_manager.players:
+            if player.investigator:
+                self.player_ids[id(player.investigator)] = player.player_id
+                self._observe(player.investigator, self.investigator_changed)
+
+        for location in state.locations.values():
+            self._observe(location, self.location_changed)
+
+        self.decks = SaveManager(state).decks()
+        for key, deck in self.decks.items():
+            self.deck_keys[id(deck)] = key
+            self._observe(deck, self.deck_changed)
+
+    def detach(self) -> None:
+        """Stop observing the objects attach() observed."""
+        for obj, observer in self.observed:
+            obj.remove_observer(observer)
+        self.observed = []
+        self.player_ids = {}
+        self.deck_keys = {}
+        self.decks = {}
+
+    def player_id(self, investigator) -> Optional[int]:
+        """Get the player id of an observed investigator, None if not observed."""
+        return self.player_ids.get(id(investigator))
+
+    def deck_key(self, deck) -> Optional[str]:
+        """Get the deck key of an observed deck, None if not observed."""
+        return self.deck_keys.get(id(deck))
+
+    def _observe(self, obj, observer: Observer) -> None:
+        obj.add_observer(observer)
+        self.observed.append((obj, observer))
@@ -0,0 +1,154 @@
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from game.lazy_import import LazyImport
+
+# Rendered banners are kept next to the game data they are made from
+BANNER_CACHE_FILE = "game/data/banner_cache.json"
+
+Figlet = LazyImport("pyfiglet", "Figlet")
+
+BannerKey = Tuple[str, str, int]  # (font, text, width)
+
+
+class BannerCache:
+    """
+    Figlet banners rendered once per (font, text, width).
+
+    Rendering a banner with pyfiglet takes milliseconds, so screens that
+    are redrawn often read their banners from here. Banners are loaded from
+    the cache file, if there is one, and prewarm() renders the ones a game
+    will need on a background thread and saves them for the next run.
+    pyfiglet is only imported when a banner has to be rendered.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = BANNER_CACHE_FILE,
+        figlet_factory: Callable[..., object] = Figlet,
+    ):
+        self.path = path
+        self.figlet_factory = figlet_factory
+        self.banners: Dict[BannerKey, str] = {}
+        self.dirty = False
+        self.logger = logging.getLogger(__name__)
+
+        self._figlets = {}
+        self._lock = threading.Lock()
+        self._prewarm_thread: Optional[threading.Thread] = None
+
+        if path:
+            self.load()
+
+    def render(self, text: str, font: str, width: int = 80) -> str:
+        """
+        Get a banner, rendering it if it is not cached.
+
+        Args:
+            text: Text of the banner
+            font: Figlet font name
+            width: Width the banner is laid out for
+
+        Returns:
+            The rendered banner
+        """
+        key = (font, text, width)
+        banner = self.banners.get(key)
+        if banner is None:
+            with self._lock:
+                banner = self.banners.get(key)
+                if banner is None:
+                    figlet = self._figlets.get((font, width))
+                    if figlet is None:
+                        figlet = self.figlet_factory(font=font, width=width)
+                        self._figlets[(font, width)] = figlet
+                    banner = figlet.renderText(text)
+                    self.banners[key] = banner
+                    self.dirty = True
+        return banner
+
+    def prewarm(
+        self, texts: Iterable[str], font: str, width: int = 80
+    ) -> Optional[threading.Thread]:
+        """
+        Render banners on a background thread and save them when done.
+
+        Args:
+            texts: Texts of the banners
+            font: Figlet font name
+            width: Width the banners are laid out for
+
+        Returns:
+            The thread, or None if every banner was already cached or a
+            prewarm is still running
+        """
+        missing = [text for text in texts if (font, text, width) not in self.banners]
+        if not missing or self.prewarming:
+            return None
+
+        def render_all():
+            try:
+                for text in missing:
+                    self.render(text, font, width)
+            except Exception as e:
+                self.logger.error("Error prewarming %s banners: %s", font, str(e))
+            self.save()
+
+        self._prewarm_thread = threading.Thread(
+            target=render_all, name="banner-prewarm", daemon=True
+        )
+        self._prewarm_thread.start()
+        return self._prewarm_thread
+
+    @property
+    def prewarming(self) -> bool:
+        return self._prewarm_thread is not None and self._prewarm_thread.is_alive()
+
+    def load(self) -> bool:
+        """
+        Load banners from the cache file.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                entries = json.load(file)["banners"]
+            for entry in entries:
+                key = (entry["font"], entry["text"], entry["width"])
+                self.banners.setdefault(key, entry["banner"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.error("Error loading banner cache %s: %s", self.path, str(e))
+            return False
+        return True
+
+    def save(self) -> bool:
+        """
+        Write the banners to the cache file if any were rendered.
+
+        Returns:
+            True if the file is up to date, False if writing failed
+        """
+        if not self.path or not self.dirty:
+            return True
+        with self._lock:
+            entries = [
+                {"font": font, "text": text, "width": width, "banner": banner}
+                for (font, text, width), banner in self.banners.items()
+            ]
+            self.dirty = False
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({"banners": entries}, file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            self.logger.error("Error saving banner cache %s: %s", self.path, str(e))
+            self.dirty = True
+            return False
+        return True
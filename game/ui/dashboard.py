@@ -0,0 +1,280 @@
+import contextlib
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Set
+
+from game.lazy_import import LazyImport
+from game.ui.ui_manager import UIManager
+
+Align = LazyImport("rich.align", "Align")
+Group = LazyImport("rich.console", "Group")
+Layout = LazyImport("rich.layout", "Layout")
+Live = LazyImport("rich.live", "Live")
+Panel = LazyImport("rich.panel", "Panel")
+Rule = LazyImport("rich.rule", "Rule")
+Text = LazyImport("rich.text", "Text")
+
+PANELS = ("header", "status", "log", "menu")
+
+
+class DashboardPanels:
+    """
+    The data each dashboard panel was last drawn from.
+
+    A panel is redrawn only when update() is given data that differs from
+    the data it was last drawn from.
+    """
+
+    def __init__(self):
+        self.data: Dict[str, Hashable] = {}
+        self.changed: Set[str] = set()
+
+    def update(self, name: str, data: Hashable) -> bool:
+        """
+        Record the data a panel should show.
+
+        Args:
+            name: Name of the panel
+            data: Everything the panel's contents are made from
+
+        Returns:
+            True if the panel has to be redrawn
+        """
+        if name in self.data and self.data[name] == data:
+            return False
+        self.data[name] = data
+        self.changed.add(name)
+        return True
+
+    def take_changed(self) -> Set[str]:
+        """Get and clear the names of the panels changed since the last call."""
+        changed = self.changed
+        self.changed = set()
+        return changed
+
+
+class DashboardUI(UIManager):
+    """
+    UIManager drawing into a fixed layout on the terminal's alternate screen.
+
+    The screen is a rich Live display with four panels: the location
+    header, the investigator's status, a log of recent messages and the
+    current menu. Screens draw into the menu panel instead of clearing and
+    reprinting the terminal, messages go to the log without waiting for
+    Enter, and the action screen fills the header and status panels. A
+    panel is only rebuilt when its data changed, and the display is only
+    refreshed when a panel was rebuilt, which keeps the output sent to slow
+    remote terminals small.
+
+    The map views print directly, so the dashboard steps aside while the
+    map is shown. Call close() to leave the alternate screen.
+    """
+
+    def __init__(self, graphic_height=12, screen_width=80, log_size=8):
+        super().__init__(graphic_height, screen_width)
+        self.panels = DashboardPanels()
+        self.log = deque(maxlen=log_size)
+        self.screen = []
+        self.layout = None
+        self.live = None
+        self._classic = False
+
+    def close(self):
+        """Leave the alternate screen."""
+        if self.live is not None:
+            self.live.stop()
+            self.live = None
+        super().close()
+
+    @contextlib.contextmanager
+    def classic(self):
+        """Draw with the plain clear-and-redraw screens while in this block."""
+        self.close()
+        self._classic = True
+        try:
+            yield
+        finally:
+            self._classic = False
+
+    def clear_screen(self):
+        if self._classic:
+            super().clear_screen()
+        else:
+            self.screen = []
+
+    def print(self, *objects, **kwargs):
+        if self._classic:
+            self.console.print(*objects, **kwargs)
+        else:
+            self.screen.extend(objects)
+
+    def rule(self, *args, **kwargs):
+        if self._classic:
+            self.console.rule(*args, **kwargs)
+        else:
+            self.screen.append(Rule(*args, **kwargs))
+
+    def input(self, prompt=""):
+        if self._classic:
+            return super().input(prompt)
+        self.screen.append(prompt)
+        self._set_panel("menu", _screen_key(self.screen), self._menu_panel)
+        self._render()
+        return self.idle.read(input)
+
+    def show_message(self, message, wait_for_input=True):
+        """Add a message to the log panel, which stays on screen, without waiting."""
+        self.log.append(message)
+        self._set_panel("log", tuple(self.log), self._log_panel)
+
+    def show_messages(self, messages, wait_for_input=True):
+        """Add messages to the log panel in one update."""
+        self.log.extend(messages)
+        self._set_panel("log", tuple(self.log), self._log_panel)
+
+    def show_map(self, state):
+        with self.classic():
+            super().show_map(state)
+
+    def show_action_phase(self, state):
+        player = state.player_manager.get_current_player()
+        if not player or not player.investigator:
+            self.show_message("Error: No current player or investigator found!")
+            return "9"  # End turn
+
+        investigator = player.investigator
+        location = state.locations[investigator.current_location]
+        self.banners.prewarm(state.locations, "slant")
+        self._map_state = state
+        self.idle.add(self.warm_map)
+
+        self._set_panel(
+            "header",
+            (
+                location.name,
+                location.real_world_location,
+                location.description,
+                location.has_gate,
+                location.has_clue,
+            ),
+            self._header_panel,
+        )
+        self._set_panel(
+            "status",
+            (
+                player.name,
+                player.is_lead_investigator,
+                investigator.name,
+                state.current_phase.value,
+                investigator.actions,
+                investigator.health,
+                investigator.max_health,
+                investigator.sanity,
+                investigator.max_sanity,
+                investigator.clue_tokens,
+                investigator.train_tickets,
+                investigator.ship_tickets,
+            ),
+            self._status_panel,
+        )
+
+        self.clear_screen()
+        return self._action_menu(investigator.actions)
+
+    def _set_panel(self, name: str, data: Any, build: Callable[[Any], Any]) -> None:
+        if self.panels.update(name, data):
+            self._ensure_live()
+            self.layout[name].update(build(data))
+
+    def _render(self) -> None:
+        self._ensure_live()
+        if self.panels.take_changed():
+            self.live.refresh()
+
+    def _ensure_live(self) -> None:
+        if self.live is not None:
+            return
+        self.layout = Layout()
+        self.layout.split_column(
+            Layout(name="header", size=10),
+            Layout(name="body", size=9),
+            Layout(name="menu"),
+        )
+        self.layout["body"].split_row(Layout(name="status"), Layout(name="log"))
+        for name in PANELS:
+            self.layout[name].update(Panel("", title=name.capitalize()))
+        # Redraw panels left over from before the display was stopped
+        for name, build in self._builders().items():
+            if name in self.panels.data:
+                self.layout[name].update(build(self.panels.data[name]))
+        self.live = Live(
+            self.layout, console=self.console, screen=True, auto_refresh=False
+        )
+        self.live.start()
+        self.live.refresh()
+
+    def _builders(self) -> Dict[str, Callable[[Any], Any]]:
+        return {
+            "header": self._header_panel,
+            "status": self._status_panel,
+            "log": self._log_panel,
+            "menu": self._menu_panel,
+        }
+
+    def _header_panel(self, data):
+        name, real_location, description, has_gate, has_clue = data
+        banner = self.banners.render(name, "slant")
+        lines = [Align.center(f"[bold magenta]{banner}[/]")]
+        if name.startswith("Space ") and real_location:
+            lines.append(Align.center(f"[bold blue]{real_location}[/bold blue]"))
+        lines.append(Align.center(f"[italic cyan]{description}[/]"))
+        if has_gate:
+            lines.append(Align.center("[red]WARNING: There is an open Gate here![/]"))
+        if has_clue:
+            lines.append(Align.center("[yellow]There is a clue to be found here.[/]"))
+        return Panel(Group(*lines), border_style="bright_yellow")
+
+    @staticmethod
+    def _status_panel(data):
+        (
+            player_name,
+            is_lead,
+            investigator_name,
+            phase,
+            actions,
+            health,
+            max_health,
+            sanity,
+            max_sanity,
+            clue_tokens,
+            train_tickets,
+            ship_tickets,
+        ) = data
+        lead = " [yellow](Lead Investigator)[/yellow]" if is_lead else ""
+        return Panel(
+            f"Player: [bold]{player_name}[/bold]{lead}\n"
+            f"Investigator: [bold]{investigator_name}[/bold]\n"
+            f"Phase: [bold]{phase}[/bold]\n"
+            f"Actions Remaining: [bold green]{actions}[/bold green]\n"
+            f"Health: {health}/{max_health} | Sanity: {sanity}/{max_sanity}\n"
+            f"Clue Tokens: {clue_tokens}\n"
+            f"Train Tickets: {train_tickets} | Ship Tickets: {ship_tickets}",
+            title="Investigator",
+        )
+
+    @staticmethod
+    def _log_panel(messages):
+        lines = [
+            Text.from_markup(f"[italic]{message}[/italic]") for message in messages
+        ]
+        return Panel(Group(*lines), title="Messages")
+
+    def _menu_panel(self, data):
+        return Panel(Group(*self.screen), title="Menu")
+
+
+def _screen_key(screen):
+    # Screens of plain text compare by value. Other renderables can't be
+    # compared, so a screen holding one gets a key equal to nothing
+    if all(isinstance(item, str) for item in screen):
+        return tuple(screen)
+    return object()
@@ -1,235 +1,283 @@
+from typing import Dict, List, Optional
+
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 from rich.box import SIMPLE
 
+from game.ui.map_layers import LocationMarks, MapLayers
+
+# Regions shown as columns of the world map
+REGIONS = [
+    "North America",
+    "Europe",
+    "Asia",
+    "Pacific",
+    "South America",
+    "Africa",
+]
+
+# Locations by region (organized for better visual layout)
+REGION_LOCATIONS = {
+    "North America": ["Arkham", "San Francisco", "Space 1", "Space 4"],
+    "Europe": ["London", "Rome", "Istanbul", "Space 7", "Space 8"],
+    "Asia": ["Tokyo", "Shanghai", "Space 11", "Space 12"],
+    "Pacific": ["Sydney", "Space 2", "Space 3"],
+    "South America": ["Buenos Aires", "Space 5", "Space 6"],
+    "Africa": ["Cairo", "Space 9", "Space 10"],
+}
+
+# Graphical map layout - each location has x,y coordinates, positioned
+# roughly by geography
+MAP_LAYOUT = {
+    "Arkham": (10, 2),
+    "London": (25, 2),
+    "Tokyo": (45, 2),
+    "Sydney": (55, 2),
+    "Buenos Aires": (15, 3),
+    "San Francisco": (5, 4),
+    "Rome": (30, 4),
+    "Shanghai": (50, 4),
+    "Space 1": (2, 5),
+    "Space 2": (20, 5),
+    "Space 3": (40, 5),
+    "Space 4": (5, 6),
+    "Space 5": (15, 6),
+    "Space 6": (25, 6),
+    "Istanbul": (35, 6),
+    "Space 7": (45, 6),
+    "Space 8": (55, 6),
+    "Space 9": (10, 7),
+    "Space 10": (30, 7),
+    "Space 11": (50, 7),
+    "Space 12": (60, 7),
+    "Space 13": (20, 8),
+    "Space 14": (40, 8),
+    "Space 15": (60, 8),
+    "Cairo": (30, 9),
+}
+GRID_HEIGHT = 12
+GRID_WIDTH = 70
+
+LEGEND = [
+    "\n[bold]Legend:[/bold]",
+    "* [green]Your location[/green]",
+    "+ [green]Other investigators[/green]",
+    "G [red]Gate[/red]",
+    "C [red]Clue[/red]",
+    "M# [red]Monsters (number)[/red]",
+]
+
 
 class MapDisplay:
+    """
+    Draws the board as a region map, a connection diagram or a character grid.
+
+    Each view's static layer is built once per board through MapLayers.
+    Tables and grid rows are cached with the marks of their locations, and
+    only the locations MapLayers reports as changed are redrawn: their
+    cells in place, so the tables holding them are kept, and the grid rows
+    they are on. Showing a view again costs the same however long the game
+    has run.
+    """
+
     def __init__(self, screen_width=100):
         self.screen_width = screen_width
         self.console = Console(width=screen_width)
+        self.layers = MapLayers()
+
+        self._board_revision = None
+        self._cells: Dict[str, Text] = {}
+        self._tables: Dict[str, Table] = {}
+        self._grid_rows: Optional[List[str]] = None
 
     def display_world_map(self, game_state):
         """Display a structured ASCII world map with locations and connections"""
-        map_table = Table(
-            box=SIMPLE, show_header=True, header_style="bold magenta", padding=(0, 2)
-        )
-
-        # Define regions as columns
-        regions = [
-            "North America",
-            "Europe",
-            "Asia",
-            "Pacific",
-            "South America",
-            "Africa",
-        ]
-
-        # Add columns with better spacing
-        for region in regions:
-            map_table.add_column(region, justify="center")
-
-        # Define locations by region (organized for better visual layout)
-        region_locations = {
-            "North America": ["Arkham", "San Francisco", "Space 1", "Space 4"],
-            "Europe": ["London", "Rome", "Istanbul", "Space 7", "Space 8"],
-            "Asia": ["Tokyo", "Shanghai", "Space 11", "Space 12"],
-            "Pacific": ["Sydney", "Space 2", "Space 3"],
-            "South America": ["Buenos Aires", "Space 5", "Space 6"],
-            "Africa": ["Cairo", "Space 9", "Space 10"],
-        }
-
-        # Maximum number of locations in any region
-        max_locations = max(len(locations) for locations in region_locations.values())
-
-        # Build the map row by row
-        for i in range(max_locations):
-            row = []
-            for region in regions:
-                locations = region_locations.get(region, [])
-                if i < len(locations):
-                    location_name = locations[i]
-                    location = game_state.locations.get(location_name)
-
-                    # Skip if location doesn't exist in game state
-                    if not location:
-                        row.append("")
-                        continue
-
-                    # Build location display with status indicators
-                    location_text = Text()
-
-                    # Show if player is here
-                    if game_state.investigator.current_location == location_name:
-                        location_text.append("* ", style="bold green")
-
-                    # Add location name
-                    location_text.append(f"{location_name}")
-
-                    # Add indicators for gates, clues, monsters
-                    indicators = []
-                    if location.has_gate:
-                        indicators.append("G")
-                    if location.clues > 0:
-                        indicators.append(f"C{location.clues}")
-                    if location.monsters:
-                        indicators.append(f"M{len(location.monsters)}")
-
-                    if indicators:
-                        location_text.append(
-                            f" [{','.join(indicators)}]", style="bold red"
-                        )
-
-                    row.append(location_text)
-                else:
-                    row.append("")
-            map_table.add_row(*row)
-
-        # Display the map
-        self.console.print(map_table)
-
-        # Display legend
-        self.console.print("\n[bold]Legend:[/bold]")
-        self.console.print("* [green]Your location[/green]")
-        self.console.print("G [red]Gate[/red]")
-        self.console.print("C# [red]Clues (number)[/red]")
-        self.console.print("M# [red]Monsters (number)[/red]")
+        self._update(game_state)
+        self.console.print(self._world_table())
+        self._print_legend()
 
     def display_connection_diagram(self, game_state):
         """Display a text-based connection diagram showing how locations connect"""
-        conn_table = Table(
-            title="Location Connections",
-            show_header=True,
-            box=SIMPLE,
-            header_style="bold cyan",
-            padding=(0, 1),
-            width=self.screen_width,  # Use full screen width
-        )
-
-        conn_table.add_column("Location", style="cyan", no_wrap=True)
-        conn_table.add_column("Connected To", style="green")
-        conn_table.add_column("Train Routes", style="yellow")
-        conn_table.add_column("Ship Routes", style="blue")
-
-        # Add rows for each location
-        for name, location in game_state.locations.items():
-            # Build location display with status indicators
-            location_text = Text()
-
-            # Show if player is here
-            if game_state.investigator.current_location == name:
-                location_text.append("* ", style="bold green")
-
-            # Add location name
-            location_text.append(f"{name}")
-
-            # Add indicators for gates, clues, monsters
-            indicators = []
-            if location.has_gate:
-                indicators.append("G")
-            if location.clues > 0:
-                indicators.append(f"C{location.clues}")
-            if location.monsters:
-                indicators.append(f"M{len(location.monsters)}")
-
-            if indicators:
-                location_text.append(f" [{','.join(indicators)}]", style="bold red")
-
-            conn_text = "\n".join(location.connections)
-            train_text = (
-                "\n".join(location.train_paths) if location.train_paths else "-"
-            )
-            ship_text = "\n".join(location.ship_paths) if location.ship_paths else "-"
-
-            conn_table.add_row(location_text, conn_text, train_text, ship_text)
-
-        # Display the connections
-        self.console.print(conn_table)
-
-        # Display legend
-        self.console.print("\n[bold]Legend:[/bold]")
-        self.console.print("* [green]Your location[/green]")
-        self.console.print("G [red]Gate[/red]")
-        self.console.print("C# [red]Clues (number)[/red]")
-        self.console.print("M# [red]Monsters (number)[/red]")
+        self._update(game_state)
+        self.console.print(self._connection_table())
+        self._print_legend()
 
     def display_graphical_map(self, game_state):
         """Display a more graphical ASCII map with better visual separation"""
+        self._update(game_state)
         self.console.print("[bold]GRAPHICAL WORLD MAP[/bold]")
+        if self._grid_rows is None:
+            self._grid_rows = [self._grid_row(y) for y in range(GRID_HEIGHT)]
+        for row in self._grid_rows:
+            self.console.print(row, markup=False, highlight=False)
+
+    def warm(self, game_state) -> bool:
+        """
+        Draw one view that is not cached yet, without printing it.
+        Used as an idle task, so opening the map shows cached drawings.
+
+        Args:
+            game_state: The game state
+
+        Returns:
+            True if a view was drawn, False if every view was cached
+        """
+        self._update(game_state)
+        if "world" not in self._tables:
+            self._world_table()
+        elif "connections" not in self._tables:
+            self._connection_table()
+        elif self._grid_rows is None:
+            self._grid_rows = [self._grid_row(y) for y in range(GRID_HEIGHT)]
+        else:
+            return False
+        return True
+
+    def _world_table(self) -> Table:
+        map_table = self._tables.get("world")
+        if map_table is None:
+            rows = self.layers.static("world", self._build_world_rows)
+            map_table = Table(
+                box=SIMPLE,
+                show_header=True,
+                header_style="bold magenta",
+                padding=(0, 2),
+            )
+            for region in REGIONS:
+                map_table.add_column(region, justify="center")
+            for row in rows:
+                map_table.add_row(*(self._cell(name) if name else "" for name in row))
+            self._tables["world"] = map_table
+        return map_table
+
+    def _connection_table(self) -> Table:
+        conn_table = self._tables.get("connections")
+        if conn_table is None:
+            rows = self.layers.static("connections", self._build_connection_rows)
+            conn_table = Table(
+                title="Location Connections",
+                show_header=True,
+                box=SIMPLE,
+                header_style="bold cyan",
+                padding=(0, 1),
+                width=self.screen_width,  # Use full screen width
+            )
+            conn_table.add_column("Location", style="cyan", no_wrap=True)
+            conn_table.add_column("Connected To", style="green")
+            conn_table.add_column("Train Routes", style="yellow")
+            conn_table.add_column("Ship Routes", style="blue")
+            for name, conn_text, train_text, ship_text in rows:
+                conn_table.add_row(self._cell(name), conn_text, train_text, ship_text)
+            self._tables["connections"] = conn_table
+        return conn_table
+
+    def _update(self, game_state) -> None:
+        """Redraw the cached drawings of locations whose marks changed."""
+        self.layers.attach(game_state)
+        changed = self.layers.refresh()
+        if self.layers.board_revision != self._board_revision:
+            self._board_revision = self.layers.board_revision
+            self._cells.clear()
+            self._tables.clear()
+            self._grid_rows = None
+            return
+        if not changed:
+            return
+
+        for name in changed:
+            cell = self._cells.get(name)
+            if cell is not None:
+                self._draw_cell(name, cell)
+        if self._grid_rows is not None:
+            # Indicators may spill over a neighbour, so redraw whole rows
+            placed = self.layers.static("graphical", self._build_grid)["placed"]
+            for y in {placed[name][1] for name in changed if name in placed}:
+                self._grid_rows[y] = self._grid_row(y)
+
+    def _cell(self, name: str) -> Text:
+        """Get the cell of a location: its name and marks."""
+        cell = self._cells.get(name)
+        if cell is None:
+            cell = self._cells[name] = Text()
+            self._draw_cell(name, cell)
+        return cell
+
+    def _draw_cell(self, name: str, cell: Text) -> None:
+        """Draw a location's name and marks into its cell, replacing the old."""
+        marks = self.layers.marks.get(name, LocationMarks())
+        cell.plain = ""
+        cell.spans = []
+        if marks.current_player:
+            cell.append("* ", style="bold green")
+        elif marks.investigators:
+            cell.append("+ ", style="green")
+        cell.append(name)
+        if marks.indicators:
+            cell.append(f" [{','.join(marks.indicators)}]", style="bold red")
+
+    def _grid_row(self, y: int) -> str:
+        """Draw one grid row: the static row with the marks of its locations."""
+        grid = self.layers.static("graphical", self._build_grid)
+        row = list(grid["rows"][y])
+        for name, x in grid["by_row"].get(y, []):
+            marks = self.layers.marks.get(name, LocationMarks())
+            if marks.current_player:
+                row[x] = "*"
+            indicators = marks.indicators
+            if indicators and x + 1 < len(row):
+                row[x + 1] = "["
+                for i, indicator in enumerate(indicators):
+                    if x + 2 + i < len(row):
+                        row[x + 2 + i] = indicator[0]
+                if x + 2 + len(indicators) < len(row):
+                    row[x + 2 + len(indicators)] = "]"
+        return "".join(row)
+
+    def _print_legend(self) -> None:
+        for line in LEGEND:
+            self.console.print(line)
+
+    @staticmethod
+    def _build_world_rows(locations) -> List[List[Optional[str]]]:
+        max_locations = max(len(names) for names in REGION_LOCATIONS.values())
+        rows = []
+        for i in range(max_locations):
+            row = []
+            for region in REGIONS:
+                names = REGION_LOCATIONS.get(region, [])
+                # Leave the cell empty if the location doesn't exist in the game
+                exists = i < len(names) and names[i] in locations
+                row.append(names[i] if exists else None)
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _build_connection_rows(locations):
+        return [
+            (
+                name,
+                "\n".join(location.connections),
+                "\n".join(location.train_paths) if location.train_paths else "-",
+                "\n".join(location.ship_paths) if location.ship_paths else "-",
+            )
+            for name, location in locations.items()
+        ]
 
-        # Define a more visual map layout with Unicode box characters
-        # This is a simplified representation - locations are positioned roughly by geography
-
-        # Map layout - each location has x,y coordinates
-        map_layout = {
-            "Arkham": (10, 2),
-            "London": (25, 2),
-            "Tokyo": (45, 2),
-            "Sydney": (55, 2),
-            "Buenos Aires": (15, 3),
-            "San Francisco": (5, 4),
-            "Rome": (30, 4),
-            "Shanghai": (50, 4),
-            "Space 1": (2, 5),
-            "Space 2": (20, 5),
-            "Space 3": (40, 5),
-            "Space 4": (5, 6),
-            "Space 5": (15, 6),
-            "Space 6": (25, 6),
-            "Istanbul": (35, 6),
-            "Space 7": (45, 6),
-            "Space 8": (55, 6),
-            "Space 9": (10, 7),
-            "Space 10": (30, 7),
-            "Space 11": (50, 7),
-            "Space 12": (60, 7),
-            "Space 13": (20, 8),
-            "Space 14": (40, 8),
-            "Space 15": (60, 8),
-            "Cairo": (30, 9),
-        }
-
-        # Create a grid for the map
-        grid_height = 12
-        grid_width = 70
-        grid = [[" " for _ in range(grid_width)] for _ in range(grid_height)]
-
-        # Place locations on the grid
-        for name, (x, y) in map_layout.items():
-            if name not in game_state.locations:
+    @staticmethod
+    def _build_grid(locations):
+        """Place the first letter of each location on an empty grid."""
+        rows = [[" "] * GRID_WIDTH for _ in range(GRID_HEIGHT)]
+        placed = {}
+        by_row: Dict[int, list] = {}
+        for name, (x, y) in MAP_LAYOUT.items():
+            if name not in locations or y >= GRID_HEIGHT or x >= GRID_WIDTH:
                 continue
-
-            location = game_state.locations[name]
-
-            # Create location marker
-            marker = name
-
-            # Add indicators
-            indicators = []
-            if location.has_gate:
-                indicators.append("G")
-            if location.clues > 0:
-                indicators.append(f"C{location.clues}")
-            if location.monsters:
-                indicators.append(f"M{len(location.monsters)}")
-
-            # Place on grid (simplified - just the first character and indicators)
-            if y < len(grid) and x < len(grid[y]):
-                # Player marker
-                if game_state.investigator.current_location == name:
-                    grid[y][x] = "*"
-                else:
-                    grid[y][x] = name[0]  # First letter of location
-
-                # Add indicators if they exist
-                if indicators and x + 1 < len(grid[y]):
-                    grid[y][x + 1] = "["
-                    for i, ind in enumerate(indicators):
-                        if x + 2 + i < len(grid[y]):
-                            grid[y][x + 2 + i] = ind[0]  # First character of indicator
-                    if x + 2 + len(indicators) < len(grid[y]):
-                        grid[y][x + 2 + len(indicators)] = "]"
-
-        # Print the grid
-        for row in grid:
-            self.console.print("".join(row))
+            rows[y][x] = name[0]
+            placed[name] = (x, y)
+            by_row.setdefault(y, []).append((name, x))
+        return {
+            "rows": ["".join(row) for row in rows],
+            "placed": placed,
+            "by_row": by_row,
+        }
@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+@dataclass(frozen=True)
+class LocationMarks:
+    """The dynamic indicators drawn on a location."""
+
+    current_player: bool = False
+    investigators: int = 0
+    gate: bool = False
+    clue: bool = False
+    monsters: int = 0
+
+    @property
+    def indicators(self) -> List[str]:
+        """Token indicators, e.g. ["G", "C", "M2"]."""
+        indicators = []
+        if self.gate:
+            indicators.append("G")
+        if self.clue:
+            indicators.append("C")
+        if self.monsters:
+            indicators.append(f"M{self.monsters}")
+        return indicators
+
+
+class MapLayers:
+    """
+    The board split into a static layer and dynamic marks, for map views.
+
+    The static layer of a view (names, connections, routes, placement) is
+    built once per board by the view's builder and cached. The marks of a
+    location (gate, clue, monsters and investigators) are kept per location
+    and recomputed only for locations in the dirty set, which observers on
+    the locations, investigators and player order fill as the game changes.
+    refresh() returns the locations whose marks changed, so a view only
+    redraws those.
+    """
+
+    def __init__(self):
+        self.state = None
+        self.board_revision = 0
+        self.marks: Dict[str, LocationMarks] = {}
+        self.dirty: Set[str] = set()
+        self.stale = True
+
+        self._static: Dict[str, Any] = {}
+        self._locations = None
+        # Observed investigators, and where each was, by id(investigator)
+        self._investigators: List[Any] = []
+        self._investigator_locations: Dict[int, str] = {}
+        self._player_count = 0
+        self._current_location: Optional[str] = None
+
+    def attach(self, state) -> None:
+        """
+        Follow a game state. Does nothing if it is already followed.
+
+        Args:
+            state: The game state
+        """
+        if state is self.state:
+            return
+        if self.state is not None:
+            self.detach()
+        self.state = state
+        state.add_observer(self._state_changed)
+        state.player_manager.add_observer(self._player_manager_changed)
+        self.stale = True
+
+    def detach(self) -> None:
+        """Stop following the game state."""
+        if self.state is None:
+            return
+        self._unobserve_board()
+        self.state.remove_observer(self._state_changed)
+        self.state.player_manager.remove_observer(self._player_manager_changed)
+        self.state = None
+        self.stale = True
+
+    def static(self, view: str, build: Callable[[Dict[str, Any]], Any]) -> Any:
+        """
+        Get the static layer of a view, building it on first use.
+        refresh() must have been called since the board was replaced.
+
+        Args:
+            view: Name of the view
+            build: Function making the layer from the locations
+
+        Returns:
+            The cached layer
+        """
+        if view not in self._static:
+            self._static[view] = build(self.state.locations)
+        return self._static[view]
+
+    def refresh(self) -> Set[str]:
+        """
+        Recompute the marks of dirty locations.
+
+        Returns:
+            Names of the locations whose marks changed. After the board was
+            replaced every location is returned and board_revision is bumped
+        """
+        state = self.state
+        if state is None:
+            return set()
+
+        # Players are added in place during setup, without a notification
+        if len(state.player_manager.players) != self._player_count:
+            self._observe_investigators()
+
+        if self.stale or state.locations is not self._locations:
+            self._unobserve_board()
+            self._observe_board()
+            self._static.clear()
+            self.marks.clear()
+            self.board_revision += 1
+            self.dirty = set(state.locations)
+            self.stale = False
+
+        current = self._current_player_location()
+        if current != self._current_location:
+            self._mark(self._current_location)
+            self._mark(current)
+            self._current_location = current
+
+        changed = set()
+        if self.dirty:
+            investigators = self._investigator_counts()
+            for name in self.dirty:
+                location = state.locations.get(name)
+                if location is None:
+                    continue
+                marks = LocationMarks(
+                    current_player=name == current,
+                    investigators=investigators.get(name, 0),
+                    gate=location.has_gate,
+                    clue=location.has_clue,
+                    monsters=len(location.monsters),
+                )
+                if self.marks.get(name) != marks:
+                    self.marks[name] = marks
+                    changed.add(name)
+            self.dirty.clear()
+        return changed
+
+    def _mark(self, name: Optional[str]) -> None:
+        if name is not None:
+            self.dirty.add(name)
+
+    def _current_player_location(self) -> Optional[str]:
+        player = self.state.player_manager.get_current_player()
+        if player is None or player.investigator is None:
+            return None
+        return player.investigator.current_location
+
+    def _investigator_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for location in self._investigator_locations.values():
+            counts[location] = counts.get(location, 0) + 1
+        return counts
+
+    def _observe_board(self) -> None:
+        self._locations = self.state.locations
+        for location in self._locations.values():
+            location.add_observer(self._location_changed)
+        self._observe_investigators()
+
+    def _unobserve_board(self) -> None:
+        if self._locations is not None:
+            for location in self._locations.values():
+                location.remove_observer(self._location_changed)
+            self._locations = None
+        # The players may have new investigators since they were observed
+        for investigator in self._investigators:
+            investigator.remove_observer(self._investigator_changed)
+        self._investigators = []
+        self._investigator_locations = {}
+
+    def _observe_investigators(self) -> None:
+        players = self.state.player_manager.players
+        for player in players:
+            investigator = player.investigator
+            if investigator and id(investigator) not in self._investigator_locations:
+                investigator.add_observer(self._investigator_changed)
+                self._investigators.append(investigator)
+                self._investigator_locations[id(investigator)] = (
+                    investigator.current_location
+                )
+                self._mark(investigator.current_location)
+        self._player_count = len(players)
+
+    def _state_changed(self, state, name: Optional[str]) -> None:
+        if name == "locations":
+            self.stale = True
+
+    def _player_manager_changed(self, player_manager, name: Optional[str]) -> None:
+        if name == "players":
+            self.stale = True
+
+    def _location_changed(self, location, name: Optional[str]) -> None:
+        self.dirty.add(location.name)
+
+    def _investigator_changed(self, investigator, name: Optional[str]) -> None:
+        if name not in ("current_location", None):
+            return
+        previous = self._investigator_locations.get(id(investigator))
+        if previous != investigator.current_location:
+            self._mark(previous)
+            self._mark(investigator.current_location)
+            self._investigator_locations[id(investigator)] = (
+                investigator.current_location
+            )
@@ -0,0 +1,67 @@
+from typing import List
+
+# UI calls that ask inline, below what is already on screen. Messages shown
+# before them stay visible, so they need no Enter of their own
+INLINE_METHODS = frozenset({"ask_yes_no"})
+
+
+class MessageFeed:
+    """
+    UI wrapper that collects messages and shows them in batches.
+
+    show_message() never blocks: messages are held until the game makes
+    its next UI call, the end of the resolution step that produced them,
+    and are then shown together with the UI's show_messages(). Before an
+    inline question the batch is shown without waiting, since the question
+    waits anyway; before any other screen, which may clear the terminal,
+    the player confirms the whole batch with one Enter instead of one per
+    message. UIs with a persistent message log never wait.
+
+    Every other attribute is passed through to the wrapped UI.
+    """
+
+    def __init__(self, ui):
+        self.ui = ui
+        self.pending: List[str] = []
+
+    def show_message(self, message, wait_for_input=True):
+        self.pending.append(str(message))
+
+    def flush(self, wait_for_input: bool = True) -> None:
+        """
+        Show the pending messages.
+
+        Args:
+            wait_for_input: Whether the player confirms them before the game
+                goes on
+        """
+        if not self.pending:
+            return
+        messages, self.pending = self.pending, []
+        show_messages = getattr(self.ui, "show_messages", None)
+        if show_messages is not None:
+            show_messages(messages, wait_for_input=wait_for_input)
+        else:
+            self.ui.show_message("\n".join(messages), wait_for_input=wait_for_input)
+
+    def close(self) -> None:
+        """Show the last messages and release the wrapped UI."""
+        self.flush()
+        close = getattr(self.ui, "close", None)
+        if close is not None:
+            close()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        attribute = getattr(self.ui, name)
+        if not callable(attribute):
+            return attribute
+
+        wait_for_input = name not in INLINE_METHODS
+
+        def method(*args, **kwargs):
+            self.flush(wait_for_input)
+            return attribute(*args, **kwargs)
+
+        return method
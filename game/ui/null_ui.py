@@ -0,0 +1,152 @@
+import random
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from game.systems.decisions import DECISION_METHODS, DecisionRequest
+
+# policy(request) answers a DecisionRequest. The legal answers are the
+# request's options, which the game works out when it asks
+UIPolicy = Callable[[DecisionRequest], Any]
+
+# Answers that end the session or the turn instead of the first option,
+# so games answered by the policies below finish
+ENDING_ANSWERS = {"show_main_menu": "3", "show_action_phase": "9"}
+
+
+class ScriptExhausted(Exception):
+    """Raised by ScriptedUI when a decision is asked after the last answer."""
+
+
+def _ignore(*args, **kwargs):
+    return None
+
+
+def first_option(request: DecisionRequest) -> Any:
+    """
+    Policy answering every decision with its first option.
+
+    The main menu quits and the action menu ends the turn instead, so a game
+    played with this policy finishes. Free text is answered with a name.
+    """
+    if request.method in ENDING_ANSWERS:
+        return ENDING_ANSWERS[request.method]
+    if request.options:
+        return request.options[0]
+    if request.method == "show_player_name_entry":
+        return f"Player {request.args[0]}"
+    return ""
+
+
+def random_policy(rng: random.Random) -> UIPolicy:
+    """
+    Make a policy answering every decision with a random option.
+
+    The main menu always quits, so a session played with it ends once its
+    game does.
+
+    Args:
+        rng: Source of the choices, seeded for repeatable answers
+
+    Returns:
+        The policy
+    """
+
+    def policy(request: DecisionRequest) -> Any:
+        if request.method == "show_main_menu":
+            return ENDING_ANSWERS[request.method]
+        if request.options:
+            return rng.choice(request.options)
+        return first_option(request)
+
+    return policy
+
+
+class NullUI:
+    """
+    UI stand-in that renders nothing and reads no input.
+
+    It answers every UIManager call: display calls do nothing and decisions
+    are answered by a policy, first_option() without one. DecisionRequest.ask()
+    hands NullUI the whole request, so policies see its options; decision
+    methods called directly get a request without options. With record=True
+    every call is logged to prompts as (method, args).
+
+    The function for each method is made on first use and cached on the
+    instance, so later calls cost a plain attribute lookup.
+    """
+
+    def __init__(self, policy: Optional[UIPolicy] = None, record: bool = False):
+        self.policy = policy
+        self.prompts: Optional[List[Tuple[str, tuple]]] = [] if record else None
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if name in DECISION_METHODS:
+
+            def method(*args, **kwargs):
+                return self.answer(DecisionRequest(name, args))
+
+        elif self.prompts is not None:
+
+            def method(*args, **kwargs):
+                self.prompts.append((name, args))
+
+        else:
+            method = _ignore
+
+        setattr(self, name, method)
+        return method
+
+    def answer(self, request: DecisionRequest) -> Any:
+        """
+        Answer a decision, logging it to prompts when recording.
+
+        Args:
+            request: The decision
+
+        Returns:
+            The answer
+        """
+        if self.prompts is not None:
+            self.prompts.append((request.method, request.args))
+        return self.decide(request)
+
+    def decide(self, request: DecisionRequest) -> Any:
+        """
+        Answer a decision.
+
+        Args:
+            request: The decision
+
+        Returns:
+            The answer
+        """
+        if self.policy is None:
+            return first_option(request)
+        return self.policy(request)
+
+
+class ScriptedUI(NullUI):
+    """
+    NullUI that answers decisions from a script, in order.
+
+    Once the script runs out the policy answers instead, or ScriptExhausted
+    is raised if there is no policy.
+    """
+
+    def __init__(
+        self,
+        answers: Iterable[Any],
+        policy: Optional[UIPolicy] = None,
+        record: bool = False,
+    ):
+        super().__init__(policy, record)
+        self.answers = iter(answers)
+
+    def decide(self, request: DecisionRequest) -> Any:
+        for answer in self.answers:
+            return answer
+        if self.policy is None:
+            raise ScriptExhausted(request.method)
+        return self.policy(request)
@@ -1,21 +1,52 @@
-from rich.console import Console
-from rich.rule import Rule
-from rich.panel import Panel
-from rich.align import Align
-from rich.table import Table
-from pyfiglet import Figlet  # type: ignore
 import os
-from game.ui.map_display import MapDisplay
 from game.enums import GamePhase, TicketType
 from game.entities.location import Location
+from game.lazy_import import LazyImport
+from game.systems.idle_tasks import IdleTasks
+from game.ui.banner_cache import BannerCache
+
+# Rendering libraries are imported on first use, so importing this module
+# stays cheap for code paths that never draw to the terminal
+Console = LazyImport("rich.console", "Console")
+Rule = LazyImport("rich.rule", "Rule")
+Panel = LazyImport("rich.panel", "Panel")
+Align = LazyImport("rich.align", "Align")
+Table = LazyImport("rich.table", "Table")
+MapDisplay = LazyImport("game.ui.map_display", "MapDisplay")
+
+# Lines of the action menu, shared by every UI drawing the action screen
+ACTION_MENU = (
+    "\nAvailable Actions:",
+    "1. Travel",
+    "2. Rest (heal 1 Health and 1 Sanity)",
+    "3. Trade with another investigator",
+    "4. Prepare for Travel (gain 1 ticket of your choice)",
+    "5. Acquire Assets",
+    "6. Perform a Component Action",
+    "\nOther Options:",
+    "7. View Map",
+    "9. End Turn (Advance to Encounter Phase)",
+)
 
 
 class UIManager:
     def __init__(self, graphic_height=12, screen_width=80):
         self.console = Console()
         self.console_methods = [f for f in dir(self.console) if not f.startswith("__")]
-        self.fig = Figlet(font="banner")
-        self.map_display = MapDisplay(screen_width)
+        self.screen_width = screen_width
+        self.banners = BannerCache()
+        self._map_display = None
+
+        # Work done while waiting on the player, see input()
+        self.idle = IdleTasks()
+        self._map_state = None
+
+    @property
+    def map_display(self):
+        """Map renderer, created the first time the map is opened."""
+        if self._map_display is None:
+            self._map_display = MapDisplay(self.screen_width)
+        return self._map_display
 
     # Add a new method to show the map
     def show_map(self, state):
@@ -59,6 +90,20 @@ class UIManager:
                 f"'{self.__class__.__name__}' object has no attribute '{name}'"
             )
 
+    def close(self):
+        """Release the terminal and stop idle work."""
+        self.idle.close()
+
+    def input(self, prompt=""):
+        """Read a line from the player, doing idle work while waiting."""
+        return self.idle.read(self.console.input, prompt)
+
+    def warm_map(self) -> bool:
+        """Idle task: draw the map views of the game on the action screen."""
+        if self._map_state is None:
+            return False
+        return self.map_display.warm(self._map_state)
+
     def clear_screen(self):
         os.system("cls" if os.name == "nt" else "clear")
 
@@ -68,6 +113,17 @@ class UIManager:
         if wait_for_input:
             self.input("\n[bold cyan]Press Enter to continue...[/]")
 
+    def show_messages(self, messages, wait_for_input=True):
+        """Display several messages together in one panel."""
+        self.print(
+            Panel(
+                "\n".join(f"[italic]{message}[/italic]" for message in messages),
+                title="Messages",
+            )
+        )
+        if wait_for_input:
+            self.input("\n[bold cyan]Press Enter to continue...[/]")
+
     def ask_yes_no(self, question):
         """Ask the player a yes/no question."""
         while True:
@@ -81,7 +137,7 @@ class UIManager:
 
     def show_main_menu(self):
         self.clear_screen()
-        ascii_title = self.fig.renderText("Eldritch Pursuit")
+        ascii_title = self.banners.render("Eldritch Pursuit", "banner")
         self.print(Align.center(f"[bold magenta]{ascii_title}[/]"), highlight=False)
         self.rule(style="bright_yellow")
         self.print(
@@ -306,9 +362,12 @@ Good luck, investigator. The fate of the world is in your hands.
         real_location = location.real_world_location
         location_desc = location.description
 
-        # Create ASCII art title - use just the primary location name
-        location_fig = Figlet(font="slant")
-        ascii_title = location_fig.renderText(location_name)
+        # Create ASCII art title - use just the primary location name. The
+        # other locations' titles are rendered in the background meanwhile
+        self.banners.prewarm(state.locations, "slant")
+        self._map_state = state
+        self.idle.add(self.warm_map)
+        ascii_title = self.banners.render(location_name, "slant")
 
         self.print(Align.center(f"[bold magenta]{ascii_title}[/]"), highlight=False)
 
@@ -358,27 +417,25 @@ Good luck, investigator. The fate of the world is in your hands.
         )
 
         # Display available actions
-        if current_investigator.actions > 0:
-            self.print("\nAvailable Actions:")
-            self.print("1. Travel")
-            self.print("2. Rest (heal 1 Health and 1 Sanity)")
-            self.print("3. Trade with another investigator")
-            self.print("4. Prepare for Travel (gain 1 ticket of your choice)")
-            self.print("5. Acquire Assets")
-            self.print("6. Perform a Component Action")
-
-            self.print("\nOther Options:")
-            self.print("7. View Map")
-            self.print("9. End Turn (Advance to Encounter Phase)")
+        return self._action_menu(current_investigator.actions)
 
-            choice = self.input(
-                "\n[bold cyan]Enter your choice[/] [yellow](1-7, 9)[/]: "
-            )
-            return choice
-        else:
-            self.print("\n[bold red]You have no actions remaining![/]")
-            self.input("\n[bold cyan]Press Enter to continue to Encounter Phase...[/]")
-            return "9"
+    def _action_menu(self, actions):
+        """Print the action menu and get the player's choice.
+
+        Args:
+            actions: Actions the investigator has left
+
+        Returns:
+            The chosen menu option, "9" (end turn) if no actions are left
+        """
+        if actions > 0:
+            for line in ACTION_MENU:
+                self.print(line)
+            return self.input("\n[bold cyan]Enter your choice[/] [yellow](1-7, 9)[/]: ")
+
+        self.print("\n[bold red]You have no actions remaining![/]")
+        self.input("\n[bold cyan]Press Enter to continue to Encounter Phase...[/]")
+        return "9"
 
     def show_travel_menu(self, state):
         """Display travel options for the current location"""
@@ -478,7 +535,7 @@ Good luck, investigator. The fate of the world is in your hands.
 
     def show_victory_screen(self):
         self.clear_screen()
-        ascii_title = self.fig.renderText("VICTORY")
+        ascii_title = self.banners.render("VICTORY", "banner")
         self.print(Align.center(f"[bold magenta]{ascii_title}[/]"), highlight=False)
         self.rule(style="bright_yellow")
         self.print(
@@ -497,7 +554,7 @@ Good luck, investigator. The fate of the world is in your hands.
 
     def show_defeat_screen(self, reason):
         self.clear_screen()
-        ascii_title = self.fig.renderText("DEFEAT")
+        ascii_title = self.banners.render("DEFEAT", "banner")
         self.print(Align.center(f"[bold magenta]{ascii_title}[/]"), highlight=False)
         self.rule(style="bright_yellow")
         self.print(Align.center(f"[red]{reason}[/red]"))
@@ -514,8 +571,15 @@ Good luck, investigator. The fate of the world is in your hands.
         self.rule(style="bright_yellow")
         self.input("\n[bold cyan]Press Enter to return to the main menu...[/]")
 
-    def show_choose_encounter(self, available_decks, current_location):
-        """Display encounter deck options for the current location"""
+    def show_choose_encounter(self, available_decks, current_location, deck_scores=None):
+        """Display encounter deck options for the current location
+
+        Args:
+            available_decks: List of (label, description) tuples
+            current_location: Name of the investigator's location
+            deck_scores: Optional expected score of each deck from the
+                encounter statistics; the best deck is marked as recommended
+        """
         self.clear_screen()
 
         self.print(Align.center("[bold magenta]CHOOSE ENCOUNTER[/bold magenta]"))
@@ -523,11 +587,16 @@ Good luck, investigator. The fate of the world is in your hands.
 
         self.print(f"Current Location: [bold]{current_location}[/bold]")
 
+        recommended = None
+        if deck_scores and len(available_decks) > 1:
+            recommended = max(range(len(deck_scores)), key=deck_scores.__getitem__)
+
         # Display available encounter decks
         self.print("\n[bold]Available Encounter Decks:[/bold]")
         for i, (deck_name, description) in enumerate(available_decks, 1):
+            hint = " [yellow](recommended)[/yellow]" if i - 1 == recommended else ""
             self.print(
-                f"[green]{i}.[/green] {deck_name} - [italic]{description}[/italic]"
+                f"[green]{i}.[/green] {deck_name} - [italic]{description}[/italic]{hint}"
             )
 
         # Get user choice
@@ -1,11 +1,31 @@
+import argparse
+
+from game.ui.message_feed import MessageFeed
 from game.ui.ui_manager import UIManager
 from game.engine import GameEngine
 
 def main():
     """Main entry point for the game."""
-    ui = UIManager()
+    parser = argparse.ArgumentParser(description="Play Eldritch Pursuit.")
+    parser.add_argument(
+        "--dashboard",
+        action="store_true",
+        help="draw the game as a live dashboard on the alternate screen",
+    )
+    args = parser.parse_args()
+
+    if args.dashboard:
+        from game.ui.dashboard import DashboardUI
+
+        ui = DashboardUI()
+    else:
+        ui = UIManager()
+    ui = MessageFeed(ui)
     engine = GameEngine(ui)
-    engine.run()
+    try:
+        engine.run()
+    finally:
+        ui.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
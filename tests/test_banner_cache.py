@@ -0,0 +1,56 @@
+from game.ui.banner_cache import BannerCache
+
+
+class FakeFiglet:
+    created = 0
+
+    def __init__(self, font, width):
+        FakeFiglet.created += 1
+        self.font = font
+        self.width = width
+        self.rendered = []
+
+    def renderText(self, text):
+        self.rendered.append(text)
+        return f"<{self.font}:{self.width}:{text}>"
+
+
+class TestBannerCache:
+    def test_renders_each_banner_once(self):
+        cache = BannerCache(path=None, figlet_factory=FakeFiglet)
+
+        assert cache.render("Rome", "slant") == "<slant:80:Rome>"
+        assert cache.render("Rome", "slant") == "<slant:80:Rome>"
+        assert cache.render("Rome", "slant", width=40) == "<slant:40:Rome>"
+        assert cache.render("Rome", "banner") == "<banner:80:Rome>"
+
+        assert len(cache.banners) == 3
+        slant = cache._figlets[("slant", 80)]
+        assert slant.rendered == ["Rome"]
+
+    def test_prewarm_renders_in_background_and_persists(self, tmp_path):
+        path = str(tmp_path / "banners.json")
+        cache = BannerCache(path=path, figlet_factory=FakeFiglet)
+        cache.render("Rome", "slant")
+
+        thread = cache.prewarm(["Rome", "Tokyo", "Sydney"], "slant")
+        thread.join(timeout=5)
+
+        slant = cache._figlets[("slant", 80)]
+        assert slant.rendered == ["Rome", "Tokyo", "Sydney"]
+        assert not cache.dirty
+        assert cache.prewarm(["Rome", "Tokyo"], "slant") is None
+
+        FakeFiglet.created = 0
+        restored = BannerCache(path=path, figlet_factory=FakeFiglet)
+        assert restored.render("Tokyo", "slant") == "<slant:80:Tokyo>"
+        assert FakeFiglet.created == 0
+
+    def test_unreadable_cache_file_is_ignored(self, tmp_path):
+        path = tmp_path / "banners.json"
+        path.write_text("not json", encoding="utf-8")
+
+        cache = BannerCache(path=str(path), figlet_factory=FakeFiglet)
+
+        assert cache.banners == {}
+        assert cache.render("Rome", "slant") == "<slant:80:Rome>"
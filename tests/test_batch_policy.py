@@ -0,0 +1,125 @@
+import pytest
+
+from game.engine import GameEngine
+from game.game_state import GameState
+from game.systems import batch_policy
+from game.systems.batch_policy import (
+    DESTINATION_KIND,
+    BatchPolicy,
+    DecisionKind,
+    first_options,
+    yes_no_features,
+)
+from game.systems.decisions import YES_NO, DecisionRequest
+from game.systems.scheduler import GameScheduler
+from game.systems.setup_manager import SetupConfig
+from game.ui.null_ui import NullUI
+
+
+def new_engine(seed):
+    engine = GameEngine(NullUI())
+    engine.state.rng.seed(seed)
+    config = SetupConfig(
+        num_players=2,
+        ancient_one_id=1,
+        investigator_ids=[1, 2],
+        player_names=["Alice", "Bob"],
+    )
+    engine.setup_manager.initialize_game(config)
+    return engine
+
+
+def travel_request(state, destinations):
+    return DecisionRequest(
+        "show_travel_menu",
+        (state,),
+        ["0"] + [str(i + 1) for i in range(len(destinations))],
+        [None] + destinations,
+    )
+
+
+class TestBatchPolicy:
+    def test_kinds_are_scored_once_per_batch(self):
+        state = GameState()
+        state.reset_game()
+        policy = BatchPolicy(seed=1)
+        batch = [
+            (1, DecisionRequest("ask_yes_no", ("Go?",), YES_NO)),
+            (2, travel_request(state, ["London", "Rome"])),
+            (3, DecisionRequest("ask_yes_no", ("Stay?",), YES_NO)),
+            (4, DecisionRequest("show_player_name_entry", (1,))),
+            (5, travel_request(state, ["Tokyo"])),
+        ]
+
+        answers = policy(batch)
+
+        assert policy.evaluations == 2
+        assert answers[0] is True and answers[2] is True
+        assert answers[1] in ("1", "2")
+        assert answers[3] is None
+        assert answers[4] == "1"
+
+    def test_destination_features_prefer_clues(self):
+        state = GameState()
+        state.reset_game()
+        state.locations["Rome"].has_clue = True
+        policy = BatchPolicy(noise=0.0)
+
+        batch = [(game_id, travel_request(state, ["London", "Rome"])) for game_id in range(3)]
+
+        assert policy(batch) == ["2", "2", "2"]
+
+    def test_encounter_decks_ranked_by_stats(self):
+        decks = [("General", ""), ("Research", "")]
+        request = DecisionRequest(
+            "show_choose_encounter", (decks, "Rome", [-2.0, 3.0]), ["General", "Research"]
+        )
+        policy = BatchPolicy(noise=0.0)
+
+        assert policy([(1, request)]) == ["Research"]
+
+    def test_numpy_scoring_matches_the_fallback(self, monkeypatch):
+        pytest.importorskip("numpy")
+        state = GameState()
+        state.reset_game()
+        state.locations["Rome"].has_clue = True
+        state.locations["Tokyo"].open_gate()
+        # Requests with different numbers of options, padded in the array
+        requests = [
+            travel_request(state, ["London", "Rome"]),
+            travel_request(state, ["Tokyo"]),
+            travel_request(state, ["London", "Tokyo", "Rome"]),
+            travel_request(state, ["London", "Cairo"]),
+        ]
+
+        with_numpy = BatchPolicy(noise=0.0).choose(DESTINATION_KIND, requests)
+        monkeypatch.setattr(batch_policy, "np", None)
+        without_numpy = BatchPolicy(noise=0.0).choose(DESTINATION_KIND, requests)
+
+        assert with_numpy == without_numpy == [2, 1, 3, 1]
+
+    def test_first_options(self):
+        batch = [
+            (1, DecisionRequest("ask_yes_no", ("Go?",), YES_NO)),
+            (2, DecisionRequest("show_player_name_entry", (1,))),
+        ]
+
+        assert first_options(batch) == [True, None]
+
+    def test_custom_weights(self):
+        policy = BatchPolicy(kinds={"ask_yes_no": DecisionKind(yes_no_features, [-1.0])})
+        batch = [(1, DecisionRequest("ask_yes_no", ("Go?",), YES_NO))]
+
+        assert policy(batch) == [False]
+
+    def test_bots_play_scheduled_games(self):
+        policy = BatchPolicy(seed=2)
+        scheduler = GameScheduler(policy)
+        for seed in range(3):
+            scheduler.add(new_engine(seed).play_game())
+
+        batches = scheduler.run(max_batches=10000)
+
+        assert scheduler.running == 0
+        assert not scheduler.errors
+        assert 0 < policy.evaluations <= batches * len(policy.kinds)
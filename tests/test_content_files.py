@@ -0,0 +1,47 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from game.factories.content_files import read_content_files
+from game.systems.content_catalog import ContentCatalog
+
+
+class TestContentFiles:
+    def test_files_are_returned_in_order_with_errors(self, tmp_path):
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"cards_{i}.json"
+            path.write_text(json.dumps([{"id": i}]), encoding="utf-8")
+            paths.append(str(path))
+        broken = tmp_path / "broken.json"
+        broken.write_text("[{", encoding="utf-8")
+        paths.insert(3, str(broken))
+        paths.append(str(tmp_path / "missing.json"))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            files = list(read_content_files(paths, executor))
+
+        assert [content.path for content in files] == paths
+        assert isinstance(files[3].error, json.JSONDecodeError)
+        assert isinstance(files[-1].error, FileNotFoundError)
+        assert [content.data[0]["id"] for content in files if not content.error] == list(
+            range(8)
+        )
+
+    def test_catalog_loads_the_same_content_in_parallel(self):
+        parallel = ContentCatalog()
+        sequential = ContentCatalog(max_workers=0)
+
+        assert list(parallel.asset_factory.assets) == list(
+            sequential.asset_factory.assets
+        )
+        assert list(parallel.condition_factory.conditions) == list(
+            sequential.condition_factory.conditions
+        )
+        assert (
+            parallel.investigator_factory.investigators
+            == sequential.investigator_factory.investigators
+        )
+        assert parallel.location_data == sequential.location_data
+        assert [card.name for card in parallel.mythos_factory.blue_cards] == [
+            card.name for card in sequential.mythos_factory.blue_cards
+        ]
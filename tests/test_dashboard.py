@@ -0,0 +1,118 @@
+import io
+
+import pytest
+
+pytest.importorskip("rich")
+
+from rich.console import Console
+
+from game.game_state import GameState
+from game.systems.setup_manager import SetupConfig, SetupManager
+from game.ui.dashboard import DashboardPanels, DashboardUI, _screen_key
+from game.ui.null_ui import NullUI
+from game.ui.ui_manager import ACTION_MENU
+
+
+def render(renderable):
+    """Print a renderable to a recording console and get the text."""
+    console = Console(file=io.StringIO(), width=80, record=True)
+    console.print(renderable)
+    return console.export_text()
+
+
+def new_dashboard():
+    ui = DashboardUI(log_size=3)
+    ui.console = Console(file=io.StringIO(), width=80, height=30)
+    return ui
+
+
+class TestDashboardPanels:
+    def test_unchanged_panels_are_not_redrawn(self):
+        panels = DashboardPanels()
+
+        assert panels.update("status", ("Player 1", 5, 5))
+        assert panels.update("log", ("Welcome",))
+        assert panels.take_changed() == {"status", "log"}
+
+        assert not panels.update("status", ("Player 1", 5, 5))
+        assert panels.update("log", ("Welcome", "You rest."))
+        assert panels.take_changed() == {"log"}
+        assert panels.take_changed() == set()
+
+    def test_text_screens_compare_by_value(self):
+        assert _screen_key(["1. Travel", "2. Rest"]) == _screen_key(["1. Travel", "2. Rest"])
+        renderable = object()
+        assert _screen_key(["1. Travel", renderable]) != _screen_key(
+            ["1. Travel", renderable]
+        )
+
+
+class TestDashboardUI:
+    def test_status_panel(self):
+        text = render(
+            DashboardUI._status_panel(
+                ("Alice", True, "Agnes", "Action", 2, 4, 7, 3, 5, 1, 2, 0)
+            )
+        )
+
+        assert "Player: Alice (Lead Investigator)" in text
+        assert "Investigator: Agnes" in text
+        assert "Actions Remaining: 2" in text
+        assert "Health: 4/7 | Sanity: 3/5" in text
+        assert "Train Tickets: 2 | Ship Tickets: 0" in text
+
+    def test_log_panel(self):
+        text = render(DashboardUI._log_panel(("You rest.", "A gate opens.")))
+
+        assert "Messages" in text
+        assert text.index("You rest.") < text.index("A gate opens.")
+
+    def test_menu_panel(self):
+        ui = new_dashboard()
+        for line in ACTION_MENU:
+            ui.print(line)
+
+        text = render(ui._menu_panel(_screen_key(ui.screen)))
+
+        assert "Menu" in text
+        assert "1. Travel" in text
+        assert "9. End Turn (Advance to Encounter Phase)" in text
+
+    def test_show_message_updates_the_log_without_waiting(self, monkeypatch):
+        ui = new_dashboard()
+
+        def blocked(*args, **kwargs):
+            raise AssertionError("show_message waited for input")
+
+        monkeypatch.setattr("builtins.input", blocked)
+        monkeypatch.setattr(ui, "input", blocked)
+        try:
+            for message in ("One", "Two", "Three", "Four"):
+                ui.show_message(message)
+            text = render(ui.layout["log"].renderable)
+        finally:
+            ui.close()
+
+        assert "One" not in text
+        assert all(message in text for message in ("Two", "Three", "Four"))
+        assert ui.panels.take_changed() == {"log"}
+
+    def test_action_screen_shows_the_action_menu(self, monkeypatch):
+        # The header panel draws the location name as a banner
+        pytest.importorskip("pyfiglet")
+        state = GameState()
+        config = SetupConfig(
+            num_players=1, ancient_one_id=1, investigator_ids=[1], player_names=["Alice"]
+        )
+        SetupManager(state, NullUI()).initialize_game(config)
+        ui = new_dashboard()
+        monkeypatch.setattr(ui.idle, "read", lambda read: "1")
+        try:
+            choice = ui.show_action_phase(state)
+            status = render(ui.layout["status"].renderable)
+        finally:
+            ui.close()
+
+        assert choice == "1"
+        assert ui.screen[: len(ACTION_MENU)] == list(ACTION_MENU)
+        assert "Player: Alice" in status
@@ -0,0 +1,88 @@
+import pytest
+
+from game.game_state import GameState
+from game.entities.investigator import Investigator
+
+
+@pytest.fixture
+def game_state():
+    state = GameState()
+    state.reset_game()
+    return state
+
+
+@pytest.fixture
+def investigator():
+    return Investigator(
+        name="Fallen Investigator",
+        health=0,
+        max_health=5,
+        sanity=3,
+        max_sanity=5,
+        skills={"lore": 2},
+        current_location="London",
+    )
+
+
+def labels(options):
+    return [label for label, _ in options]
+
+
+class TestEncounterAvailability:
+    def test_options_are_cached_until_tokens_change(self, game_state):
+        availability = game_state.encounter_availability
+        first = availability.get_options("London")
+        assert labels(first) == ["General", "Europe"]
+
+        game_state.locations["London"].add_clue()
+        assert labels(availability.get_options("London")) == [
+            "General",
+            "Europe",
+            "Research",
+        ]
+
+        game_state.locations["London"].has_gate = True
+        assert "Other World" in labels(availability.get_options("London"))
+
+    def test_unchanged_location_reuses_cached_options(self, game_state):
+        availability = game_state.encounter_availability
+        availability.get_options("Tokyo")
+        cached = availability._options["Tokyo"]
+
+        game_state.locations["London"].add_clue()
+        availability.get_options("Tokyo")
+
+        assert availability._options["Tokyo"] is cached
+
+    def test_defeated_investigator_index(self, game_state, investigator):
+        availability = game_state.encounter_availability
+        availability.get_options("London")
+
+        game_state.defeat_investigator(investigator)
+
+        assert availability.defeated_at("London") == [investigator]
+        assert "Investigator: Fallen Investigator" in labels(
+            availability.get_options("London")
+        )
+
+    def test_moving_defeated_investigator_updates_both_locations(
+        self, game_state, investigator
+    ):
+        availability = game_state.encounter_availability
+        game_state.defeat_investigator(investigator)
+
+        game_state.move_investigator(investigator, "Rome")
+
+        assert availability.defeated_at("London") == []
+        assert availability.defeated_at("Rome") == [investigator]
+        assert "Investigator: Fallen Investigator" not in labels(
+            availability.get_options("London")
+        )
+        assert "Investigator: Fallen Investigator" in labels(
+            availability.get_options("Rome")
+        )
+
+    def test_reset_game_clears_index(self, game_state, investigator):
+        game_state.defeat_investigator(investigator)
+        game_state.reset_game()
+        assert game_state.encounter_availability.defeated_at("London") == []
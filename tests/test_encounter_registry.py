@@ -0,0 +1,88 @@
+import pytest
+from unittest.mock import MagicMock
+
+from game.game_state import GameState
+from game.phases.encounter_phase import EncounterPhase
+from game.systems.decisions import drive
+from game.systems.encounter_registry import (
+    EncounterDeckEntry,
+    EncounterDeckRegistry,
+    draw_top,
+)
+from game.enums import EncounterType
+
+
+@pytest.fixture
+def registry():
+    return EncounterDeckRegistry.create_default()
+
+
+@pytest.fixture
+def game_state():
+    state = GameState()
+    state.reset_game()
+    state.player_manager.add_player(1, "Tester", 2)
+    state.players = state.player_manager.get_all_players()
+    return state
+
+
+class TestEncounterDeckRegistry:
+    def test_lookup_by_key(self, registry):
+        entry, argument = registry.lookup("Asia/Australia")
+        assert entry.encounter_type == EncounterType.ASIA.value
+        assert argument is None
+
+    def test_lookup_with_argument(self, registry):
+        entry, argument = registry.lookup("Rumor: The Stars Align")
+        assert entry.key == "Rumor"
+        assert argument == "The Stars Align"
+
+    def test_unknown_selection_falls_back_to_general(self, registry):
+        entry, argument = registry.lookup("Dreamlands")
+        assert entry.key == "General"
+        assert argument is None
+
+    def test_option_labels(self, registry):
+        assert registry.option("Research") == (
+            "Research",
+            "Academic and investigative encounters",
+        )
+        assert registry.option("Investigator", "Akachi") == (
+            "Investigator: Akachi",
+            "Help the defeated investigator Akachi",
+        )
+
+    def test_register_expansion_deck(self, registry):
+        registry.register(
+            EncounterDeckEntry("Egypt", "Encounters specific to Egypt", "egypt")
+        )
+        entry, _ = registry.lookup("Egypt")
+        assert entry.encounter_type == "egypt"
+        assert entry.draw is draw_top
+
+
+class TestEncounterPhaseRegistry:
+    def test_general_encounter_is_drawn_and_discarded(self, game_state):
+        ui = MagicMock()
+        ui.show_choose_encounter.return_value = "General"
+        game_state.spawn_clue = MagicMock()
+        phase = EncounterPhase(None, game_state, ui)
+
+        drive(phase.choose_encounter(), ui)
+
+        general_deck = game_state.encounter_decks[EncounterType.GENERAL.value]
+        assert len(general_deck.discard_pile) == 1
+
+    def test_placeholder_entry_draws_nothing(self, game_state):
+        ui = MagicMock()
+        phase = EncounterPhase(None, game_state, ui)
+        entry, argument = game_state.encounter_registry.lookup("Rumor: Test")
+
+        investigator = game_state.get_current_investigator()
+        drive(phase.resolve_deck_encounter(entry, investigator, argument), ui)
+
+        messages = [call.args[0] for call in ui.show_message.call_args_list]
+        assert messages == [
+            "Resolving the Test rumor encounter...",
+            "Rumor encounter for Test resolved.",
+        ]
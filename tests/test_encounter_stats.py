@@ -0,0 +1,95 @@
+import pytest
+
+from game.systems.encounter_registry import EncounterDeckRegistry
+from game.systems.encounter_stats import EncounterStatsTable
+from tools.encounter_stats import build_table
+
+
+def outcome(health=0.0, sanity=0.0, clues=0.0, assets=0.0, conditions=0.0):
+    return {
+        "health": health,
+        "sanity": sanity,
+        "clues": clues,
+        "assets": assets,
+        "conditions": conditions,
+    }
+
+
+@pytest.fixture
+def table():
+    return EncounterStatsTable(
+        {
+            "trials": 10,
+            "profiles": {
+                "weak": {"lore": 1, "will": 1},
+                "strong": {"lore": 5, "will": 5},
+            },
+            "encounters": {
+                "general": {
+                    "1": {
+                        "text": "City",
+                        "subtype": "city",
+                        "profiles": {"weak": outcome(health=-2.0)},
+                    },
+                    "2": {
+                        "text": "Sea",
+                        "subtype": "sea",
+                        "profiles": {"weak": outcome(clues=1.0)},
+                    },
+                },
+                "research": {
+                    "1": {
+                        "text": "Library",
+                        "subtype": None,
+                        "profiles": {"weak": outcome(clues=2.0)},
+                    }
+                },
+            },
+        }
+    )
+
+
+class TestEncounterStatsTable:
+    def test_get_card(self, table):
+        assert table.get("general", 1, "weak")["health"] == -2.0
+        assert table.get("general", 99, "weak") is None
+
+    def test_deck_outcome_averages_cards(self, table):
+        assert table.deck_outcome("general", "weak")["health"] == -1.0
+        assert table.deck_outcome("general", "weak", subtype="sea")["clues"] == 1.0
+        assert table.deck_outcome("other_world", "weak") is None
+
+    def test_closest_profile(self, table):
+        assert table.closest_profile({"lore": 4, "will": 4}) == "strong"
+
+    def test_rank_decks(self, table):
+        ranked = table.rank_decks(
+            [("General", "general"), ("Rumor: X", None), ("Research", "research")],
+            "weak",
+            subtype="city",
+        )
+        assert [label for label, _ in ranked] == ["Research", "General", "Rumor: X"]
+
+    def test_option_scores_follow_labels(self, table):
+        registry = EncounterDeckRegistry.create_default()
+        skills = {"lore": 1, "will": 2}
+
+        scores = table.option_scores(
+            ["Rumor: X", "Research", "General"], registry, skills, subtype="city"
+        )
+
+        assert scores == [0.0, 3.0, -2.0]
+        assert EncounterStatsTable().option_scores(["General"], registry, skills) is None
+
+    def test_shipped_table_loads(self):
+        table = EncounterStatsTable.load()
+        assert table.trials > 0
+        assert table.get("general", 3, "weak") is not None
+
+    def test_asset_rewards_are_counted(self):
+        # Theft grants an item on a passed test, through an asset choice
+        table = EncounterStatsTable(build_table(trials=50, seed=1))
+        assert table.get("general", 1, "strong")["assets"] > 0
+
+        shipped = EncounterStatsTable.load()
+        assert shipped.get("general", 1, "strong")["assets"] > 0
@@ -0,0 +1,174 @@
+import pytest
+
+from game.engine import GameEngine
+from game.systems.event_log import (
+    EventLogReader,
+    EventRecorder,
+    ReplayDivergenceError,
+    Replayer,
+)
+from game.systems.scheduler import GameScheduler
+
+
+class ScriptedUI:
+    """Plays a single game: travels every action, then quits at the menu."""
+
+    def __init__(self):
+        self.menu_choices = ["1", "3"]
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def show_main_menu(self):
+        return self.menu_choices.pop(0)
+
+    def show_player_count_selection(self):
+        return 1
+
+    def show_player_name_entry(self, player_number):
+        return "Tester"
+
+    def show_investigator_selection(self, available_investigators, player_name):
+        return next(iter(available_investigators))
+
+    def show_investigator_details(self, investigator_data):
+        return True
+
+    def show_ancient_one_selection(self, available_ancient_ones):
+        return 1
+
+    def show_ancient_one_details(self, ancient_one_data):
+        return True
+
+    def show_action_phase(self, state):
+        return "1"
+
+    def show_travel_menu(self, state):
+        return "1"
+
+    def ask_yes_no(self, question):
+        return False
+
+    def show_choose_encounter(self, available_decks, current_location, deck_scores=None):
+        return available_decks[0][0]
+
+
+def summary(engine):
+    investigator = engine.state.players[0].investigator
+    return (
+        engine.state.round_number,
+        engine.state.doom_track,
+        investigator.current_location,
+        investigator.health,
+        investigator.sanity,
+        investigator.clue_tokens,
+    )
+
+
+@pytest.fixture
+def recorded_game(tmp_path):
+    path = str(tmp_path / "game.eplog")
+    engine = GameEngine(ScriptedUI())
+    with EventRecorder(path, seed=1234) as recorder:
+        recorder.attach(engine)
+        engine.run()
+    return path, engine
+
+
+class TestEventLog:
+    def test_replay_reconstructs_game(self, recorded_game):
+        path, engine = recorded_game
+
+        replayed = Replayer(path).replay()
+
+        assert summary(replayed) == summary(engine)
+
+    def test_fast_forward_to_round(self, recorded_game):
+        path, _ = recorded_game
+
+        replayed = Replayer(path).replay(to_round=3)
+
+        assert replayed.state.round_number == 3
+
+    def test_index_and_truncated_log(self, recorded_game):
+        path, engine = recorded_game
+        reader = EventLogReader(path)
+        assert reader.complete
+        assert reader.seed == 1234
+        assert reader.seek_point(3).round_number == 3
+
+        # Cut the log in the middle of a round, as a crash would
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[: reader.seek_point(4).offset - 2])
+
+        truncated = EventLogReader(path)
+        assert not truncated.complete
+        assert truncated.index[-1].round_number == 3
+        assert Replayer(path).replay().state.round_number == 3
+
+    def test_persisted_index_matches_rebuilt_one(self, tmp_path):
+        path = str(tmp_path / "game.eplog")
+        engine = GameEngine(ScriptedUI())
+        with EventRecorder(path, seed=99, snapshot_interval=2) as recorder:
+            recorder.attach(engine)
+            engine.run()
+        reader = EventLogReader(path)
+        assert reader.complete
+        assert reader.index == recorder.index
+
+        # Drop the index block and footer, as if the log was never closed
+        with open(path, "rb") as f:
+            data = f.read()
+        index_offset = int.from_bytes(data[-12:-4], "little")
+        unclosed = str(tmp_path / "unclosed.eplog")
+        with open(unclosed, "wb") as f:
+            f.write(data[:index_offset])
+
+        rebuilt = EventLogReader(unclosed)
+        assert not rebuilt.complete
+        assert rebuilt.index == reader.index
+        assert rebuilt.records == reader.records
+
+    def test_replay_of_scheduled_game(self, tmp_path):
+        path = str(tmp_path / "game.eplog")
+        engine = GameEngine(ScriptedUI())
+        # The scheduler answers every decision, never the engine's UI
+        bot = ScriptedUI()
+        scheduler = GameScheduler(
+            lambda batch: [request.ask(bot) for _, request in batch]
+        )
+        with EventRecorder(path, seed=7) as recorder:
+            recorder.attach(engine)
+            scheduler.add(engine.play())
+            scheduler.run()
+
+        assert not scheduler.errors
+        assert recorder.decisions > 0
+        replayed = Replayer(path).replay()
+        assert summary(replayed) == summary(engine)
+
+    def test_divergence_is_detected(self, recorded_game):
+        path, _ = recorded_game
+        replayer = Replayer(path)
+        replayer.reader.seed += 1
+
+        with pytest.raises(ReplayDivergenceError):
+            replayer.replay()
+
+    def test_fast_forward_from_snapshot(self, tmp_path):
+        path = str(tmp_path / "game.eplog")
+        engine = GameEngine(ScriptedUI())
+        with EventRecorder(path, seed=99, snapshot_interval=2) as recorder:
+            recorder.attach(engine)
+            engine.run()
+
+        replayer = Replayer(path)
+        assert replayer.reader.snapshot_point(5).round_number == 4
+
+        from_snapshot = replayer.replay(to_round=5)
+        from_start = replayer.replay(to_round=5, use_snapshots=False)
+
+        assert summary(from_snapshot) == summary(from_start)
+        assert Replayer(path).replay().state.doom_track == engine.state.doom_track
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import os
+
+from game.game_state import GameState
+from game.systems.content_catalog import ContentCatalog
+from game.systems.game_server import GameClient, GameServer, ServerSession
+
+
+def bot_policy():
+    """Start one game, rest every action, then quit."""
+    menus = iter(["1", "3"])
+
+    def policy(decision):
+        method = decision["method"]
+        if method == "show_main_menu":
+            return next(menus)
+        if method == "show_player_count_selection":
+            return 1
+        if method == "show_player_name_entry":
+            return "Tester"
+        if method == "show_action_phase":
+            return "2"
+        return decision["options"][0]
+
+    return policy
+
+
+class TestContentCatalog:
+    def test_games_share_content_but_not_state(self):
+        catalog = ContentCatalog()
+        first = GameState(catalog)
+        second = GameState(catalog)
+        first.reset_game()
+        second.reset_game()
+
+        assert first.asset_factory is second.asset_factory
+        assert first.encounter_factory is second.encounter_factory
+        assert first.asset_deck is not second.asset_deck
+        assert first.locations["London"] is not second.locations["London"]
+        assert (
+            first.locations["London"].connections
+            is not second.locations["London"].connections
+        )
+
+
+class TestGameServer:
+    def test_clients_play_concurrent_games(self):
+        async def run():
+            server = GameServer()
+            port = await server.start()
+            clients = [GameClient(bot_policy()) for _ in range(5)]
+            try:
+                await asyncio.gather(
+                    *(client.play("127.0.0.1", port) for client in clients)
+                )
+            finally:
+                await server.stop()
+            return server, clients
+
+        server, clients = asyncio.run(run())
+
+        assert sorted(client.session_id for client in clients) == [1, 2, 3, 4, 5]
+        for client in clients:
+            types = [message["type"] for message in client.received]
+            assert types[-1] == "end"
+            assert "error" not in types
+            assert "message" in types
+        assert not server.sessions
+
+    def test_stop_cleans_up_and_logs_stats(self, tmp_path, caplog):
+        async def run(server):
+            await server.start()
+            await server.stop()
+
+        server = GameServer()
+        temp_dir = server.sessions.directory
+        with caplog.at_level(logging.INFO, logger="game.systems.game_server"):
+            asyncio.run(run(server))
+        assert not os.path.exists(temp_dir)
+        assert "0 evictions, 0 restores" in caplog.text
+
+        asyncio.run(run(GameServer(session_dir=str(tmp_path))))
+        assert tmp_path.exists()
+
+    def test_invalid_answer_repeats_decision(self):
+        session = ServerSession(1, ContentCatalog())
+        decision = session.start()[-1]
+        assert decision["method"] == "show_main_menu"
+
+        messages = session.handle({"type": "answer", "id": decision["id"], "value": "7"})
+        assert messages[0]["type"] == "error"
+        assert messages[1] == decision
+
+        messages = session.handle({"type": "answer", "id": decision["id"], "value": "3"})
+        assert messages[-1] == {"type": "end"}
+        assert session.finished
@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from game.systems.idle_tasks import IdleTasks
+
+
+class TestIdleTasks:
+    def test_tasks_run_while_the_read_blocks(self):
+        idle = IdleTasks()
+        answered = threading.Event()
+        work = list(range(5))
+        done = []
+
+        def task():
+            if not work:
+                # Out of work: let the player answer
+                answered.set()
+                return False
+            done.append(work.pop(0))
+            return True
+
+        def read(prompt):
+            answered.wait(timeout=5)
+            return f"{prompt}y"
+
+        idle.add(task)
+        idle.add(task)
+        assert idle.read(read, "> ") == "> y"
+        assert done == [0, 1, 2, 3, 4]
+        assert idle.tasks == [task]
+        idle.close()
+
+    def test_read_errors_are_raised_and_failing_tasks_dropped(self):
+        idle = IdleTasks()
+
+        def broken():
+            raise ValueError("broken")
+
+        def read():
+            raise EOFError
+
+        idle.add(broken)
+        with pytest.raises(EOFError):
+            idle.read(read)
+        assert idle.tasks == []
+        assert idle.read(lambda: "direct") == "direct"
+        idle.close()
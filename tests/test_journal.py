@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+from game.entities.cards.monster import Monster
+from game.game_state import GameState
+from game.systems.idle_tasks import IdleTasks
+from game.systems.journal import Journal, _splice
+from game.systems.save_manager import SaveManager
+from game.systems.setup_manager import SetupConfig, SetupManager
+
+
+def new_game():
+    state = GameState()
+    config = SetupConfig(
+        num_players=2,
+        ancient_one_id=1,
+        investigator_ids=[1, 2],
+        player_names=["Alice", "Bob"],
+    )
+    SetupManager(state, MagicMock()).initialize_game(config)
+    return state
+
+
+def play(state):
+    investigator = state.players[0].investigator
+    state.move_investigator(investigator, "Rome")
+    investigator.take_damage(2)
+    investigator.add_condition("amnesia")
+    investigator.add_asset(state.asset_deck.take_from_reserve(0))
+    deck = state.encounter_decks["general"]
+    deck.discard(deck.draw())
+    state.spawn_clue()
+    state.locations["Rome"].add_monster(Monster())
+    state.player_manager.advance_turn()
+    state.doom_track -= 1
+
+
+class TestJournal:
+    def test_splice(self):
+        a, b, c, d = object(), object(), object(), object()
+        assert _splice([a, b, c], [b, c]) == (0, 1, [])
+        assert _splice([a, b], [a, b, d]) == (2, 2, [d])
+        assert _splice([a, b], [a, b]) is None
+
+    def test_recover_from_snapshot_and_journal(self, tmp_path):
+        base_path = str(tmp_path / "autosave")
+        state = new_game()
+        journal = Journal(base_path)
+        journal.on_round(state)
+
+        play(state)
+        journal.file.close()  # Simulate a crash
+
+        with open(journal.journal_path) as f:
+            assert len(f.readlines()) > 5
+
+        recovered = GameState()
+        assert Journal(base_path).recover(recovered)
+
+        assert SaveManager(recovered).to_dict() == SaveManager(state).to_dict()
+        assert recovered.rng.random() == state.rng.random()
+
+    def test_compaction_and_torn_write(self, tmp_path):
+        base_path = str(tmp_path / "autosave")
+        state = new_game()
+        journal = Journal(base_path, compact_every=3)
+        journal.on_round(state)
+        play(state)
+        journal.on_round(state)
+
+        with open(journal.journal_path) as f:
+            assert len(f.readlines()) == 1
+
+        state.doom_track -= 1
+        journal.file.write('["s","doom_tr')  # Torn final write
+        journal.close()
+
+        recovered = GameState()
+        assert Journal(base_path).recover(recovered)
+        assert SaveManager(recovered).to_dict() == SaveManager(state).to_dict()
+
+    def test_entries_are_flushed_while_idle(self, tmp_path):
+        base_path = str(tmp_path / "autosave")
+        state = new_game()
+        engine = MagicMock(round_listeners=[], idle=IdleTasks())
+        journal = Journal(base_path, flush_each_entry=False)
+        journal.attach(engine)
+        journal.on_round(state)
+
+        state.doom_track -= 1
+        with open(journal.journal_path) as f:
+            assert len(f.readlines()) == 1
+
+        assert engine.idle.run_round()
+        with open(journal.journal_path) as f:
+            assert len(f.readlines()) == 2
+        assert not engine.idle.run_round()
+        journal.close()
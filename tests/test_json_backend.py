@@ -0,0 +1,68 @@
+import pytest
+
+from game import json_backend
+from game.game_state import GameState
+from game.systems.content_catalog import ContentCatalog
+from game.systems.game_server import GameServer, encode
+from game.systems.save_manager import SaveManager
+from game.systems.setup_manager import SetupConfig, SetupManager
+from game.ui.null_ui import NullUI
+
+
+@pytest.fixture(params=json_backend.available_backends())
+def backend(request):
+    previous = json_backend.set_backend(request.param)
+    yield request.param
+    json_backend.set_backend(previous.name)
+
+
+def new_game():
+    state = GameState()
+    config = SetupConfig(
+        num_players=2,
+        ancient_one_id=1,
+        investigator_ids=[1, 2],
+        player_names=["Alice", "Bob"],
+    )
+    SetupManager(state, NullUI()).initialize_game(config)
+    return state
+
+
+class TestJsonBackend:
+    def test_round_trip_is_compact(self, backend):
+        value = {"name": "Rome", "tokens": [1, 2.5, None, True], "nested": {"é": "ü"}}
+
+        text = json_backend.dumps(value)
+
+        assert json_backend.get_backend().name == backend
+        assert " " not in text
+        assert json_backend.loads(text) == value
+        assert json_backend.loads(text.encode("utf-8")) == value
+
+    def test_malformed_json_raises_the_shared_error(self, backend):
+        with pytest.raises(json_backend.JSONDecodeError):
+            json_backend.loads('{"doom_track": ')
+
+    def test_save_games_are_readable_by_every_backend(self, backend):
+        state = new_game()
+        text = SaveManager(state).dumps()
+
+        for other in json_backend.available_backends():
+            json_backend.set_backend(other)
+            restored = GameState()
+            assert SaveManager(restored).loads(text)
+            assert SaveManager(restored).to_dict() == SaveManager(state).to_dict()
+
+    def test_server_lines_use_the_backend(self, backend, tmp_path):
+        server = GameServer(ContentCatalog(), session_dir=str(tmp_path))
+        messages, _ = server._start_session(1)
+        line = encode(messages[-1])
+        assert json_backend.loads(line) == messages[-1]
+
+        reply, finished = server._handle_line(1, b'{"type": ')
+        assert reply == [{"type": "error", "message": "Malformed message"}]
+        assert not finished
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError):
+            json_backend.set_backend("simdjson")
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+from game.game_state import GameState
+from game.lazy_import import LazyImport
+from game.systems.content_catalog import ContentCatalog
+
+
+def imported_modules(statement):
+    """Run a statement in a fresh interpreter and list what it imported."""
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImport:
+    def test_imports_on_first_use(self):
+        dumps = LazyImport("json", "dumps")
+        assert not dumps.loaded
+        assert dumps([1]) == "[1]"
+        assert dumps.loaded
+
+    def test_module_attributes(self):
+        json_module = LazyImport("json")
+        assert json_module.loads("[2]") == [2]
+
+    def test_missing_module_fails_on_use(self):
+        missing = LazyImport("no_such_module_here", "Thing")
+        with pytest.raises(ImportError):
+            missing()
+
+    def test_ui_manager_defers_rendering_libraries(self):
+        modules = imported_modules("import game.ui.ui_manager")
+        assert "game.ui.ui_manager" in modules
+        assert not {"rich", "pyfiglet", "game.ui.map_display"} & modules
+
+
+class TestLazyContent:
+    def test_encounters_load_when_decks_are_built(self):
+        catalog = ContentCatalog()
+        assert not catalog.encounter_factory.loaded_types
+
+        state = GameState(catalog)
+        assert not catalog.encounter_factory.loaded_types
+
+        state.reset_game()
+        assert "general" in catalog.encounter_factory.loaded_types
+        assert state.encounter_decks["general"].cards
@@ -0,0 +1,134 @@
+import io
+
+import pytest
+
+pytest.importorskip("rich")
+
+from rich.console import Console
+
+from game.entities.cards.monster import Monster
+from game.game_state import GameState
+from game.systems.setup_manager import SetupConfig, SetupManager
+from game.ui import map_display
+from game.ui.map_display import MAP_LAYOUT, MapDisplay
+from game.ui.map_layers import LocationMarks
+from game.ui.null_ui import NullUI
+
+VIEWS = ("world_map", "connection_diagram", "graphical_map")
+
+
+def new_state(players=2):
+    state = GameState()
+    config = SetupConfig(
+        num_players=players,
+        ancient_one_id=1,
+        investigator_ids=list(range(1, players + 1)),
+        player_names=[f"Player {i}" for i in range(1, players + 1)],
+    )
+    SetupManager(state, NullUI()).initialize_game(config)
+    return state
+
+
+def render(display, state, view):
+    """Print a view of the board to a string."""
+    display.console = Console(file=io.StringIO(), width=display.screen_width)
+    getattr(display, f"display_{view}")(state)
+    return display.console.file.getvalue()
+
+
+def assert_matches_fresh_display(display, state):
+    for view in VIEWS:
+        assert render(display, state, view) == render(MapDisplay(), state, view)
+
+
+def unmarked_location(display, state):
+    """A location on the grid that has no marks yet."""
+    return next(
+        name
+        for name in MAP_LAYOUT
+        if name in state.locations
+        and display.layers.marks.get(name, LocationMarks()) == LocationMarks()
+    )
+
+
+class TestMapDisplay:
+    def test_token_change_redraws_only_that_location(self):
+        state = new_state()
+        display = MapDisplay()
+        for view in VIEWS:
+            render(display, state, view)
+        name = unmarked_location(display, state)
+        cells = dict(display._cells)
+        texts = {other: cell.plain for other, cell in cells.items()}
+        tables = dict(display._tables)
+        rows = list(display._grid_rows)
+        y = MAP_LAYOUT[name][1]
+
+        state.locations[name].add_clue()
+        display._update(state)
+
+        assert display._tables == tables
+        assert all(display._cells[other] is cells[other] for other in cells)
+        redrawn = [other for other in cells if cells[other].plain != texts[other]]
+        assert redrawn == [name]
+        changed_rows = [i for i, row in enumerate(display._grid_rows) if row != rows[i]]
+        assert changed_rows == [y]
+        assert "[C]" in display._grid_rows[y]
+        assert_matches_fresh_display(display, state)
+
+    def test_indicators_spill_into_a_neighbour(self, monkeypatch):
+        # Put Rome right after London, where London's indicators are drawn
+        london_x, london_y = MAP_LAYOUT["London"]
+        monkeypatch.setitem(map_display.MAP_LAYOUT, "Rome", (london_x + 2, london_y))
+        state = new_state()
+        display = MapDisplay()
+        render(display, state, "graphical_map")
+        assert display._grid_rows[london_y][london_x + 2] == "R"
+
+        london = state.locations["London"]
+        london.open_gate()
+        london.add_monster(Monster())
+        display._update(state)
+        assert display._grid_rows[london_y][london_x + 1 : london_x + 5] == "[GM]"
+        assert_matches_fresh_display(display, state)
+
+        london.close_gate()
+        london.remove_monster(london.monsters[0])
+        display._update(state)
+        assert display._grid_rows[london_y][london_x + 2] == "R"
+        assert_matches_fresh_display(display, state)
+
+    def test_new_board_resets_every_drawing(self):
+        state = new_state()
+        display = MapDisplay()
+        for view in VIEWS:
+            render(display, state, view)
+        revision = display.layers.board_revision
+
+        state.load_locations()
+        state.locations["Tokyo"].add_clue()
+        display._update(state)
+
+        assert display.layers.board_revision == revision + 1
+        assert not display._cells
+        assert not display._tables
+        assert display._grid_rows is None
+        assert_matches_fresh_display(display, state)
+
+    def test_warm_draws_each_view_once(self):
+        state = new_state()
+        display = MapDisplay()
+
+        warmed = 0
+        while display.warm(state):
+            warmed += 1
+
+        assert warmed == 3
+        assert set(display._tables) == {"world", "connections"}
+        tables = dict(display._tables)
+        rows = display._grid_rows
+        for view in VIEWS:
+            render(display, state, view)
+        assert display._tables == tables
+        assert display._grid_rows is rows
+        assert_matches_fresh_display(display, state)
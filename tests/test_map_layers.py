@@ -0,0 +1,110 @@
+from game.entities.cards.monster import Monster
+from game.entities.investigator import Investigator
+from game.game_state import GameState
+from game.systems.setup_manager import SetupConfig, SetupManager
+from game.ui.map_layers import LocationMarks, MapLayers
+from game.ui.null_ui import NullUI
+
+
+def new_state(players=2):
+    state = GameState()
+    config = SetupConfig(
+        num_players=players,
+        ancient_one_id=1,
+        investigator_ids=list(range(1, players + 1)),
+        player_names=[f"Player {i}" for i in range(1, players + 1)],
+    )
+    SetupManager(state, NullUI()).initialize_game(config)
+    return state
+
+
+def investigators_at(state, name):
+    return sum(
+        1
+        for player in state.player_manager.players
+        if player.investigator.current_location == name
+    )
+
+
+class TestMapLayers:
+    def test_first_refresh_marks_every_location(self):
+        state = new_state()
+        layers = MapLayers()
+        layers.attach(state)
+
+        changed = layers.refresh()
+
+        assert changed == set(state.locations)
+        current = state.player_manager.get_current_player().investigator
+        marks = layers.marks[current.current_location]
+        assert marks.current_player
+        assert marks.investigators == investigators_at(state, current.current_location)
+        assert layers.refresh() == set()
+
+    def test_only_changed_locations_are_recomputed(self):
+        state = new_state()
+        layers = MapLayers()
+        layers.attach(state)
+        layers.refresh()
+        name = next(
+            name for name, marks in layers.marks.items() if marks == LocationMarks()
+        )
+
+        state.locations[name].open_gate()
+        state.locations[name].add_monster(Monster())
+
+        assert layers.dirty == {name}
+        assert layers.refresh() == {name}
+        assert layers.marks[name].indicators == ["G", "M1"]
+
+    def test_moving_an_investigator_marks_both_locations(self):
+        state = new_state()
+        layers = MapLayers()
+        layers.attach(state)
+        layers.refresh()
+        investigator = state.player_manager.players[1].investigator
+        start = investigator.current_location
+        destination = next(name for name in state.locations if name != start)
+
+        investigator.current_location = destination
+
+        changed = layers.refresh()
+        assert destination in changed
+        assert start in changed
+        for name in (start, destination):
+            assert layers.marks[name].investigators == investigators_at(state, name)
+
+    def test_static_layer_is_built_once_per_board(self):
+        state = new_state()
+        layers = MapLayers()
+        layers.attach(state)
+        builds = []
+
+        def build(locations):
+            builds.append(len(locations))
+            return sorted(locations)
+
+        layers.refresh()
+        first = layers.static("names", build)
+        state.locations["Rome"].add_clue()
+        layers.refresh()
+        assert layers.static("names", build) is first
+        assert len(builds) == 1
+
+        state.load_locations()
+        layers.refresh()
+        layers.static("names", build)
+        assert len(builds) == 2
+
+    def test_detach_unobserves_replaced_investigators(self):
+        state = new_state()
+        layers = MapLayers()
+        layers.attach(state)
+        layers.refresh()
+        player = state.player_manager.players[0]
+        replaced = player.investigator
+
+        player.investigator = Investigator("Stand-in", 5, 5, 5, 5, {})
+        layers.detach()
+
+        assert not replaced._observers
@@ -0,0 +1,60 @@
+from game.ui.message_feed import MessageFeed
+from game.ui.null_ui import NullUI
+
+
+class RecordingUI:
+    def __init__(self):
+        self.calls = []
+
+    def show_messages(self, messages, wait_for_input=True):
+        self.calls.append(("show_messages", tuple(messages), wait_for_input))
+
+    def ask_yes_no(self, question):
+        self.calls.append(("ask_yes_no", question))
+        return True
+
+    def show_action_phase(self, state):
+        self.calls.append(("show_action_phase",))
+        return "9"
+
+
+class TestMessageFeed:
+    def test_messages_are_shown_together_before_the_next_screen(self):
+        ui = RecordingUI()
+        feed = MessageFeed(ui)
+
+        feed.show_message("You gain 1 Clue.")
+        feed.show_message("A monster appears!", wait_for_input=False)
+        assert ui.calls == []
+
+        assert feed.show_action_phase(None) == "9"
+        assert ui.calls == [
+            ("show_messages", ("You gain 1 Clue.", "A monster appears!"), True),
+            ("show_action_phase",),
+        ]
+
+    def test_inline_questions_do_not_wait_for_the_batch(self):
+        ui = RecordingUI()
+        feed = MessageFeed(ui)
+
+        feed.show_message("The gate trembles.")
+        assert feed.ask_yes_no("Close it?")
+        feed.ask_yes_no("Are you sure?")
+
+        assert ui.calls == [
+            ("show_messages", ("The gate trembles.",), False),
+            ("ask_yes_no", "Close it?"),
+            ("ask_yes_no", "Are you sure?"),
+        ]
+
+    def test_close_shows_remaining_messages(self):
+        ui = NullUI(record=True)
+        feed = MessageFeed(ui)
+
+        feed.show_message("The Ancient One awakens.")
+        feed.close()
+
+        assert ui.prompts == [
+            ("show_messages", (["The Ancient One awakens."],)),
+            ("close", ()),
+        ]
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from game.engine import GameEngine
+from game.systems.decisions import YES_NO, DecisionRequest
+from game.systems.phase_machine import SessionState
+from game.systems.setup_manager import SetupConfig
+from game.ui.null_ui import (
+    NullUI,
+    ScriptExhausted,
+    ScriptedUI,
+    first_option,
+    random_policy,
+)
+
+
+def rest_policy(request):
+    """Start a game as the first investigator, rest every action, then quit."""
+    answers = {
+        "show_player_count_selection": 1,
+        "show_player_name_entry": "Tester",
+        "show_investigator_selection": 1,
+        "show_investigator_details": True,
+        "show_ancient_one_selection": 1,
+        "show_ancient_one_details": True,
+        "show_action_phase": "2",
+        "ask_yes_no": False,
+    }
+    if request.method == "show_choose_encounter":
+        return request.options[0]
+    return answers.get(request.method)
+
+
+class TestNullUI:
+    def test_displays_do_nothing_and_decisions_take_the_first_option(self):
+        ui = NullUI()
+        assert ui.show_message("Hello") is None
+        assert ui.show_map(None) is None
+        assert DecisionRequest("ask_yes_no", ("Continue?",), YES_NO).ask(ui) is True
+        choice = DecisionRequest("show_choice", ("Choose:",), ["reserve", "random"])
+        assert choice.ask(ui) == "reserve"
+        assert ui.show_action_phase(None) == "9"
+        assert ui.show_message is ui.show_message
+
+    def test_policy_less_game_finishes(self):
+        engine = GameEngine(NullUI())
+        engine.setup_manager.initialize_game(
+            SetupConfig(
+                num_players=2,
+                ancient_one_id=1,
+                investigator_ids=[1, 2],
+                player_names=["Alice", "Bob"],
+            )
+        )
+        engine.game_loop()
+        assert engine.session == SessionState.MAIN_MENU
+
+        engine.run()
+        assert engine.session == SessionState.QUIT
+
+    def test_first_option_sets_up_a_game(self):
+        menus = iter(["1", "3"])
+
+        def policy(request):
+            if request.method == "show_main_menu":
+                return next(menus)
+            return first_option(request)
+
+        engine = GameEngine(NullUI(policy))
+        engine.run()
+        assert engine.session == SessionState.QUIT
+        assert engine.state.round_number > 1
+
+    def test_policies_answer_from_the_request_options(self):
+        ui = NullUI(random_policy(random.Random(3)))
+        request = DecisionRequest("show_travel_menu", (None,), ["0", "1", "2"])
+
+        answers = {request.ask(ui) for _ in range(20)}
+
+        assert answers == {"0", "1", "2"}
+
+    def test_records_prompts(self):
+        ui = NullUI(policy=lambda request: "y", record=True)
+        ui.show_message("Hello", wait_for_input=False)
+        assert ui.input("Name?") == "y"
+        assert ui.prompts == [("show_message", ("Hello",)), ("input", ("Name?",))]
+
+    def test_plays_a_whole_game(self):
+        menus = iter(["1", "3"])
+
+        def policy(request):
+            if request.method == "show_main_menu":
+                return next(menus)
+            return rest_policy(request)
+
+        engine = GameEngine(NullUI(policy))
+        engine.run()
+        assert engine.session == SessionState.QUIT
+        assert engine.state.round_number > 1
+
+
+class TestScriptedUI:
+    def test_answers_in_order_then_falls_back(self):
+        ui = ScriptedUI(["1", True], policy=lambda request: request.method)
+        assert ui.show_main_menu() == "1"
+        assert ui.ask_yes_no("Sure?") is True
+        assert ui.show_ticket_choice() == "show_ticket_choice"
+
+    def test_raises_when_the_script_runs_out(self):
+        ui = ScriptedUI(["3"])
+        engine = GameEngine(ui)
+        engine.run()
+        assert engine.session == SessionState.QUIT
+
+        with pytest.raises(ScriptExhausted):
+            ui.show_main_menu()
@@ -0,0 +1,42 @@
+from game.entities.base.observable import Observable
+from game.entities.location import Location
+
+
+class Token(Observable):
+    def __init__(self):
+        self.health = 3
+
+
+class TestObservable:
+    def test_assignments_notify_only_while_observed(self):
+        token = Token()
+        changes = []
+
+        def observer(obj, name):
+            changes.append((name, obj.health))
+
+        token.add_observer(observer)
+        token.health -= 1
+        token.remove_observer(observer)
+        token.health -= 1
+
+        assert changes == [("health", 2)]
+
+    def test_observed_location_keeps_its_own_hook(self):
+        location = Location("Rome", "", [])
+        changes = []
+        location.add_observer(lambda obj, name: changes.append(name))
+
+        location.has_clue = True
+
+        assert changes == ["has_clue"]
+        assert location.token_revision == 1
+
+    def test_observed_and_unobserved_instances_are_equal(self):
+        observed = Location("Rome", "", ["London"])
+        unobserved = Location("Rome", "", ["London"])
+        observed.add_observer(lambda obj, name: None)
+
+        assert type(observed) is type(unobserved)
+        assert observed == unobserved
+        assert unobserved == observed
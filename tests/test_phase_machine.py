@@ -0,0 +1,121 @@
+import inspect
+from unittest.mock import MagicMock
+
+from game.engine import GameEngine
+from game.enums import GamePhase
+from game.game_state import GameState
+from game.phases.action_phase import ActionPhase
+from game.systems.decisions import drive
+from game.systems.phase_machine import PhaseMachine, SessionState
+from game.systems.setup_manager import SetupConfig, SetupManager
+
+
+def new_game(players):
+    state = GameState()
+    config = SetupConfig(
+        num_players=len(players),
+        ancient_one_id=1,
+        investigator_ids=list(range(1, len(players) + 1)),
+        player_names=players,
+    )
+    SetupManager(state, MagicMock()).initialize_game(config)
+    return state
+
+
+class SessionUI:
+    """Plays a number of games that rest every action, then quits."""
+
+    def __init__(self, games):
+        self.games = games
+        self.menu_depths = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+    def show_main_menu(self):
+        self.menu_depths.append(len(inspect.stack(0)))
+        if len(self.menu_depths) > self.games:
+            return "3"
+        return "1"
+
+    def show_player_count_selection(self):
+        return 1
+
+    def show_player_name_entry(self, player_number):
+        return "Tester"
+
+    def show_investigator_selection(self, available_investigators, player_name):
+        return next(iter(available_investigators))
+
+    def show_investigator_details(self, investigator_data):
+        return True
+
+    def show_ancient_one_selection(self, available_ancient_ones):
+        return 1
+
+    def show_ancient_one_details(self, ancient_one_data):
+        return True
+
+    def show_action_phase(self, state):
+        return "2"
+
+    def show_choose_encounter(self, available_decks, current_location, deck_scores=None):
+        return available_decks[0][0]
+
+
+class TestPhaseMachine:
+    def test_turns_and_phases(self):
+        state = new_game(["Alice", "Bob"])
+        machine = PhaseMachine(state)
+
+        def current():
+            player = state.player_manager.get_current_player()
+            return state.current_phase, player.name
+
+        assert current() == (GamePhase.ACTION, "Alice")
+        assert machine.advance() == "Next player's turn: Bob"
+        assert current() == (GamePhase.ACTION, "Bob")
+        assert machine.advance() == "Advancing to Encounter Phase..."
+        assert current() == (GamePhase.ENCOUNTER, "Alice")
+        machine.advance()
+        machine.advance()
+        assert current() == (GamePhase.MYTHOS, "Alice")
+        assert machine.advance().startswith("Starting new round with Alice")
+        assert current() == (GamePhase.ACTION, "Alice")
+        assert state.round_number == 2
+
+    def test_single_player(self):
+        state = new_game(["Alice"])
+        machine = PhaseMachine(state)
+
+        for phase in (GamePhase.ENCOUNTER, GamePhase.MYTHOS, GamePhase.ACTION):
+            machine.advance()
+            assert state.current_phase == phase
+        assert state.round_number == 2
+
+    def test_session_does_not_recurse(self):
+        ui = SessionUI(games=3)
+        engine = GameEngine(ui)
+
+        engine.run()
+
+        assert engine.session == SessionState.QUIT
+        assert len(ui.menu_depths) == 4
+        assert len(set(ui.menu_depths)) == 1
+
+    def test_travel_to_a_missing_location_stays_put(self):
+        state = new_game(["Alice"])
+        player = state.player_manager.get_current_player()
+        investigator = player.investigator
+        start = investigator.current_location
+        location = state.locations[start]
+        location.connections = location.connections + ["Atlantis"]
+        ui = MagicMock()
+        ui.show_travel_menu.return_value = str(len(location.connections))
+        actions = investigator.actions
+
+        drive(ActionPhase(None, state, ui).travel_action(player), ui)
+
+        assert investigator.current_location == start
+        assert investigator.actions == actions
+        ui.show_message.assert_called_with("Atlantis is not on the board.")
@@ -0,0 +1,126 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+from game.entities.base.deck import Deck
+from game.game_state import GameState
+from game.phases.encounter_phase import EncounterPhase
+from game.systems.decisions import DecisionRequest, drive
+from game.systems.profiler import Profiler
+from game.systems.scheduler import GameScheduler
+
+
+class TestProfiler:
+    def test_nested_sections(self):
+        profiler = Profiler()
+        with profiler.section("Encounter"):
+            with profiler.section("SkillTestComponent"):
+                pass
+            with profiler.section("SkillTestComponent"):
+                pass
+
+        outer = profiler.stats["Encounter"]
+        inner = profiler.stats["Encounter;SkillTestComponent"]
+        assert outer.calls == 1
+        assert inner.calls == 2
+        assert outer.total_time >= inner.total_time
+        assert abs(outer.self_time - (outer.total_time - inner.total_time)) < 1e-9
+
+    def test_decision_wait_is_not_timed(self):
+        profiler = Profiler()
+
+        def turn():
+            answer = yield DecisionRequest("ask_yes_no", ("Rest?",))
+            with profiler.section("Rest"):
+                pass
+            return answer
+
+        def slow_answer(question):
+            time.sleep(0.05)
+            return True
+
+        ui = MagicMock(ask_yes_no=slow_answer)
+        assert drive(profiler.timed("Action", turn()), ui) is True
+
+        action = profiler.stats["Action"]
+        assert action.calls == 1
+        assert action.total_time < 0.05
+        assert profiler.stats["Action;Rest"].calls == 1
+
+    def test_instrument_deck(self):
+        profiler = Profiler()
+        deck = Deck(list(range(5)))
+        profiler.instrument_deck(deck, "test")
+
+        card = deck.draw()
+        deck.discard(card)
+
+        assert profiler.stats["deck:test.draw"].calls == 1
+        assert profiler.stats["deck:test.discard"].calls == 1
+
+    def test_dumps(self, tmp_path):
+        profiler = Profiler()
+        with profiler.section("Action"):
+            sum(range(1000))
+
+        json_path = tmp_path / "profile.json"
+        profiler.dump_json(str(json_path))
+        assert json.loads(json_path.read_text())["Action"]["calls"] == 1
+
+        collapsed = profiler.to_collapsed().strip().split(" ")
+        assert collapsed[0] == "Action"
+        assert int(collapsed[1]) >= 0
+
+    def test_encounter_components_are_timed(self):
+        state = GameState()
+        state.reset_game()
+        state.spawn_clue = MagicMock()
+        engine = MagicMock(profiler=Profiler())
+        ui = MagicMock()
+        phase = EncounterPhase(engine, state, ui)
+        investigator = MagicMock(current_location="London")
+        investigator.perform_skill_test.return_value = (True, [6])
+        entry, _ = state.encounter_registry.lookup("General")
+
+        drive(phase.resolve_deck_encounter(entry, investigator), ui)
+
+        paths = engine.profiler.stats.keys()
+        assert "encounter:General" in paths
+        assert "encounter:General;NarrativeComponent" in paths
+
+    def test_interleaved_games_nest_separately(self):
+        profiler = Profiler()
+
+        def turn(game):
+            for _ in range(2):
+                yield DecisionRequest("ask_yes_no", (game,))
+                with profiler.section(f"{game} step"):
+                    pass
+
+        games = [profiler.timed(phase, turn(phase)) for phase in ("Action", "Mythos")]
+        scheduler = GameScheduler(lambda batch: [True] * len(batch))
+        for game in games:
+            scheduler.add(game)
+        scheduler.run()
+
+        assert not scheduler.errors
+        assert sorted(profiler.stats) == [
+            "Action",
+            "Action;Action step",
+            "Mythos",
+            "Mythos;Mythos step",
+        ]
+        assert profiler.stats["Action;Action step"].calls == 2
+
+    def test_replaced_decks_are_instrumented(self):
+        profiler = Profiler()
+        state = GameState()
+        state.reset_game()
+        profiler.instrument_state(state)
+
+        state.reset_game()
+        state.condition_deck.draw()
+        state.encounter_decks["general"].draw()
+
+        assert profiler.stats["deck:condition.draw"].calls == 1
+        assert profiler.stats["deck:general.draw"].calls == 1
@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+from game.entities.cards.monster import Monster
+from game.entities.player import Player
+from game.game_state import GameState
+from game.systems.save_manager import SAVE_FORMAT_VERSION, SaveManager
+from game.systems.setup_manager import SetupConfig, SetupManager
+
+
+def new_game():
+    state = GameState()
+    config = SetupConfig(
+        num_players=2,
+        ancient_one_id=1,
+        investigator_ids=[1, 2],
+        player_names=["Alice", "Bob"],
+    )
+    SetupManager(state, MagicMock()).initialize_game(config)
+    return state
+
+
+class TestSaveManager:
+    def test_round_trip(self, tmp_path):
+        state = new_game()
+        state.rng.seed(7)
+        investigator = state.players[1].investigator
+        state.move_investigator(investigator, "Rome")
+        investigator.take_damage(2)
+        investigator.assets.append(state.asset_deck.draw())
+        state.encounter_decks["general"].discard(
+            state.encounter_decks["general"].draw()
+        )
+        state.spawn_clue()
+        state.defeat_investigator(investigator)
+        state.player_manager.advance_turn()
+        state.doom_track -= 3
+        state.round_number = 4
+
+        path = str(tmp_path / "game.sav")
+        assert SaveManager(state).save(path)
+
+        loaded = GameState()
+        assert SaveManager(loaded).load(path)
+
+        assert SaveManager(loaded).to_dict() == SaveManager(state).to_dict()
+        assert loaded.player_manager.get_current_player().name == "Bob"
+        assert loaded.players[1].investigator.current_location == "Rome"
+        assert loaded.encounter_availability.defeated_at("Rome") == [
+            loaded.players[1].investigator
+        ]
+        assert loaded.rng.random() == state.rng.random()
+
+    def test_monsters_and_players_without_investigators(self):
+        state = new_game()
+        state.locations["Tokyo"].add_monster(Monster())
+        state.locations["Tokyo"].add_monster(Monster())
+        state.player_manager.players.append(Player(3, "Carol"))
+
+        loaded = GameState()
+        assert SaveManager(loaded).loads(SaveManager(state).dumps())
+
+        assert len(loaded.locations["Tokyo"].monsters) == 2
+        carol = loaded.player_manager.players[2]
+        assert (carol.name, carol.investigator) == ("Carol", None)
+        assert SaveManager(loaded).to_dict() == SaveManager(state).to_dict()
+
+    def test_save_is_compact(self):
+        assert len(SaveManager(new_game()).dumps()) < 8 * 1024
+
+    def test_unsupported_version(self):
+        data = SaveManager(new_game()).to_dict()
+        data["format_version"] = SAVE_FORMAT_VERSION + 1
+
+        assert not SaveManager(GameState()).restore(data)
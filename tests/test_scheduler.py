@@ -0,0 +1,85 @@
+import random
+from unittest.mock import MagicMock
+
+from game.engine import GameEngine
+from game.systems.decisions import DecisionRequest, drive
+from game.systems.phase_machine import SessionState
+from game.systems.scheduler import GameScheduler
+from game.systems.setup_manager import SetupConfig
+from game.ui.null_ui import NullUI
+
+
+def new_engine(seed, players=2):
+    engine = GameEngine(NullUI())
+    engine.state.rng.seed(seed)
+    config = SetupConfig(
+        num_players=players,
+        ancient_one_id=1,
+        investigator_ids=list(range(1, players + 1)),
+        player_names=[f"Player {i}" for i in range(1, players + 1)],
+    )
+    engine.setup_manager.initialize_game(config)
+    return engine
+
+
+def random_policy(seed):
+    rng = random.Random(seed)
+
+    def policy(batch):
+        return [
+            rng.choice(request.options) if request.options else None
+            for _, request in batch
+        ]
+
+    return policy
+
+
+class TestScheduler:
+    def test_games_interleave_and_finish(self):
+        policy_batches = []
+        policy = random_policy(7)
+
+        def recording_policy(batch):
+            policy_batches.append(len(batch))
+            return policy(batch)
+
+        scheduler = GameScheduler(recording_policy)
+        engines = [new_engine(seed) for seed in range(4)]
+        ids = [scheduler.add(engine.play_game()) for engine in engines]
+
+        assert scheduler.running == 4
+        scheduler.run(max_batches=10000)
+
+        assert scheduler.running == 0
+        assert sorted(scheduler.results) == sorted(ids)
+        assert not scheduler.errors
+        assert policy_batches[0] == 4
+        for engine in engines:
+            assert engine.session == SessionState.MAIN_MENU
+
+    def test_failing_game_does_not_stop_others(self):
+        def broken_game():
+            yield DecisionRequest("ask_yes_no", ("Fail?",), [True])
+            raise ValueError("broken")
+
+        scheduler = GameScheduler(random_policy(1))
+        broken_id = scheduler.add(broken_game())
+        engine = new_engine(3)
+        game_id = scheduler.add(engine.play_game())
+
+        scheduler.run(max_batches=10000)
+
+        assert isinstance(scheduler.errors[broken_id], ValueError)
+        assert game_id in scheduler.results
+
+    def test_drive_answers_with_ui(self):
+        def game():
+            first = yield DecisionRequest("show_player_name_entry", (1,))
+            second = yield DecisionRequest("show_player_name_entry", (2,))
+            return first, second
+
+        ui = MagicMock()
+        ui.show_player_name_entry.side_effect = lambda number: f"Player {number}"
+
+        assert drive(game(), ui) == ("Player 1", "Player 2")
+        assert drive(game(), None) == (None, None)
@@ -0,0 +1,137 @@
+import asyncio
+import random
+
+from game.systems.content_catalog import ContentCatalog
+from game.systems.game_server import GameClient, GameServer, ServerSession
+from game.systems.session_store import SessionStore
+
+
+def answer(decision, rng):
+    """Play one game with random choices, then quit."""
+    method = decision["method"]
+    if method == "show_main_menu":
+        return "1" if decision["id"] == 1 else "3"
+    if method == "show_player_count_selection":
+        return 2
+    if method == "show_player_name_entry":
+        return "Tester"
+    if method in ("show_investigator_details", "show_ancient_one_details"):
+        return True
+    if method == "show_action_phase":
+        # Some travel routes lead to locations missing from the board data
+        return rng.choice(["2", "3", "4", "5", "6"])
+    return rng.choice(decision["options"])
+
+
+def play(session, decision, rng, count):
+    """Answer count decisions, returning every message sent."""
+    sent = []
+    for _ in range(count):
+        messages = session.handle(
+            {"type": "answer", "id": decision["id"], "value": answer(decision, rng)}
+        )
+        sent.extend(messages)
+        decision = messages[-1]
+    return sent, decision
+
+
+def without_board(messages):
+    return [m for m in messages if m["type"] not in ("keyframe", "diff")]
+
+
+def new_store(tmp_path, catalog, **kwargs):
+    return SessionStore(
+        str(tmp_path),
+        lambda record: ServerSession.from_record(record, catalog),
+        **kwargs,
+    )
+
+
+class TestSessionStore:
+    def test_evicted_session_resumes_at_the_same_decision(self, tmp_path):
+        catalog = ContentCatalog()
+        store = new_store(tmp_path, catalog)
+        evicted = ServerSession(1, catalog, seed=5)
+        twin = ServerSession(2, catalog, seed=5)
+        evicted_rng, twin_rng = random.Random(3), random.Random(3)
+        evicted_decision = evicted.start()[-1]
+        twin_decision = twin.start()[-1]
+
+        _, evicted_decision = play(evicted, evicted_decision, evicted_rng, 40)
+        _, twin_decision = play(twin, twin_decision, twin_rng, 40)
+
+        store.add(1, evicted)
+        assert store.evict(1)
+        restored = store.get(1)
+        assert restored is not evicted
+        assert restored.decision_message() == evicted_decision
+
+        restored_messages, _ = play(restored, evicted_decision, evicted_rng, 40)
+        twin_messages, _ = play(twin, twin_decision, twin_rng, 40)
+        # The restored session starts its board updates from a new keyframe
+        assert without_board(restored_messages) == without_board(twin_messages)
+        assert restored.broadcaster.view() == twin.broadcaster.view()
+        assert store.stats.evictions == 1
+        assert store.stats.restores == 1
+
+    def test_least_recently_used_sessions_are_evicted(self, tmp_path):
+        catalog = ContentCatalog()
+        store = new_store(tmp_path, catalog, max_resident=2)
+        for session_id in (1, 2, 3):
+            session = ServerSession(session_id, catalog)
+            session.start()
+            store.add(session_id, session)
+
+        assert list(store.resident) == [2, 3]
+        assert store.evicted == {1}
+
+        store.get(1)
+        assert list(store.resident) == [3, 1]
+        assert store.evicted == {2}
+        assert store.stats.evictions == 2
+        assert store.stats.restores == 1
+        assert len(store) == 3
+
+        store.remove(2)
+        assert len(store) == 2
+        assert not list(tmp_path.iterdir())
+
+    def test_idle_sessions_are_evicted(self, tmp_path):
+        now = [0.0]
+        catalog = ContentCatalog()
+        store = new_store(tmp_path, catalog, idle_seconds=10, clock=lambda: now[0])
+        for session_id in (1, 2):
+            session = ServerSession(session_id, catalog)
+            session.start()
+            store.add(session_id, session)
+            now[0] += 6
+
+        assert store.evict_idle() == 1
+        assert store.evicted == {1}
+
+    def test_server_rehydrates_sessions(self, tmp_path):
+        async def run():
+            server = GameServer(session_dir=str(tmp_path), max_resident=1)
+            port = await server.start()
+            rngs = [random.Random(seed) for seed in range(3)]
+            clients = [
+                GameClient(lambda decision, rng=rng: answer(decision, rng))
+                for rng in rngs
+            ]
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        *(client.play("127.0.0.1", port) for client in clients)
+                    ),
+                    timeout=60,
+                )
+            finally:
+                await server.stop()
+            return server, clients
+
+        server, clients = asyncio.run(run())
+
+        assert server.sessions.stats.restores > 0
+        for client in clients:
+            types = [message["type"] for message in client.received]
+            assert "error" not in types
@@ -0,0 +1,139 @@
+import copy
+import json
+from unittest.mock import MagicMock
+
+from game.game_state import GameState
+from game.systems.content_catalog import ContentCatalog
+from game.systems.game_server import ServerSession
+from game.systems.setup_manager import SetupConfig, SetupManager
+from game.systems.state_broadcaster import INVESTIGATOR_STATS, StateBroadcaster
+
+SECTIONS = ("state", "investigators", "locations", "decks")
+
+
+def new_game():
+    state = GameState()
+    config = SetupConfig(
+        num_players=2,
+        ancient_one_id=1,
+        investigator_ids=[1, 2],
+        player_names=["Alice", "Bob"],
+    )
+    SetupManager(state, MagicMock()).initialize_game(config)
+    return state
+
+
+def apply(board, message):
+    """Update a client's copy of the board with a broadcast message."""
+    if message["type"] == "keyframe":
+        return copy.deepcopy(
+            {section: message[section] for section in SECTIONS}
+        )
+    board["state"].update(message.get("state", {}))
+    board["decks"].update(message.get("decks", {}))
+    for name, changes in message.get("locations", {}).items():
+        board["locations"][name].update(changes)
+    for player_id, changes in message.get("investigators", {}).items():
+        investigator = board["investigators"][player_id]
+        for field, value in changes.items():
+            if field in INVESTIGATOR_STATS:
+                investigator[field] += value
+            else:
+                investigator[field] = value
+    return board
+
+
+class TestStateBroadcaster:
+    def test_diffs_hold_only_changes(self):
+        state = new_game()
+        broadcaster = StateBroadcaster()
+        broadcaster.attach(state)
+        subscriber = broadcaster.subscribe()
+        [keyframe] = subscriber.poll()
+        assert keyframe["type"] == "keyframe"
+
+        investigator = state.player_manager.players[0].investigator
+        investigator.health -= 2
+        state.move_investigator(investigator, "Rome")
+        state.locations["Tokyo"].add_clue()
+        state.doom_track -= 1
+        state.asset_deck.draw()
+
+        diff = broadcaster.flush()
+        assert diff == {
+            "type": "diff",
+            "seq": keyframe["seq"] + 1,
+            "state": {"doom": state.doom_track},
+            "investigators": {"1": {"health": -2, "current_location": "Rome"}},
+            "locations": {"Tokyo": {"clue": True}},
+            "decks": {"asset": len(state.asset_deck.cards)},
+        }
+        assert subscriber.poll() == [diff]
+        assert broadcaster.flush() is None
+
+    def test_client_board_follows_the_game(self):
+        state = new_game()
+        broadcaster = StateBroadcaster(keyframe_interval=3)
+        broadcaster.attach(state)
+        subscriber = broadcaster.subscribe()
+        board = None
+
+        for round_number in range(6):
+            for player in state.player_manager.players:
+                player.investigator.sanity -= 1
+                player.investigator.clue_tokens += round_number
+            state.spawn_clue()
+            state.encounter_decks["general"].draw()
+            broadcaster.flush()
+            for message in subscriber.poll():
+                json.dumps(message)
+                board = apply(board, message)
+
+        assert board == broadcaster.view()
+
+    def test_sequence_numbers_increase_across_keyframes(self):
+        state = new_game()
+        broadcaster = StateBroadcaster(keyframe_interval=3)
+        broadcaster.attach(state)
+        subscriber = broadcaster.subscribe()
+        subscriber.poll()
+
+        for _ in range(7):
+            state.doom_track -= 1
+            broadcaster.flush()
+
+        messages = subscriber.poll()
+        assert [message["seq"] for message in messages] == list(range(1, 8))
+        assert [message["type"] for message in messages] == (
+            ["diff", "diff", "keyframe"] * 2 + ["diff"]
+        )
+
+    def test_subscriber_that_falls_behind_gets_a_keyframe(self):
+        state = new_game()
+        broadcaster = StateBroadcaster()
+        broadcaster.attach(state)
+        subscriber = broadcaster.subscribe(max_backlog=2)
+        subscriber.poll()
+
+        for _ in range(3):
+            state.doom_track -= 1
+            broadcaster.flush()
+
+        [message] = subscriber.poll()
+        assert message["type"] == "keyframe"
+        assert message["seq"] == broadcaster.seq
+        assert message["state"]["doom"] == state.doom_track
+
+    def test_sessions_send_board_updates(self):
+        session = ServerSession(1, ContentCatalog(), seed=1)
+        session.start()
+        answers = ["1", 1, "Tester", 1, True, 1, True]
+        messages = []
+        for value in answers:
+            messages = session.handle(
+                {"type": "answer", "id": session.decision_id, "value": value}
+            )
+
+        types = [message["type"] for message in messages]
+        assert "keyframe" in types
+        assert types[-1] == "decision"
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+from game.game_state import GameState
+from game.systems.setup_manager import SetupConfig, SetupManager
+from game.systems.state_observer import StateObserver
+
+
+def new_game():
+    state = GameState()
+    config = SetupConfig(
+        num_players=2,
+        ancient_one_id=1,
+        investigator_ids=[1, 2],
+        player_names=["Alice", "Bob"],
+    )
+    SetupManager(state, MagicMock()).initialize_game(config)
+    return state
+
+
+def new_observer():
+    return StateObserver(*(MagicMock() for _ in range(5)))
+
+
+class TestStateObserver:
+    def test_observes_the_whole_state(self):
+        state = new_game()
+        observer = new_observer()
+        observer.attach(state)
+
+        alice = state.player_manager.players[0]
+        alice.investigator.health -= 1
+        observer.investigator_changed.assert_called_with(alice.investigator, "health")
+        assert observer.player_id(alice.investigator) == alice.player_id
+
+        deck = state.asset_deck
+        deck.draw()
+        assert observer.deck_changed.called
+        assert observer.decks[observer.deck_key(deck)] is deck
+
+    def test_detaches_from_replaced_objects(self):
+        state = new_game()
+        observer = new_observer()
+        observer.attach(state)
+        old_locations = state.locations
+        old_deck = state.asset_deck
+
+        state.locations = {name: MagicMock() for name in old_locations}
+        state.asset_deck = MagicMock()
+        observer.detach()
+
+        assert all(not location._observers for location in old_locations.values())
+        assert not old_deck._observers
+        assert not state._observers
+        assert observer.observed == []
@@ -0,0 +1,142 @@
+"""
+Generate expected outcome statistics for every encounter card.
+
+Each card in game/data/encounters/*.json is resolved many times against a
+fresh investigator for each skill profile, without any UI; decisions such
+as asset choices get random legal answers from a seeded policy. The average
+change to health, sanity, clues, assets and conditions is written to
+game/data/encounter_stats.json, which ships with the content and is read
+by game.systems.encounter_stats.EncounterStatsTable.
+
+Run from the repository root:
+
+    python tools/encounter_stats.py --trials 2000 --seed 1
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import json_backend
+from game.game_state import GameState
+from game.entities.investigator import Investigator
+from game.phases.encounter_phase import EncounterPhase
+from game.systems.decisions import drive
+from game.systems.encounter_stats import STATS_FILE, STAT_FIELDS
+from game.ui.null_ui import NullUI, random_policy
+
+FORMAT_VERSION = 1
+SKILLS = ("lore", "influence", "observation", "strength", "will")
+
+# Investigator skill profiles, from the weakest to the strongest
+PROFILES = {
+    "weak": {skill: 1 for skill in SKILLS},
+    "average": {skill: 3 for skill in SKILLS},
+    "strong": {skill: 5 for skill in SKILLS},
+}
+
+
+def encounter_types():
+    """Get the encounter types that have a data file."""
+    return sorted(
+        os.path.splitext(os.path.basename(path))[0]
+        for path in glob.glob("game/data/encounters/*.json")
+    )
+
+
+def snapshot(investigator):
+    return {
+        "health": investigator.health,
+        "sanity": investigator.sanity,
+        "clues": investigator.clue_tokens,
+        "assets": len(investigator.assets),
+        "conditions": len(investigator.conditions),
+    }
+
+
+def run_trials(state, phase, encounter, skills, trials, ui):
+    """Resolve an encounter repeatedly and average the stat changes."""
+    totals = dict.fromkeys(STAT_FIELDS, 0)
+
+    for _ in range(trials):
+        # Fresh decks so drawn conditions and assets don't run out
+        state._setup_asset_deck()
+        state._setup_condition_deck()
+
+        investigator = Investigator(
+            name="Simulated Investigator",
+            health=5,
+            max_health=10,
+            sanity=5,
+            max_sanity=10,
+            skills=dict(skills),
+        )
+        before = snapshot(investigator)
+        drive(phase.resolve_encounter(encounter, investigator), ui)
+        after = snapshot(investigator)
+
+        for stat in STAT_FIELDS:
+            totals[stat] += after[stat] - before[stat]
+
+    return {stat: round(total / trials, 4) for stat, total in totals.items()}
+
+
+def build_table(trials, seed=None):
+    state = GameState()
+    if seed is not None:
+        state.rng.seed(seed)
+    state.reset_game()
+    phase = EncounterPhase(None, state, NullUI())
+    # Decisions are answered at random, from their own seeded source
+    ui = NullUI(random_policy(random.Random(seed)))
+
+    table = {
+        "format_version": FORMAT_VERSION,
+        "trials": trials,
+        "profiles": PROFILES,
+        "encounters": {},
+    }
+
+    for encounter_type in encounter_types():
+        cards = {}
+        for encounter in state.encounter_factory.get_all_encounters_by_type(
+            encounter_type
+        ):
+            print(f"Simulating {encounter_type} encounter {encounter.id}...")
+            subtype = encounter.location_type.value
+            cards[str(encounter.id)] = {
+                "text": encounter.text,
+                "subtype": None if subtype == "none" else subtype,
+                "profiles": {
+                    name: run_trials(state, phase, encounter, skills, trials, ui)
+                    for name, skills in PROFILES.items()
+                },
+            }
+        if cards:
+            table["encounters"][encounter_type] = cards
+
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trials", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=STATS_FILE)
+    args = parser.parse_args()
+
+    table = build_table(args.trials, args.seed)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json_backend.dump(table, f)
+
+    print(f"\nEncounter statistics saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Host many games over a JSON lines TCP protocol.
+
+Every connection plays its own game; all games share one content catalog.
+See game/systems/game_server.py for the protocol.
+
+Run from the repository root:
+
+    python tools/game_server.py --port 7777
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.systems.game_server import GameServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--max-sessions", type=int, default=1000)
+    parser.add_argument(
+        "--max-resident", type=int, default=100, help="sessions kept in memory"
+    )
+    parser.add_argument(
+        "--idle-seconds",
+        type=float,
+        help="write sessions idle this long to disk (default: never)",
+    )
+    parser.add_argument(
+        "--session-dir",
+        help="directory for sessions written to disk (default: a temporary one)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = GameServer(
+        host=args.host,
+        port=args.port,
+        max_sessions=args.max_sessions,
+        session_dir=args.session_dir,
+        max_resident=args.max_resident,
+        idle_seconds=args.idle_seconds,
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+
+
+if __name__ == "__main__":
+    main()